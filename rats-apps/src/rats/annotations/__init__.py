@@ -4,6 +4,8 @@ General purpose library to attach annotations to functions.
 Annotations are typically, but not exclusively, attached using decorators.
 """
 
+from ._discovery import DiscoveredAnnotation, DiscoveredAnnotations, discover
+from ._disk_cache import flush_disk_cache
 from ._functions import (
     AnnotationsContainer,
     DecoratorType,
@@ -12,14 +14,22 @@ from ._functions import (
     annotation,
     get_annotations,
     get_class_annotations,
+    invalidate_class_annotations,
+    register_class,
 )
 
 __all__ = [
     "AnnotationsContainer",
     "DecoratorType",
+    "DiscoveredAnnotation",
+    "DiscoveredAnnotations",
     "GroupAnnotations",
     "T_GroupType",
     "annotation",
+    "discover",
+    "flush_disk_cache",
     "get_annotations",
     "get_class_annotations",
+    "invalidate_class_annotations",
+    "register_class",
 ]
@@ -0,0 +1,239 @@
+import ast
+import importlib
+import importlib.util
+import logging
+import threading
+from collections.abc import Collection, Iterator
+from pathlib import Path
+from types import ModuleType
+from typing import Any, NamedTuple, final
+
+from ._functions import AnnotationsBuilder, GroupAnnotations, get_class_annotations
+
+logger = logging.getLogger(__name__)
+
+# decorators that never attach annotations, so modules only using them are not imported
+_PLAIN_DECORATORS = frozenset([
+    "abstractmethod",
+    "cache",
+    "cached_property",
+    "classmethod",
+    "contextmanager",
+    "dataclass",
+    "final",
+    "lru_cache",
+    "overload",
+    "override",
+    "property",
+    "runtime_checkable",
+    "setter",
+    "staticmethod",
+    "wraps",
+])
+
+
+class DiscoveredAnnotation(NamedTuple):
+    """An annotated function, class, or class method, found by [rats.annotations.discover][]."""
+
+    module: str
+    """The name of the module defining the annotated object."""
+    qualname: str
+    """The qualified name of the object within its module, like `ExampleClass.example_method`."""
+    annotations: GroupAnnotations[Any]
+    """The groups the object is annotated with, within the discovered namespace."""
+
+
+@final
+class DiscoveredAnnotations:
+    """The annotations found in a package, indexed by group id."""
+
+    namespace: str
+    """The namespace the annotations were discovered in."""
+    annotations: tuple[DiscoveredAnnotation, ...]
+    """Every annotated object, in the order the modules and their objects were found."""
+    _groups: dict[Any, tuple[DiscoveredAnnotation, ...]]
+
+    def __init__(self, namespace: str, annotations: tuple[DiscoveredAnnotation, ...]) -> None:
+        self.namespace = namespace
+        self.annotations = annotations
+        groups: dict[Any, list[DiscoveredAnnotation]] = {}
+        for annotation in annotations:
+            for group_id in annotation.annotations.groups:
+                groups.setdefault(group_id, []).append(annotation)
+
+        self._groups = {group_id: tuple(found) for group_id, found in groups.items()}
+
+    def group_ids(self) -> tuple[Any, ...]:
+        """The distinct group ids found in the namespace."""
+        return tuple(self._groups.keys())
+
+    def with_group(self, group_id: NamedTuple) -> tuple[DiscoveredAnnotation, ...]:
+        """The objects annotated with the given group id."""
+        return self._groups.get(group_id, ())
+
+
+def discover(
+    package: str,
+    namespace: str,
+    decorators: Collection[str] | None = None,
+) -> DiscoveredAnnotations:
+    """
+    Find the functions, classes, and class methods annotated within a namespace in a package.
+
+    The source of every module in the package is parsed first, and only the modules using
+    decorators are imported, since the annotation values are python objects that can only be found
+    by running the module. Give the names of the decorators attaching annotations within the
+    namespace to also skip the modules only using other decorators. The decorators found in each
+    source file, and the annotations found in each module, are cached for as long as the
+    modification time and size of the source file stay the same, so unchanged modules are not
+    scanned again. Modules named `__main__` are never imported.
+
+    Example:
+        ```python
+        from rats import annotations
+
+        fruits = annotations.discover("example.fruits", "fruits", decorators=["fruit"])
+        for found in fruits.with_group(FruitId("apple", "red")):
+            print(f"{found.module}:{found.qualname}")
+        ```
+
+    Args:
+        package: the name of the package, or single module, to scan.
+        namespace: the annotation namespace to look for.
+        decorators: the names of the decorators that can attach annotations within the namespace,
+            like `apps.service` or `service`; defaults to any decorator not built into python.
+    """
+    names = None if decorators is None else frozenset(d.rpartition(".")[2] for d in decorators)
+    found: list[DiscoveredAnnotation] = []
+    for module_name, path in _iter_package_modules(package):
+        scan = _scan_module(path)
+        if not _uses_decorators(scan, names):
+            logger.debug(f"skipping module without matching decorators: {module_name}")
+            continue
+
+        with _SCANS_LOCK:
+            module_found = scan.found.get(namespace)
+
+        if module_found is None:
+            module = importlib.import_module(module_name)
+            module_found = tuple(_find_module_annotations(module, namespace))
+            with _SCANS_LOCK:
+                scan.found[namespace] = module_found
+
+        found.extend(module_found)
+
+    return DiscoveredAnnotations(namespace, tuple(found))
+
+
+def _iter_package_modules(package: str) -> Iterator[tuple[str, Path]]:
+    spec = importlib.util.find_spec(package)
+    if spec is None:
+        raise ModuleNotFoundError(f"package not found: {package}", name=package)
+
+    if spec.submodule_search_locations is None:
+        if spec.origin is not None and spec.origin.endswith(".py"):
+            yield package, Path(spec.origin)
+        return
+
+    for location in spec.submodule_search_locations:
+        root = Path(location)
+        for path in sorted(root.rglob("*.py")):
+            parts = path.relative_to(root).with_suffix("").parts
+            if parts[-1] == "__init__":
+                parts = parts[:-1]
+            if not all(part.isidentifier() for part in parts) or "__main__" in parts:
+                continue
+
+            yield ".".join([package, *parts]), path
+
+
+class _ModuleScan(NamedTuple):
+    mtime_ns: int
+    size: int
+    decorators: frozenset[str]
+    found: dict[str, tuple[DiscoveredAnnotation, ...]]
+    """The annotations found in the module, by namespace, once it was imported."""
+
+
+_SCANS: dict[Path, _ModuleScan] = {}
+_SCANS_LOCK = threading.Lock()
+
+
+def _scan_module(path: Path) -> _ModuleScan:
+    stat = path.stat()
+    with _SCANS_LOCK:
+        scan = _SCANS.get(path)
+
+    if scan is not None and (scan.mtime_ns, scan.size) == (stat.st_mtime_ns, stat.st_size):
+        return scan
+
+    try:
+        tree = ast.parse(path.read_bytes(), filename=str(path))
+    except SyntaxError:
+        logger.debug(f"skipping module that can not be parsed: {path}", exc_info=True)
+        decorators: frozenset[str] = frozenset()
+    else:
+        decorators = frozenset(
+            _get_decorator_name(decorator)
+            for node in ast.walk(tree)
+            if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef)
+            for decorator in node.decorator_list
+        )
+
+    scan = _ModuleScan(stat.st_mtime_ns, stat.st_size, decorators, {})
+    with _SCANS_LOCK:
+        _SCANS[path] = scan
+
+    return scan
+
+
+def _uses_decorators(scan: _ModuleScan, names: frozenset[str] | None) -> bool:
+    if names is None:
+        return len(scan.decorators - _PLAIN_DECORATORS) > 0
+
+    return len(scan.decorators & names) > 0
+
+
+def _get_decorator_name(decorator: ast.expr) -> str:
+    if isinstance(decorator, ast.Call):
+        decorator = decorator.func
+    if isinstance(decorator, ast.Attribute):
+        return decorator.attr
+    if isinstance(decorator, ast.Name):
+        return decorator.id
+
+    return ""
+
+
+def _find_module_annotations(module: ModuleType, namespace: str) -> Iterator[DiscoveredAnnotation]:
+    for obj in list(vars(module).values()):
+        # objects imported from other modules are found when scanning their own module
+        if getattr(obj, "__module__", None) != module.__name__:
+            continue
+
+        if callable(obj):
+            yield from _find_object_annotations(module.__name__, obj, namespace)
+
+        if isinstance(obj, type):
+            tates = get_class_annotations(obj).with_namespace(namespace)
+            for annotation in tates.annotations:
+                yield DiscoveredAnnotation(
+                    module.__name__,
+                    f"{obj.__qualname__}.{annotation.name}",
+                    annotation,
+                )
+
+
+def _find_object_annotations(
+    module_name: str,
+    obj: Any,
+    namespace: str,
+) -> Iterator[DiscoveredAnnotation]:
+    # read from the object itself, so subclasses of annotated classes are not seen as annotated
+    attributes: dict[str, Any] = getattr(obj, "__dict__", {})
+    builder = attributes.get("__rats_annotations__")
+    if not isinstance(builder, AnnotationsBuilder):
+        return
+
+    for annotation in builder.make(obj.__name__).with_namespace(namespace).annotations:
+        yield DiscoveredAnnotation(module_name, obj.__qualname__, annotation)
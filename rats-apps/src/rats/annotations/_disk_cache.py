@@ -0,0 +1,297 @@
+import atexit
+import hashlib
+import logging
+import os
+import pickle
+import sys
+import sysconfig
+import threading
+from pathlib import Path
+from types import FunctionType, ModuleType
+from typing import Any, NamedTuple
+from weakref import WeakKeyDictionary
+
+logger = logging.getLogger(__name__)
+
+ENABLED_ENV = "RATS_ANNOTATIONS_CACHE"
+DIRECTORY_ENV = "RATS_ANNOTATIONS_CACHE_DIR"
+# bumped when the format of the cached metadata changes
+_FORMAT_VERSION = 3
+_STDLIB = sysconfig.get_paths()["stdlib"]
+
+
+class _SourceStamp(NamedTuple):
+    module: str
+    path: str
+    mtime_ns: int
+    size: int
+
+
+class _CachedClass(NamedTuple):
+    sources: tuple[_SourceStamp, ...]
+    value: Any
+
+
+class _ModuleCache:
+    path: Path
+    classes: dict[str, _CachedClass]
+    dirty: bool
+    # the classes of a module usually share their sources, checked once per loaded module
+    checked: WeakKeyDictionary[ModuleType, dict[tuple[_SourceStamp, ...], bool]]
+
+    def __init__(self, path: Path, classes: dict[str, _CachedClass]) -> None:
+        self.path = path
+        self.classes = classes
+        self.dirty = False
+        self.checked = WeakKeyDictionary()
+
+
+_LOCK = threading.RLock()
+_MODULE_CACHES: dict[Path, _ModuleCache] = {}
+# the cache file of each module, for each cache directory
+_CACHE_PATHS: dict[tuple[str, str, str | None], Path] = {}
+# a loaded module keeps the code it was imported from, so its source file is only checked once
+_MODULE_STAMPS: WeakKeyDictionary[ModuleType, _SourceStamp | None] = WeakKeyDictionary()
+_MODULE_DEPENDENCIES: WeakKeyDictionary[ModuleType, dict[str, ModuleType]] = WeakKeyDictionary()
+
+
+def is_enabled() -> bool:
+    """Check if the on-disk cache was enabled with one of the environment variables."""
+    return bool(os.environ.get(ENABLED_ENV) or os.environ.get(DIRECTORY_ENV))
+
+
+def load_class_metadata(cls: type) -> Any | None:
+    """Get the metadata stored for a class, if the sources of the class are unchanged."""
+    if not is_enabled():
+        return None
+
+    if not _is_cacheable(cls):
+        return None
+
+    module_cache = _get_module_cache(cls)
+    if module_cache is None:
+        return None
+
+    module = sys.modules[cls.__module__]
+    with _LOCK:
+        cached = module_cache.classes.get(cls.__qualname__)
+        if cached is None:
+            return None
+
+        # the sources of a class are found when it is stored, and only checked for changes here
+        checked = module_cache.checked.setdefault(module, {})
+        if cached.sources not in checked:
+            checked[cached.sources] = all(_get_current_stamp(s) == s for s in cached.sources)
+
+        return cached.value if checked[cached.sources] else None
+
+
+def store_class_metadata(cls: type, value: Any) -> None:
+    """Remember the metadata of a class, to be written to disk when the process exits."""
+    if not is_enabled():
+        return
+
+    sources = _get_sources(cls)
+    module_cache = _get_module_cache(cls)
+    if sources is None or module_cache is None:
+        return
+
+    with _LOCK:
+        # equal sources are shared, so they are also written and read back once
+        shared = (c.sources for c in module_cache.classes.values() if c.sources == sources)
+        module_cache.classes[cls.__qualname__] = _CachedClass(next(shared, sources), value)
+        module_cache.dirty = True
+
+
+def flush_disk_cache() -> None:
+    """
+    Write the class annotations collected since the on-disk cache was last written.
+
+    The on-disk cache is disabled by default, and is meant to speed up the start of short-lived
+    processes. Set the `RATS_ANNOTATIONS_CACHE` environment variable to store the annotations of
+    each module in its `__pycache__` directory, or set `RATS_ANNOTATIONS_CACHE_DIR` to store them in
+    the given directory instead. The cached annotations of a class are used until the source file
+    of any class in its mro changes, or the source file of any module, or package, imported by the
+    modules of those classes, like the modules defining the service ids. Only enable the cache if
+    annotation arguments are derived from the source code of those modules alone. Like python
+    bytecode caches, cache files are trusted and must not be writable by other users.
+
+    Called automatically when the process exits.
+    """
+    with _LOCK:
+        dirty = [module_cache for module_cache in _MODULE_CACHES.values() if module_cache.dirty]
+        for module_cache in dirty:
+            payload = {"version": _FORMAT_VERSION, "classes": module_cache.classes}
+            tmp_path = module_cache.path.with_name(f"{module_cache.path.name}.{os.getpid()}.tmp")
+            try:
+                module_cache.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path.write_bytes(pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL))
+                # replaced atomically, so concurrent processes never read partial files
+                tmp_path.replace(module_cache.path)
+            except Exception:
+                logger.debug(
+                    f"failed to write annotations cache: {module_cache.path}", exc_info=True
+                )
+                tmp_path.unlink(missing_ok=True)
+
+            module_cache.dirty = False
+
+
+def _get_module_cache(cls: type) -> _ModuleCache | None:
+    path = _get_cache_path(cls)
+    if path is None:
+        return None
+
+    with _LOCK:
+        if path not in _MODULE_CACHES:
+            _MODULE_CACHES[path] = _ModuleCache(path, _read_cache_file(path))
+
+        return _MODULE_CACHES[path]
+
+
+def _read_cache_file(path: Path) -> dict[str, _CachedClass]:
+    if not path.exists():
+        return {}
+
+    try:
+        payload = pickle.loads(path.read_bytes())
+        if payload["version"] == _FORMAT_VERSION:
+            return dict(payload["classes"])
+    except Exception:
+        logger.debug(f"ignoring unreadable annotations cache: {path}", exc_info=True)
+
+    return {}
+
+
+def _get_cache_path(cls: type) -> Path | None:
+    source = _get_module_file(cls)
+    # python implementations without bytecode caches set the cache tag to None
+    cache_tag = getattr(sys.implementation, "cache_tag", None)
+    if source is None or cache_tag is None:
+        return None
+
+    directory = os.environ.get(DIRECTORY_ENV)
+    key = (cls.__module__, source, directory)
+    with _LOCK:
+        if key in _CACHE_PATHS:
+            return _CACHE_PATHS[key]
+
+    if directory:
+        digest = hashlib.sha256(source.encode()).hexdigest()[:16]
+        path = Path(directory) / f"{cls.__module__}.{digest}.{cache_tag}.rats-annotations.pickle"
+    else:
+        # stored next to the bytecode python caches for the same module
+        source_path = Path(source)
+        path = (
+            source_path.parent
+            / "__pycache__"
+            / f"{source_path.stem}.{cache_tag}.rats-annotations.pickle"
+        )
+
+    with _LOCK:
+        return _CACHE_PATHS.setdefault(key, path)
+
+
+def _is_cacheable(cls: type) -> bool:
+    # classes created within functions, or dynamically, can not be found again by name
+    return "<locals>" not in cls.__qualname__ and _get_module_file(cls) is not None
+
+
+def _get_sources(cls: type) -> tuple[_SourceStamp, ...] | None:
+    if not _is_cacheable(cls):
+        return None
+
+    # the annotations of a class depend on the source of every class in its mro, and annotation
+    # arguments, like service ids, usually come from the modules imported by those classes
+    modules: dict[str, ModuleType] = {}
+    for klass in cls.__mro__:
+        module = sys.modules.get(klass.__module__)
+        if module is None or not isinstance(getattr(module, "__file__", None), str):
+            continue
+
+        modules[module.__name__] = module
+        modules.update(_get_module_dependencies(module))
+
+    stamps: list[_SourceStamp] = []
+    for name in sorted(modules):
+        stamp = _get_module_stamp(modules[name])
+        if stamp is None:
+            return None
+        stamps.append(stamp)
+
+    return tuple(stamps)
+
+
+def _get_module_dependencies(module: ModuleType) -> dict[str, ModuleType]:
+    with _LOCK:
+        if module in _MODULE_DEPENDENCIES:
+            return _MODULE_DEPENDENCIES[module]
+
+    dependencies: dict[str, ModuleType] = {}
+    for value in list(vars(module).values()):
+        dependencies.update((m.__name__, m) for m in _get_dependency_modules(value))
+
+    # the module being imported, which defines the class being stored, may still import more
+    if getattr(module.__spec__, "_initializing", False):
+        return dependencies
+
+    with _LOCK:
+        return _MODULE_DEPENDENCIES.setdefault(module, dependencies)
+
+
+def _get_dependency_modules(value: Any) -> list[ModuleType]:
+    if isinstance(value, ModuleType):
+        modules = [value]
+        if hasattr(value, "__path__"):
+            # packages export the values defined in their submodules
+            prefix = f"{value.__name__}."
+            modules.extend(m for name, m in list(sys.modules.items()) if name.startswith(prefix))
+    elif isinstance(value, type | FunctionType):
+        modules = [sys.modules.get(value.__module__)]
+    else:
+        modules = []
+
+    dependencies: list[ModuleType] = []
+    for module in modules:
+        path = getattr(module, "__file__", None)
+        # the standard library does not define annotation arguments, and only changes on upgrades
+        if module is not None and isinstance(path, str) and not path.startswith(_STDLIB):
+            dependencies.append(module)
+
+    return dependencies
+
+
+def _get_module_file(cls: type) -> str | None:
+    module = sys.modules.get(cls.__module__)
+    source = getattr(module, "__file__", None)
+    return source if isinstance(source, str) else None
+
+
+def _get_current_stamp(stamp: _SourceStamp) -> _SourceStamp | None:
+    module = sys.modules.get(stamp.module)
+    if module is not None and getattr(module, "__file__", None) == stamp.path:
+        return _get_module_stamp(module)
+
+    return _get_source_stamp(stamp.module, stamp.path)
+
+
+def _get_module_stamp(module: ModuleType) -> _SourceStamp | None:
+    with _LOCK:
+        if module in _MODULE_STAMPS:
+            return _MODULE_STAMPS[module]
+
+    stamp = _get_source_stamp(module.__name__, module.__file__ or "")
+    with _LOCK:
+        return _MODULE_STAMPS.setdefault(module, stamp)
+
+
+def _get_source_stamp(module: str, path: str) -> _SourceStamp | None:
+    try:
+        stat = Path(path).stat()
+    except OSError:
+        return None
+
+    return _SourceStamp(module, path, stat.st_mtime_ns, stat.st_size)
+
+
+atexit.register(flush_disk_cache)
@@ -1,10 +1,13 @@
+import threading
 from collections import defaultdict
 from collections.abc import Callable
-from functools import cache
-from typing import Any, Generic, NamedTuple, ParamSpec, TypeVar
+from typing import Any, Generic, NamedTuple, ParamSpec, TypeVar, cast
+from weakref import WeakKeyDictionary, WeakSet
 
 from typing_extensions import NamedTuple as ExtNamedTuple
 
+from ._disk_cache import load_class_metadata, store_class_metadata
+
 T_GroupType = TypeVar("T_GroupType", bound=NamedTuple)
 
 
@@ -18,14 +21,21 @@ class GroupAnnotations(ExtNamedTuple, Generic[T_GroupType]):
     groups: tuple[T_GroupType, ...]
 
 
-class AnnotationsContainer(NamedTuple):
+class _AnnotationsContainerFields(NamedTuple):
+    annotations: tuple[GroupAnnotations[Any], ...]
+
+
+class AnnotationsContainer(_AnnotationsContainerFields):
     """
     Holds metadata about the annotated functions or class methods.
 
     Loosely inspired by: https://peps.python.org/pep-3107/.
+
+    The first query builds an index of the annotations by namespace and group id, and the results
+    of the queries are remembered by the instance, so repeated queries do not scan the annotations.
     """
 
-    annotations: tuple[GroupAnnotations[Any], ...]
+    _index: dict[str, "_NamespaceIndex"]
 
     @staticmethod
     def empty() -> "AnnotationsContainer":
@@ -36,22 +46,62 @@ class AnnotationsContainer(NamedTuple):
         namespace: str,
         group_id: NamedTuple,
     ) -> "AnnotationsContainer":
-        return AnnotationsContainer(
-            annotations=tuple([
-                annotation_group
-                for x in self.with_namespace(namespace)
-                for annotation_group in x
-                if group_id in annotation_group.groups
-            ]),
-        )
+        index = self._get_index().get(namespace)
+        if index is None:
+            return _EMPTY_ANNOTATIONS
+
+        return index.groups.get(group_id, _EMPTY_ANNOTATIONS)
 
     def with_namespace(
         self,
         namespace: str,
     ) -> "AnnotationsContainer":
-        return AnnotationsContainer(
-            annotations=tuple([x for x in self.annotations if x.namespace == namespace]),
+        index = self._get_index().get(namespace)
+        if index is None:
+            return _EMPTY_ANNOTATIONS
+
+        return index.annotations
+
+    def __getstate__(self) -> None:
+        # the index is rebuilt when needed, instead of being pickled with the annotations
+        return None
+
+    def _get_index(self) -> dict[str, "_NamespaceIndex"]:
+        try:
+            return self._index
+        except AttributeError:
+            pass
+
+        by_namespace: dict[str, list[GroupAnnotations[Any]]] = defaultdict(list)
+        by_group: dict[str, dict[Any, list[GroupAnnotations[Any]]]] = defaultdict(
+            lambda: defaultdict(list)
         )
+        for annotation_group in self.annotations:
+            by_namespace[annotation_group.namespace].append(annotation_group)
+            # an annotation is only listed once per group, like the groups of its builder
+            for group_id in dict.fromkeys(annotation_group.groups):
+                by_group[annotation_group.namespace][group_id].append(annotation_group)
+
+        # concurrent queries might both build the index, which is harmless since they are equal
+        self._index = {
+            namespace: _NamespaceIndex(
+                annotations=AnnotationsContainer(annotations=tuple(tates)),
+                groups={
+                    group_id: AnnotationsContainer(annotations=tuple(group_tates))
+                    for group_id, group_tates in by_group[namespace].items()
+                },
+            )
+            for namespace, tates in by_namespace.items()
+        }
+        return self._index
+
+
+class _NamespaceIndex(NamedTuple):
+    annotations: AnnotationsContainer
+    groups: dict[Any, AnnotationsContainer]
+
+
+_EMPTY_ANNOTATIONS = AnnotationsContainer(annotations=())
 
 
 class AnnotationsBuilder:
@@ -97,24 +147,110 @@ def annotation(
     return decorator
 
 
-@cache
+def register_class(cls: type) -> None:
+    """
+    Collect the annotations of a class once, when the class is defined.
+
+    Meant to be called from `__init_subclass__`, like [rats.apps.Container][] and
+    [rats.cli.Container][] do, making [rats.annotations.get_class_annotations][] a simple attribute
+    read for the registered class. Methods added to the class after it was registered, for example
+    by class decorators, are not seen until [rats.annotations.invalidate_class_annotations][] is
+    called.
+    """
+    cls.__rats_class_annotations__ = _load_class_annotations(cls)
+    _REGISTERED_CLASSES.add(cls)
+
+
 def get_class_annotations(cls: type) -> AnnotationsContainer:
     """
     Get all annotations for a class.
 
-    Traverses the class methods looking for any annotated with "__rats_annotations__" and returns
-    an instance of AnnotationsContainer. This function tries to cache the results to avoid any
-    expensive parsing of the class methods.
+    Looks for the class methods annotated with "__rats_annotations__" and returns an instance of
+    AnnotationsContainer. The annotations of classes passed to
+    [rats.annotations.register_class][] are collected when the class is defined. The results for
+    any other class are cached the first time they are requested, without keeping the class alive,
+    and only for a limited number of classes.
     """
-    tates: list[GroupAnnotations[Any]] = []
+    # looked up in the class namespace, so unregistered subclasses do not see their parent's result
+    registered: AnnotationsContainer | None = cls.__dict__.get("__rats_class_annotations__")
+    if registered is not None:
+        return registered
+
+    with _UNREGISTERED_CLASSES_LOCK:
+        cached = _UNREGISTERED_CLASSES.get(cls)
+
+    if cached is not None:
+        return cached
+
+    tates = _load_class_annotations(cls)
+    with _UNREGISTERED_CLASSES_LOCK:
+        _UNREGISTERED_CLASSES[cls] = tates
+        while len(_UNREGISTERED_CLASSES) > _MAX_UNREGISTERED_CLASSES:
+            # evicts the classes in the order they were first cached
+            del _UNREGISTERED_CLASSES[next(iter(_UNREGISTERED_CLASSES))]
+
+    return tates
+
+
+def invalidate_class_annotations(cls: type | None = None) -> None:
+    """
+    Forget the annotations collected for a class, or for every class when none is given.
+
+    Registered classes have their annotations collected again, which is useful after methods are
+    added to a class once it is defined. Other classes are collected again the next time they are
+    requested by [rats.annotations.get_class_annotations][].
 
-    for method_name in dir(cls):
-        method = getattr(cls, method_name)
-        if not hasattr(method, "__rats_annotations__"):
+    Args:
+        cls: the class to invalidate; defaults to all classes.
+    """
+    classes = list(_REGISTERED_CLASSES) if cls is None else [cls]
+    for klass in classes:
+        if klass in _REGISTERED_CLASSES:
+            # skips the on-disk cache, which only knows about the methods found in the source
+            klass.__rats_class_annotations__ = _collect_class_annotations(klass)
+
+    with _UNREGISTERED_CLASSES_LOCK:
+        if cls is None:
+            _UNREGISTERED_CLASSES.clear()
+        else:
+            _UNREGISTERED_CLASSES.pop(cls, None)
+
+
+_REGISTERED_CLASSES: WeakSet[type] = WeakSet()
+_MAX_UNREGISTERED_CLASSES = 4096
+_UNREGISTERED_CLASSES: WeakKeyDictionary[type, AnnotationsContainer] = WeakKeyDictionary()
+_UNREGISTERED_CLASSES_LOCK = threading.Lock()
+
+
+def _load_class_annotations(cls: type) -> AnnotationsContainer:
+    cached = load_class_metadata(cls)
+    if isinstance(cached, AnnotationsContainer):
+        return cached
+
+    tates = _collect_class_annotations(cls)
+    store_class_metadata(cls, tates)
+    return tates
+
+
+def _collect_class_annotations(cls: type) -> AnnotationsContainer:
+    # walks the class namespaces instead of using getattr(), so descriptors are never triggered;
+    # the classes later in the mro are overridden by the ones earlier in the mro, like getattr()
+    members: dict[str, Any] = {}
+    for klass in reversed(cls.__mro__):
+        members.update(vars(klass))
+
+    tates: list[GroupAnnotations[Any]] = []
+    # sorted to keep the order dir() used to give us
+    for name in sorted(members):
+        member: Any = members[name]
+        if isinstance(member, staticmethod | classmethod):
+            member = cast(Any, member).__func__
+
+        builder = getattr(member, "__rats_annotations__", None)
+        if not isinstance(builder, AnnotationsBuilder):
             continue
 
-        builder: AnnotationsBuilder = method.__rats_annotations__
-        tates.extend(builder.make(method_name).annotations)
+        tates.extend(builder.make(name).annotations)
 
     return AnnotationsContainer(annotations=tuple(tates))
 
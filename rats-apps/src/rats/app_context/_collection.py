@@ -139,7 +139,11 @@ def loads(context: str) -> Collection[Any]:
     return Collection[Any](
         items=tuple([
             Context(
-                service_id=apps.ServiceId(*x["service_id"]),
+                # only reuses known ids, so loading many contexts does not grow the registry
+                service_id=apps.intern_service_id(
+                    apps.ServiceId(*x["service_id"]),
+                    register=False,
+                ),
                 values=tuple(x["values"]),
             )
             for x in data.get("items", [])
@@ -31,8 +31,6 @@ class ServiceContainer(apps.Container, Generic[T_ContextType]):
 
     @apps.container()
     def _contexts(self) -> apps.Container:
-        containers: list[apps.Container] = []
-
         def _provider(_service_id: apps.ServiceId[T_ContextType]) -> T_ContextType:
             contexts = self._collection.decoded_values(self._cls, _service_id)
             if len(contexts) > 1:
@@ -42,18 +40,17 @@ class ServiceContainer(apps.Container, Generic[T_ContextType]):
 
             return contexts[0]
 
-        for service_id in self._collection.service_ids():
-            containers.append(
-                apps.StaticContainer(
-                    apps.StaticProvider[T_ContextType](
-                        namespace=apps.ProviderNamespaces.SERVICES,
-                        service_id=service_id,
-                        call=partial(_provider, service_id),
-                    ),
+        return apps.StaticContainer(
+            *[
+                apps.StaticProvider[T_ContextType](
+                    namespace=apps.ProviderNamespaces.SERVICES,
+                    service_id=service_id,
+                    call=partial(_provider, service_id),
                 )
-            )
-
-        return apps.CompositeContainer(*containers)
+                for service_id in self._collection.service_ids()
+            ],
+            memoize=True,
+        )
 
 
 @final
@@ -73,20 +70,17 @@ class GroupContainer(apps.Container, Generic[T_ContextType]):
 
     @apps.container()
     def _contexts(self) -> apps.Container:
-        containers: list[apps.Container] = []
-
         def _group_provider(_service_id: apps.ServiceId[T_ContextType]) -> Iterator[T_ContextType]:
             yield from self._collection.decoded_values(self._cls, _service_id)
 
-        for service_id in self._collection.service_ids():
-            containers.append(
-                apps.StaticContainer(
-                    apps.StaticProvider[T_ContextType](
-                        namespace=apps.ProviderNamespaces.GROUPS,
-                        service_id=service_id,
-                        provider=partial(_group_provider, service_id),  # type: ignore
-                    ),
+        return apps.StaticContainer(
+            *[
+                apps.StaticProvider[T_ContextType](
+                    namespace=apps.ProviderNamespaces.GROUPS,
+                    service_id=service_id,
+                    call=partial(_group_provider, service_id),  # type: ignore
                 )
-            )
-
-        return apps.CompositeContainer(*containers)
+                for service_id in self._collection.service_ids()
+            ],
+            memoize=True,
+        )
@@ -6,13 +6,17 @@ domain.
 """
 
 from ._annotations import (
+    async_group,
+    async_service,
     autoid,
     autoid_factory_service,
     autoid_service,
+    depends_on,
     factory_service,
     fallback_group,
     fallback_service,
     group,
+    resources,
     service,
 )
 from ._app_containers import (
@@ -24,67 +28,143 @@ from ._app_containers import (
     CompositePlugin,
     ContainerPlugin,
     PluginMixin,
+    PluginTiming,
     bundle,
+    plugin_timings,
+)
+from ._caches import (
+    CachedService,
+    CachePolicy,
+    ContainerCacheReport,
+    LruCachePolicy,
+    WeakCachePolicy,
+    approximate_size,
+    cache_report,
+    set_cache_policy,
 )
 from ._composite_container import EMPTY_CONTAINER, CompositeContainer
 from ._container import (
+    AsyncServiceError,
     Container,
     DuplicateServiceError,
     GroupProvider,
     Provider,
     ServiceNotFoundError,
+    compile_container,
     container,
 )
-from ._executables import App, Executable
+from ._dag import DagRuntime
+from ._entry_points import get_entry_points
+from ._executables import App, AsyncExecutable, Executable
 from ._ids import ServiceId, T_ExecutableType, T_ServiceType
+from ._lazy import LazyService, is_realized
 from ._mains import run, run_plugin
 from ._namespaces import ProviderNamespaces
-from ._plugin_container import PythonEntryPointContainer
-from ._runtimes import NullRuntime, Runtime, StandardRuntime
-from ._scoping import autoscope
+from ._plugin_container import PluginManifest, PythonEntryPointContainer
+from ._resources import (
+    MachineCapacity,
+    ResourceHints,
+    ResourceRuntime,
+    detect_capacity,
+    get_rss_mb,
+)
+from ._runtimes import (
+    AsyncRuntime,
+    AsyncStandardRuntime,
+    ExceptionGroupCompat,
+    NullRuntime,
+    Runtime,
+    StandardRuntime,
+    ThreadPoolRuntime,
+)
+from ._scopes import ScopeNotFoundError, ServiceLifetimes, ServiceScope
+from ._scoping import ServiceIdOrigin, autoscope, get_service_id_origin, intern_service_id
+from ._shards import FULL_SHARD, Shard
 from ._static_container import StaticContainer, StaticProvider, static_group, static_service
+from ._warmup import ServiceTiming, warmup
 
 __all__ = [
     "EMPTY_APP_PLUGIN",
     "EMPTY_CONTAINER",
     "EMPTY_PLUGIN",
+    "FULL_SHARD",
     "App",
     "AppBundle",
     "AppContainer",
     "AppPlugin",
+    "AsyncExecutable",
+    "AsyncRuntime",
+    "AsyncServiceError",
+    "AsyncStandardRuntime",
+    "CachePolicy",
+    "CachedService",
     "CompositeContainer",
     "CompositePlugin",
     "Container",
+    "ContainerCacheReport",
     "ContainerPlugin",
+    "DagRuntime",
     "DuplicateServiceError",
+    "ExceptionGroupCompat",
     "Executable",
     "GroupProvider",
+    "LazyService",
+    "LruCachePolicy",
+    "MachineCapacity",
     "NullRuntime",
+    "PluginManifest",
     "PluginMixin",
+    "PluginTiming",
     "Provider",
     "ProviderNamespaces",
     "PythonEntryPointContainer",
+    "ResourceHints",
+    "ResourceRuntime",
     "Runtime",
+    "ScopeNotFoundError",
     "ServiceId",
+    "ServiceIdOrigin",
+    "ServiceLifetimes",
     "ServiceNotFoundError",
+    "ServiceScope",
+    "ServiceTiming",
+    "Shard",
     "StandardRuntime",
     "StaticContainer",
     "StaticProvider",
     "T_ExecutableType",
     "T_ServiceType",
+    "ThreadPoolRuntime",
+    "WeakCachePolicy",
+    "approximate_size",
+    "async_group",
+    "async_service",
     "autoid",
     "autoid_factory_service",
     "autoid_service",
     "autoscope",
     "bundle",
+    "cache_report",
+    "compile_container",
     "container",
+    "depends_on",
+    "detect_capacity",
     "factory_service",
     "fallback_group",
     "fallback_service",
+    "get_entry_points",
+    "get_rss_mb",
+    "get_service_id_origin",
     "group",
+    "intern_service_id",
+    "is_realized",
+    "plugin_timings",
+    "resources",
     "run",
     "run_plugin",
     "service",
+    "set_cache_policy",
     "static_group",
     "static_service",
+    "warmup",
 ]
@@ -1,22 +1,39 @@
-from collections.abc import Callable, Iterator
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
 from typing import Any, Concatenate, Generic, NamedTuple, ParamSpec, TypeVar, cast
 
 from rats import annotations
 
 from ._ids import ServiceId, T_ServiceType
 from ._namespaces import ProviderNamespaces
+from ._resources import RESOURCES_NAMESPACE, ResourceHints
+from ._scopes import LIFETIMES_NAMESPACE, ServiceLifetime, ServiceLifetimes
 from ._scoping import scope_service_name
 
 P = ParamSpec("P")
 R = TypeVar("R")
 T_Container = TypeVar("T_Container")
+DEPENDENCIES_NAMESPACE = "service-dependencies"
 
 
 def service(
     service_id: ServiceId[T_ServiceType],
+    lifetime: str = ServiceLifetimes.SINGLETON,
 ) -> Callable[[Callable[P, T_ServiceType]], Callable[P, T_ServiceType]]:
-    """A service is anything you would create instances of?"""
-    return annotations.annotation(ProviderNamespaces.SERVICES, cast(NamedTuple, service_id))
+    """
+    A service is anything you would create instances of?
+
+    Args:
+        service_id: the id the service is retrieved with.
+        lifetime: one of the [rats.apps.ServiceLifetimes][] values; applies to the decorated
+            method, regardless of how many service ids it provides.
+
+    Raises:
+        ValueError: if the lifetime is not one of the [rats.apps.ServiceLifetimes][] values.
+    """
+    return _with_lifetime(
+        annotations.annotation(ProviderNamespaces.SERVICES, cast(NamedTuple, service_id)),
+        lifetime,
+    )
 
 
 def autoid_service(fn: Callable[P, T_ServiceType]) -> Callable[P, T_ServiceType]:
@@ -26,9 +43,43 @@ def autoid_service(fn: Callable[P, T_ServiceType]) -> Callable[P, T_ServiceType]
 
 def group(
     group_id: ServiceId[T_ServiceType],
+    lifetime: str = ServiceLifetimes.SINGLETON,
 ) -> Callable[[Callable[P, Iterator[T_ServiceType]]], Callable[P, Iterator[T_ServiceType]]]:
-    """A group is a collection of services."""
-    return annotations.annotation(ProviderNamespaces.GROUPS, cast(NamedTuple, group_id))
+    """
+    A group is a collection of services.
+
+    Groups are cached as lists by default. Groups with a transient lifetime are not cached, and
+    their services are streamed to the caller as they are yielded by the provider, which lets
+    large groups be consumed lazily, see [rats.apps.Container.get_group_batches][].
+
+    Args:
+        group_id: the id the service group is retrieved with.
+        lifetime: one of the [rats.apps.ServiceLifetimes][] values; applies to the decorated
+            method, regardless of how many group ids it provides.
+
+    Raises:
+        ValueError: if the lifetime is not one of the [rats.apps.ServiceLifetimes][] values.
+    """
+    return _with_lifetime(
+        annotations.annotation(ProviderNamespaces.GROUPS, cast(NamedTuple, group_id)),
+        lifetime,
+    )
+
+
+def async_service(
+    service_id: ServiceId[T_ServiceType],
+) -> Callable[[Callable[P, Awaitable[T_ServiceType]]], Callable[P, Awaitable[T_ServiceType]]]:
+    """An async service is awaited once, by [rats.apps.Container.aget][], and then cached."""
+    return annotations.annotation(ProviderNamespaces.ASYNC_SERVICES, cast(NamedTuple, service_id))
+
+
+def async_group(
+    group_id: ServiceId[T_ServiceType],
+) -> Callable[
+    [Callable[P, AsyncIterator[T_ServiceType]]], Callable[P, AsyncIterator[T_ServiceType]]
+]:
+    """An async group is consumed by [rats.apps.Container.aget_group][] and then cached."""
+    return annotations.annotation(ProviderNamespaces.ASYNC_GROUPS, cast(NamedTuple, group_id))
 
 
 def fallback_service(
@@ -51,6 +102,84 @@ def fallback_group(
     )
 
 
+def depends_on(
+    *service_ids: ServiceId[Any],
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """
+    Declare the executables that must run before the ones provided by the decorated method.
+
+    Dependencies are used by [rats.apps.DagRuntime][] to run executables in order, and in parallel
+    when they do not depend on each other. Other runtimes ignore them.
+
+    Example:
+        ```python
+        from rats import apps
+
+
+        class ExamplePipeline(apps.Container, apps.PluginMixin):
+            @apps.service(ExampleServices.TRAIN)
+            @apps.depends_on(ExampleServices.DOWNLOAD, ExampleServices.TOKENIZE)
+            def _train(self) -> apps.Executable:
+                return apps.App(lambda: print("training"))
+        ```
+
+    Args:
+        *service_ids: the ids of the executables the decorated method's executables depend on.
+    """
+
+    def _decorator(fn: Callable[P, R]) -> Callable[P, R]:
+        for service_id in service_ids:
+            fn = annotations.annotation(DEPENDENCIES_NAMESPACE, cast(NamedTuple, service_id))(fn)
+        return fn
+
+    return _decorator
+
+
+def resources(
+    cpus: float = 1,
+    memory_mb: int = 0,
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """
+    Declare the resources used by the executables provided by the decorated method.
+
+    Hints are used by [rats.apps.ResourceRuntime][] to run as many executables at once as the
+    machine can hold. For group providers, the hints apply to each executable in the group. Other
+    runtimes ignore them.
+
+    Args:
+        cpus: the number of cores kept busy by each executable.
+        memory_mb: the peak memory allocated by each executable, in megabytes.
+
+    Raises:
+        ValueError: if `cpus` is not positive, or `memory_mb` is negative.
+    """
+    if cpus <= 0:
+        raise ValueError(f"cpus must be positive: {cpus!r}")
+    if memory_mb < 0:
+        raise ValueError(f"memory_mb must not be negative: {memory_mb!r}")
+
+    return annotations.annotation(RESOURCES_NAMESPACE, ResourceHints(cpus, memory_mb))
+
+
+def _with_lifetime(
+    decorator: Callable[[Callable[P, R]], Callable[P, R]],
+    lifetime: str,
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    lifetimes = [ServiceLifetimes.SINGLETON, ServiceLifetimes.TRANSIENT, ServiceLifetimes.SCOPED]
+    if lifetime not in lifetimes:
+        raise ValueError(f"unknown service lifetime, expected one of {lifetimes}: {lifetime!r}")
+
+    if lifetime == ServiceLifetimes.SINGLETON:
+        return decorator
+
+    def _decorator(fn: Callable[P, R]) -> Callable[P, R]:
+        return annotations.annotation(LIFETIMES_NAMESPACE, ServiceLifetime(lifetime))(
+            decorator(fn)
+        )
+
+    return _decorator
+
+
 def _factory_to_factory_provider(
     method: Callable[Concatenate[T_Container, P], R],
 ) -> Callable[[T_Container], Callable[P, R]]:
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
 import logging
+import threading
+import time
 from abc import abstractmethod
-from collections.abc import Callable
-from functools import cache
-from typing import Protocol, final
+from collections.abc import Callable, Iterator
+from typing import NamedTuple, Protocol, cast, final
 
+from ._caches import iter_created_containers
 from ._composite_container import CompositeContainer
-from ._container import Container, container
+from ._container import Container, Provider, container
 from ._executables import Executable
+from ._ids import ServiceId, T_ServiceType
 
 logger = logging.getLogger(__name__)
 EMPTY_CONTEXT = CompositeContainer()
@@ -127,7 +130,114 @@ class CompositePlugin:
         self._plugins = plugins
 
     def __call__(self, app: Container) -> Container:
-        return CompositeContainer(*[plugin(app) for plugin in self._plugins])
+        # each plugin is created the first time a lookup reaches it
+        return CompositeContainer(*[_LazyPluginContainer(plugin, app) for plugin in self._plugins])
+
+
+class PluginTiming(NamedTuple):
+    """The time it took to create a plugin container, see [rats.apps.plugin_timings][]."""
+
+    plugin: str
+    """The qualified name of the plugin, usually the class of the created container."""
+    seconds: float
+    """Wall time spent in the plugin, including the creation of any service it retrieved."""
+
+
+@final
+class _LazyPluginContainer(Container):
+    _plugin: ContainerPlugin
+    _app: Container
+    _lock: threading.RLock
+    _creating: bool
+    _container: Container | None
+    _timing: PluginTiming | None
+
+    def __init__(self, plugin: ContainerPlugin, app: Container) -> None:
+        self._plugin = plugin
+        self._app = app
+        self._lock = threading.RLock()
+        self._creating = False
+        self._container = None
+        self._timing = None
+
+    def get_namespaced_providers(
+        self,
+        namespace: str,
+        group_id: ServiceId[T_ServiceType],
+    ) -> Iterator[Provider[T_ServiceType]]:
+        yield from self.get_container().get_namespaced_providers(namespace, group_id)
+
+    def get_container(self) -> Container:
+        if self._container is None:
+            with self._lock:
+                if self._container is None:
+                    name = _get_plugin_name(self._plugin)
+                    if self._creating:
+                        # re-entered by the same thread, which would otherwise wait on itself
+                        raise RuntimeError(f"plugin used the app while being created: {name}")
+
+                    self._creating = True
+                    start = time.perf_counter()
+                    try:
+                        created = self._plugin(self._app)
+                    finally:
+                        self._creating = False
+                    self._timing = PluginTiming(name, time.perf_counter() - start)
+                    logger.debug(f"created plugin {name} in {self._timing.seconds:.3f}s")
+                    self._container = created
+
+        return self._container
+
+    def get_timing(self) -> PluginTiming | None:
+        return self._timing
+
+    def __rats_apps_subcontainers__(self) -> tuple[Container, ...]:
+        """Used by [rats.apps.compile_container][] to flatten the container tree."""
+        return (self.get_container(),)
+
+    def __rats_apps_created_subcontainers__(self) -> tuple[Container, ...]:
+        """Used by [rats.apps.cache_report][] to walk the tree without creating plugins."""
+        return () if self._container is None else (self._container,)
+
+
+def _get_plugin_name(plugin: object) -> str:
+    # plugins are usually classes or functions, and otherwise named after their type
+    named = plugin if hasattr(plugin, "__qualname__") else type(plugin)
+    return f"{getattr(named, '__module__', '')}:{getattr(named, '__qualname__', '')}"
+
+
+def plugin_timings(app: Container) -> tuple[PluginTiming, ...]:
+    """
+    Report the time spent creating each plugin container in a tree.
+
+    The plugins given to [rats.apps.AppBundle][] and [rats.apps.CompositePlugin][] are only created
+    the first time a service lookup reaches them. Use this function to find the plugins slowing
+    down the start of an application. Plugins that have not been created yet are not reported,
+    and no plugins are created.
+
+    Example:
+        ```python
+        from rats import apps
+
+        app = apps.AppBundle(app_plugin=Application, container_plugin=Plugin)
+        app.execute()
+        for timing in sorted(apps.plugin_timings(app), key=lambda t: t.seconds, reverse=True):
+            print(f"{timing.plugin}: {timing.seconds:.3f}s")
+        ```
+
+    Args:
+        app: the root container of the tree.
+
+    Returns: the timing of each created plugin, in the order they are searched for services.
+    """
+    timings: list[PluginTiming] = []
+    for node in iter_created_containers(app):
+        if isinstance(node, _LazyPluginContainer):
+            timing = node.get_timing()
+            if timing is not None:
+                timings.append(timing)
+
+    return tuple(timings)
 
 
 @final
@@ -139,8 +249,8 @@ class AppBundle(AppContainer):
     combine services with additional [rats.apps.ContainerPlugin][] classes.
     """
 
-    _app_plugin: AppPlugin
-    _container_plugin: ContainerPlugin
+    _app_container: _LazyPluginContainer
+    _plugin_container: _LazyPluginContainer
     _context: Container
 
     def __init__(
@@ -183,22 +293,19 @@ class AppBundle(AppContainer):
             container_plugin: the class reference to an additional plugin container.
             context: an optional plugin container to make part of the container tree.
         """
-        self._app_plugin = app_plugin
-        self._container_plugin = container_plugin
+        # both plugins are created the first time they are needed, see [rats.apps.plugin_timings][]
+        self._app_container = _LazyPluginContainer(app_plugin, self)
+        self._plugin_container = _LazyPluginContainer(container_plugin, self)
         self._context = context
 
     def execute(self) -> None:
         """Initializes a new [rats.apps.AppContainer] with the provided nodes before executing it."""
-        app, _ = self._get_or_create_containers()
+        app = cast(AppContainer, self._app_container.get_container())
         app.execute()
 
     @container()
     def _plugins(self) -> Container:
-        return CompositeContainer(*self._get_or_create_containers(), self._context)
-
-    @cache  # noqa: B019
-    def _get_or_create_containers(self) -> tuple[AppContainer, Container]:
-        return self._app_plugin(self), self._container_plugin(self)
+        return CompositeContainer(self._app_container, self._plugin_container, self._context)
 
 
 class _EmptyAppContainer(AppContainer, PluginMixin):
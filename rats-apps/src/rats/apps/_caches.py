@@ -0,0 +1,394 @@
+import logging
+import sys
+import threading
+import weakref
+from abc import abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator, MutableMapping
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from typing import Any, NamedTuple, Protocol, TypeVar, final
+
+from ._container import Container, iter_container_tree
+from ._ids import ServiceId
+
+logger = logging.getLogger(__name__)
+_PROVIDER_CACHE_ATTR = "__rats_apps_provider_cache__"
+_CONTAINER_CACHE_ATTR = "__rats_apps_container_cache__"
+_CACHE_POLICY_ATTR = "__rats_apps_cache_policy__"
+
+
+class CachePolicy(Protocol):
+    """
+    Creates the caches that hold the services of the containers in a tree.
+
+    Policies are installed with [rats.apps.set_cache_policy][]. A single policy instance is shared
+    by every container in the tree, so limits like the maximum number of entries apply to the
+    tree as a whole.
+    """
+
+    @abstractmethod
+    def create_cache(self, owner: Container) -> MutableMapping[Hashable, Any]:
+        """Create the mapping used to cache the services provided by the given container."""
+
+
+class _LruEntries:
+    """The entries of all the caches created by a single [rats.apps.LruCachePolicy][]."""
+
+    _max_entries: int | None
+    _max_bytes: int | None
+    _entries: OrderedDict[tuple[int, Hashable], tuple[Any, int]]
+    _bytes: int
+    _lock: threading.Lock
+
+    def __init__(self, max_entries: int | None, max_bytes: int | None) -> None:
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[int, Hashable]) -> Any:
+        with self._lock:
+            value, _ = self._entries[key]
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: tuple[int, Hashable], value: Any) -> None:
+        size = 0 if self._max_bytes is None else approximate_size(value)
+        with self._lock:
+            self._pop(key)
+            if self._max_bytes is not None and size > self._max_bytes:
+                # caching it would evict everything else, and still be over the budget
+                logger.debug(f"service too large to be cached: {key[1]}")
+                return
+
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while len(self._entries) > 0 and self._is_over_limit():
+                (_, evicted), (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                logger.debug(f"evicted cached service: {evicted}")
+
+    def delete(self, key: tuple[int, Hashable]) -> None:
+        with self._lock:
+            if not self._pop(key):
+                raise KeyError(key)
+
+    def keys(self, owner_id: int) -> list[Hashable]:
+        with self._lock:
+            return [key for owner, key in self._entries if owner == owner_id]
+
+    def discard_owner(self, owner_id: int) -> None:
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == owner_id]:
+                self._pop(key)
+
+    def _pop(self, key: tuple[int, Hashable]) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+
+        self._bytes -= entry[1]
+        return True
+
+    def _is_over_limit(self) -> bool:
+        return (self._max_entries is not None and len(self._entries) > self._max_entries) or (
+            self._max_bytes is not None and self._bytes > self._max_bytes
+        )
+
+
+@final
+class LruCachePolicy(CachePolicy):
+    """
+    Evicts the least recently used services once the tree holds too many, or too large, services.
+
+    Evicted services are created again by their provider the next time they are needed, so this
+    policy is only safe for services that do not need to be unique for the life of the app.
+
+    ```python
+    from rats import apps
+
+    app = apps.set_cache_policy(
+        apps.AppBundle(app_plugin=Application),
+        apps.LruCachePolicy(max_entries=1000, max_bytes=512 * 1024 * 1024),
+    )
+    ```
+    """
+
+    _entries: _LruEntries
+
+    def __init__(self, max_entries: int | None = None, max_bytes: int | None = None) -> None:
+        """
+        Create a policy with an entry count limit, a memory budget, or both.
+
+        Args:
+            max_entries: the maximum number of services cached across the tree.
+            max_bytes: the approximate memory budget of the services cached across the tree;
+                services larger than the whole budget are never cached.
+        """
+        if max_entries is None and max_bytes is None:
+            raise ValueError("LruCachePolicy needs max_entries, max_bytes, or both")
+
+        self._entries = _LruEntries(max_entries, max_bytes)
+
+    def create_cache(self, owner: Container) -> MutableMapping[Hashable, Any]:
+        owner_id = id(owner)
+        try:
+            # entries of containers that are garbage collected are dropped with them
+            weakref.finalize(owner, self._entries.discard_owner, owner_id)
+        except TypeError:
+            pass
+
+        return _LruCache(self._entries, owner_id)
+
+
+class _LruCache(MutableMapping[Hashable, Any]):
+    _entries: _LruEntries
+    _owner_id: int
+
+    def __init__(self, entries: _LruEntries, owner_id: int) -> None:
+        self._entries = entries
+        self._owner_id = owner_id
+
+    def __getitem__(self, key: Hashable) -> Any:
+        return self._entries.get((self._owner_id, key))
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self._entries.set((self._owner_id, key), value)
+
+    def __delitem__(self, key: Hashable) -> None:
+        self._entries.delete((self._owner_id, key))
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._entries.keys(self._owner_id))
+
+    def __len__(self) -> int:
+        return len(self._entries.keys(self._owner_id))
+
+
+@final
+class WeakCachePolicy(CachePolicy):
+    """
+    Caches services with weak references, so they are released once nothing else uses them.
+
+    Service groups, and services that do not support weak references, like `str` or `list`
+    instances, are kept with strong references.
+    """
+
+    def create_cache(self, owner: Container) -> MutableMapping[Hashable, Any]:
+        return _WeakCache()
+
+
+class _WeakCache(MutableMapping[Hashable, Any]):
+    _refs: dict[Hashable, Callable[[], Any]]
+
+    def __init__(self) -> None:
+        self._refs = {}
+
+    def __getitem__(self, key: Hashable) -> Any:
+        ref = self._refs[key]
+        value = ref()
+        if value is None and isinstance(ref, weakref.ref):
+            raise KeyError(key)
+
+        return value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        try:
+            self._refs[key] = weakref.ref(value, self._remover(key))
+        except TypeError:
+            self._refs[key] = _StrongRef(value)
+
+    def __delitem__(self, key: Hashable) -> None:
+        del self._refs[key]
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter([key for key in list(self._refs) if key in self])
+
+    def __len__(self) -> int:
+        return len(list(iter(self)))
+
+    def _remover(self, key: Hashable) -> Callable[[weakref.ref[Any]], None]:
+        def _remove(ref: weakref.ref[Any]) -> None:
+            # the key might have been given a new service since this reference was created
+            if self._refs.get(key) is ref:
+                self._refs.pop(key, None)
+
+        return _remove
+
+
+class _StrongRef(NamedTuple):
+    value: Any
+
+    def __call__(self) -> Any:
+        return self.value
+
+
+T_Container = TypeVar("T_Container", bound=Container)
+
+
+def set_cache_policy(c: T_Container, policy: CachePolicy) -> T_Container:
+    """
+    Replace the unbounded service caches of every container in a tree with the given policy.
+
+    By default, containers keep every service, and every service group, they create for as long as
+    the container exists. Setting a policy creates every sub-container in the tree right away and
+    moves the services already cached into the caches created by the policy. Plugins loaded later
+    by containers like [rats.apps.PythonEntryPointContainer][] are given the same policy when they
+    are loaded. Sub-containers are always cached with strong references, and are not subject to
+    the policy. The policy is best set when the app is created, before services are retrieved from
+    other threads.
+
+    Example:
+        ```python
+        from rats import apps
+
+        app = apps.set_cache_policy(
+            apps.AppBundle(app_plugin=Application),
+            apps.WeakCachePolicy(),
+        )
+        ```
+
+    Args:
+        c: the root container of the tree.
+        policy: creates the caches of each container in the tree.
+
+    Returns: the same container instance, to allow chaining.
+    """
+    for node in iter_container_tree(c):
+        cache = policy.create_cache(node)
+        cache.update(getattr(node, _PROVIDER_CACHE_ATTR, {}))
+        setattr(node, _PROVIDER_CACHE_ATTR, cache)
+        setattr(node, _CACHE_POLICY_ATTR, policy)
+
+        # containers with their own lookups are not walked, but can report what they created
+        created = getattr(node, "__rats_apps_created_subcontainers__", None)
+        if created is not None:
+            for subcontainer in created():
+                set_cache_policy(subcontainer, policy)
+
+    return c
+
+
+def inherit_cache_policy(parent: Container, child: Container) -> None:
+    """Give a container created by `parent` the cache policy set on `parent`, if any."""
+    policy: CachePolicy | None = getattr(parent, _CACHE_POLICY_ATTR, None)
+    if policy is not None:
+        set_cache_policy(child, policy)
+
+
+class CachedService(NamedTuple):
+    """A service, or service group, held in the cache of a container."""
+
+    service_id: ServiceId[Any]
+    """The id of the cached service or service group."""
+    provider: str
+    """The name of the container method that provided the service."""
+    approximate_bytes: int
+    """The approximate memory held by the service, see [rats.apps.approximate_size][]."""
+
+
+class ContainerCacheReport(NamedTuple):
+    """The services cached by a single container."""
+
+    container: Container
+    services: tuple[CachedService, ...]
+
+    @property
+    def approximate_bytes(self) -> int:
+        """The approximate memory held by all the services cached by the container."""
+        return sum(service.approximate_bytes for service in self.services)
+
+
+def cache_report(c: Container) -> tuple[ContainerCacheReport, ...]:
+    """
+    Report the services cached by each container in a tree, and their approximate memory usage.
+
+    Only containers that have already been created are visited, and no services are created, so
+    the report can be taken from long-lived apps to find the services holding on to memory.
+
+    Example:
+        ```python
+        from rats import apps
+
+        for report in apps.cache_report(app):
+            for service in report.services:
+                print(f"{service.service_id.name}: {service.approximate_bytes} bytes")
+        ```
+
+    Args:
+        c: the root container of the tree.
+
+    Returns: a report for each visited container that has cached services.
+    """
+    reports: list[ContainerCacheReport] = []
+    for node in iter_created_containers(c):
+        cache: MutableMapping[Any, Any] = getattr(node, _PROVIDER_CACHE_ATTR, {})
+        services = tuple(
+            CachedService(provider.group_id, provider.attr, approximate_size(service))
+            for provider, service in list(cache.items())
+        )
+        if len(services) > 0:
+            reports.append(ContainerCacheReport(node, services))
+
+    return tuple(reports)
+
+
+def iter_created_containers(c: Container) -> Iterator[Container]:
+    """Walk the containers of a tree that have already been created, without creating any."""
+    yield c
+
+    # lazy containers only report the sub-containers that have already been created
+    subcontainers = getattr(c, "__rats_apps_created_subcontainers__", None)
+    if subcontainers is None:
+        subcontainers = getattr(c, "__rats_apps_subcontainers__", None)
+    if subcontainers is not None:
+        for subcontainer in subcontainers():
+            yield from iter_created_containers(subcontainer)
+        return
+
+    cached: dict[Any, Container] = getattr(c, _CONTAINER_CACHE_ATTR, {})
+    for subcontainer in list(cached.values()):
+        yield from iter_created_containers(subcontainer)
+
+
+_SHARED_TYPES = (type, ModuleType, FunctionType, MethodType, BuiltinFunctionType)
+
+
+def approximate_size(obj: Any, max_objects: int = 100_000) -> int:
+    """
+    Approximate the memory held by an object and the objects it references, in bytes.
+
+    Sums [sys.getsizeof][] over the object, the items of builtin collections, and instance
+    attributes, counting each object once. Containers referenced by the object, along with
+    classes, modules, and functions, are considered shared and are not counted.
+
+    Args:
+        obj: the object to measure.
+        max_objects: stop after visiting this many objects, to bound the cost of large graphs.
+    """
+    seen: set[int] = set()
+    pending: list[Any] = [obj]
+    total = 0
+    while len(pending) > 0 and len(seen) < max_objects:
+        current = pending.pop()
+        if id(current) in seen or isinstance(current, _SHARED_TYPES):
+            continue
+        if current is not obj and Container in type(current).__mro__:
+            continue
+
+        seen.add(id(current))
+        total += sys.getsizeof(current, 0)
+
+        if isinstance(current, dict):
+            pending.extend(current.keys())  # type: ignore[reportUnknownArgumentType]
+            pending.extend(current.values())  # type: ignore[reportUnknownArgumentType]
+        elif isinstance(current, list | tuple | set | frozenset):
+            pending.extend(current)  # type: ignore[reportUnknownArgumentType]
+
+        try:
+            pending.append(vars(current))
+        except TypeError:
+            pass
+
+    return total
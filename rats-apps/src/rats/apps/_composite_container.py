@@ -1,7 +1,7 @@
 from collections.abc import Iterator
 from typing import final
 
-from ._container import Container
+from ._container import Container, Provider
 from ._ids import ServiceId, T_ServiceType
 
 
@@ -12,13 +12,17 @@ class CompositeContainer(Container):
     def __init__(self, *containers: Container) -> None:
         self._containers = containers
 
-    def get_namespaced_group(
+    def get_namespaced_providers(
         self,
         namespace: str,
         group_id: ServiceId[T_ServiceType],
-    ) -> Iterator[T_ServiceType]:
+    ) -> Iterator[Provider[T_ServiceType]]:
         for container in self._containers:
-            yield from container.get_namespaced_group(namespace, group_id)
+            yield from container.get_namespaced_providers(namespace, group_id)
+
+    def __rats_apps_subcontainers__(self) -> tuple[Container, ...]:
+        """Used by [rats.apps.compile_container][] to flatten the container tree."""
+        return self._containers
 
 
 EMPTY_CONTAINER = CompositeContainer()
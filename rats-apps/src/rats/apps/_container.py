@@ -1,14 +1,28 @@
+import asyncio
 import logging
+import threading
 from abc import abstractmethod
-from collections.abc import Callable, Iterator
-from typing import Any, Generic, NamedTuple, ParamSpec, Protocol, cast
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    MutableMapping,
+)
+from contextvars import ContextVar
+from functools import partial
+from itertools import islice
+from typing import Any, Generic, NamedTuple, ParamSpec, Protocol, TypeVar, cast
 
 from typing_extensions import NamedTuple as ExtNamedTuple
 
 from rats import annotations
 
 from ._ids import ServiceId, T_ServiceType, Tco_ServiceType
+from ._lazy import LazyService
 from ._namespaces import ProviderNamespaces
+from ._scopes import LIFETIMES_NAMESPACE, ServiceLifetimes, get_current_scope
 
 logger = logging.getLogger(__name__)
 
@@ -58,10 +72,17 @@ class Container(Protocol):
             storage_client.save("Hello, world!")
     """
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Collect the annotated providers of each container class when the class is defined."""
+        super().__init_subclass__(**kwargs)
+        annotations.register_class(cls)
+
     def has(self, service_id: ServiceId[T_ServiceType]) -> bool:
         """
         Check if a service is provided by this container.
 
+        Only the provider metadata is inspected, the service itself is not created by this check.
+
         Example:
             .. code-block:: python
 
@@ -69,50 +90,177 @@ class Container(Protocol):
                     print("Did you forget to configure a storage client?")
         """
         try:
-            return self.get(service_id) is not None
+            _get_service_provider(self, service_id)
+        except AsyncServiceError:
+            return True
         except ServiceNotFoundError:
             return False
 
+        return True
+
     def has_group(self, group_id: ServiceId[T_ServiceType]) -> bool:
-        """Check if a service group has at least one provider in the container."""
-        try:
-            return next(self.get_group(group_id)) is not None
-        except StopIteration:
-            return False
+        """
+        Check if a service group has at least one provider in the container.
+
+        Only the provider metadata is inspected, so a group is found as soon as it has a provider,
+        even if the provider ends up yielding no services. Iterate the group with
+        [rats.apps.Container.get_group][] to check for members.
+        """
+        return self.has_namespace(ProviderNamespaces.GROUPS, group_id) or self.has_namespace(
+            ProviderNamespaces.FALLBACK_GROUPS, group_id
+        )
 
     def has_namespace(self, namespace: str, group_id: ServiceId[T_ServiceType]) -> bool:
-        try:
-            return next(self.get_namespaced_group(namespace, group_id)) is not None
-        except StopIteration:
-            return False
+        """Check if a service group has at least one provider within a given service namespace."""
+        return len(_get_resolved_providers(self, namespace, group_id)) > 0
 
     def get(self, service_id: ServiceId[T_ServiceType]) -> T_ServiceType:
-        """Retrieve a service instance by its id."""
-        services = list(self.get_namespaced_group(ProviderNamespaces.SERVICES, service_id))
-        if len(services) == 0:
-            services.extend(
-                list(self.get_namespaced_group(ProviderNamespaces.FALLBACK_SERVICES, service_id)),
-            )
+        """
+        Retrieve a service instance by its id.
 
-        if len(services) > 1:
-            raise DuplicateServiceError(service_id)
-        elif len(services) == 0:
-            raise ServiceNotFoundError(service_id)
-        else:
-            return services[0]
+        Raises:
+            ServiceNotFoundError: if the service has no provider.
+            AsyncServiceError: if the service only has async providers, see
+                [rats.apps.Container.aget][].
+        """
+        return _get_service_provider(self, service_id)()
+
+    def get_lazy(self, service_id: ServiceId[T_ServiceType]) -> T_ServiceType:
+        """
+        Retrieve a proxy to a service instance, which is only created the first time it is used.
+
+        The provider of the service is looked up right away, so missing and duplicate services
+        raise the same errors [rats.apps.Container.get][] does. Use [rats.apps.is_realized][] to
+        find out if the service behind the proxy was ever created.
+
+        Example:
+            ```python
+            from rats import apps
+
+
+            class ExampleContainer(apps.Container, apps.PluginMixin):
+                @apps.service(ExampleServices.REPORTER)
+                def _reporter(self) -> Reporter:
+                    # the client is only created if the reporter ends up using it
+                    return Reporter(client=self._app.get_lazy(ExampleServices.CLIENT))
+            ```
+        """
+        provider = _get_service_provider(self, service_id)
+        return cast(T_ServiceType, LazyService(service_id.name, provider))
 
     def get_group(
         self,
         group_id: ServiceId[T_ServiceType],
     ) -> Iterator[T_ServiceType]:
         """Retrieve a service group by its id."""
-        if not self.has_namespace(ProviderNamespaces.GROUPS, group_id):
+        providers = _get_resolved_providers(self, ProviderNamespaces.GROUPS, group_id)
+        if len(providers) == 0:
+            providers = _get_resolved_providers(self, ProviderNamespaces.FALLBACK_GROUPS, group_id)
+
+        for provider in providers:
             # groups are expected to return iterable services
-            for i in self.get_namespaced_group(ProviderNamespaces.FALLBACK_GROUPS, group_id):
-                yield from cast(Iterator[T_ServiceType], i)
+            yield from cast(Iterator[T_ServiceType], provider())
 
-        for i in self.get_namespaced_group(ProviderNamespaces.GROUPS, group_id):
-            yield from cast(Iterator[T_ServiceType], i)
+    def get_group_batches(
+        self,
+        group_id: ServiceId[T_ServiceType],
+        batch_size: int,
+    ) -> Iterator[tuple[T_ServiceType, ...]]:
+        """
+        Retrieve a service group by its id, in tuples of up to `batch_size` services.
+
+        Groups provided with a [rats.apps.ServiceLifetimes.TRANSIENT][] lifetime are never cached,
+        and their services are created as the batches are consumed, so large groups can be
+        processed without holding all of their services in memory.
+
+        Example:
+            ```python
+            from rats import apps
+
+
+            class ExampleContainer(apps.Container):
+                @apps.group(ExampleServices.SHARDS, lifetime=apps.ServiceLifetimes.TRANSIENT)
+                def _shards(self) -> Iterator[Shard]:
+                    for i in range(1_000_000):
+                        yield Shard(i)
+
+
+            for batch in ExampleContainer().get_group_batches(ExampleServices.SHARDS, 1000):
+                process(batch)
+            ```
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1: {batch_size}")
+
+        services = self.get_group(group_id)
+        while batch := tuple(islice(services, batch_size)):
+            yield batch
+
+    async def aget(self, service_id: ServiceId[T_ServiceType]) -> T_ServiceType:
+        """
+        Retrieve a service instance by its id, awaiting it if it has an async provider.
+
+        Services with a regular provider are also returned, from the same cache used by
+        [rats.apps.Container.get][].
+
+        Example:
+            ```python
+            from rats import apps
+
+
+            class ExampleContainer(apps.Container):
+                @apps.async_service(ExampleServices.CLIENT)
+                async def _client(self) -> ExampleClient:
+                    return await ExampleClient.connect()
+
+
+            async def main() -> None:
+                client = await ExampleContainer().aget(ExampleServices.CLIENT)
+            ```
+        """
+        providers = list(self.get_namespaced_providers(ProviderNamespaces.SERVICES, service_id))
+        async_providers = list(
+            self.get_namespaced_providers(ProviderNamespaces.ASYNC_SERVICES, service_id)
+        )
+        if len(providers) + len(async_providers) == 0:
+            providers.extend(
+                self.get_namespaced_providers(ProviderNamespaces.FALLBACK_SERVICES, service_id),
+            )
+
+        if len(providers) + len(async_providers) > 1:
+            raise DuplicateServiceError(service_id)
+        elif len(providers) == 1:
+            return providers[0]()
+        elif len(async_providers) == 1:
+            return await cast(Awaitable[T_ServiceType], async_providers[0]())
+        else:
+            raise ServiceNotFoundError(service_id)
+
+    async def aget_group(
+        self,
+        group_id: ServiceId[T_ServiceType],
+    ) -> AsyncIterator[T_ServiceType]:
+        """
+        Retrieve a service group by its id, including the services of any async group providers.
+
+        The async group providers are awaited concurrently, before any of the services are
+        returned.
+        """
+        providers = list(self.get_namespaced_providers(ProviderNamespaces.GROUPS, group_id))
+        async_providers = list(
+            self.get_namespaced_providers(ProviderNamespaces.ASYNC_GROUPS, group_id)
+        )
+        if len(providers) + len(async_providers) == 0:
+            providers.extend(
+                self.get_namespaced_providers(ProviderNamespaces.FALLBACK_GROUPS, group_id),
+            )
+
+        async_groups = await asyncio.gather(*[
+            cast(Awaitable[Iterable[T_ServiceType]], provider()) for provider in async_providers
+        ])
+        for group in [*[provider() for provider in providers], *async_groups]:
+            for service in cast(Iterable[T_ServiceType], group):
+                yield service
 
     def get_namespaced_group(
         self,
@@ -120,10 +268,115 @@ class Container(Protocol):
         group_id: ServiceId[T_ServiceType],
     ) -> Iterator[T_ServiceType]:
         """Retrieve a service group by its id, within a given service namespace."""
-        yield from _get_cached_services_for_group(self, namespace, group_id)
+        # skips get_namespaced_providers, which calls this method when it is overridden
+        for provider in _get_default_providers(self, namespace, group_id):
+            yield provider()
+
+    def get_namespaced_providers(
+        self,
+        namespace: str,
+        group_id: ServiceId[T_ServiceType],
+    ) -> Iterator[Provider[T_ServiceType]]:
+        """
+        Retrieve the providers of a service group, within a given service namespace.
+
+        Providers are returned without being called, allowing callers to inspect which services
+        are available without creating them. Calling a provider returns the same cached instance
+        that [rats.apps.Container.get_namespaced_group][] would return. Providers found in the
+        async namespaces return awaitables.
+
+        Containers implementing their own `get_namespaced_group` method, without implementing
+        this one, have their services created in order to be returned as providers.
+        """
+        if type(self).get_namespaced_group is not Container.get_namespaced_group:
+            # the values can change from one call to the next, so the lookup is not remembered
+            _mark_resolution_volatile()
+            for service in self.get_namespaced_group(namespace, group_id):
+                yield partial(_get_value, service)
+            return
+
+        yield from _get_default_providers(self, namespace, group_id)
 
-        for subcontainer in _get_subcontainers(self):
-            yield from subcontainer.get_namespaced_group(namespace, group_id)
+
+def _get_default_providers(
+    c: Container,
+    namespace: str,
+    group_id: ServiceId[T_ServiceType],
+) -> Iterator[Provider[T_ServiceType]]:
+    index = _get_container_index(c)
+    if index is not None:
+        yield from index.get_namespaced_providers(namespace, group_id)
+        return
+
+    for provider in _get_cached_providers_for_group(c, namespace, group_id):
+        yield _get_annotated_provider(c, namespace, provider)
+
+    for subcontainer in _get_subcontainers(c):
+        yield from subcontainer.get_namespaced_providers(namespace, group_id)
+
+
+def _get_service_provider(
+    c: Container,
+    service_id: ServiceId[T_ServiceType],
+) -> Provider[T_ServiceType]:
+    providers = _get_resolved_providers(c, ProviderNamespaces.SERVICES, service_id)
+    if len(providers) == 0:
+        providers = _get_resolved_providers(c, ProviderNamespaces.FALLBACK_SERVICES, service_id)
+
+    if len(providers) > 1:
+        raise DuplicateServiceError(service_id)
+    elif len(providers) == 0:
+        if _get_resolved_providers(c, ProviderNamespaces.ASYNC_SERVICES, service_id):
+            raise AsyncServiceError(service_id)
+        raise ServiceNotFoundError(service_id)
+    else:
+        return providers[0]
+
+
+def _get_resolved_providers(
+    c: Container,
+    namespace: str,
+    group_id: ServiceId[T_ServiceType],
+) -> tuple[Provider[T_ServiceType], ...]:
+    if not _uses_default_resolution(c):
+        return tuple(c.get_namespaced_providers(namespace, group_id))
+
+    # the providers found in a tree do not change, so lookups, including misses, are remembered
+    resolutions: dict[tuple[str, ServiceId[Any]], tuple[Provider[Any], ...]] = _get_instance_cache(
+        c, "__rats_apps_resolution_cache__"
+    )
+    key = (namespace, group_id)
+    providers = resolutions.get(key)
+    if providers is None:
+        volatile = [False]
+        token = _RESOLUTION_VOLATILE.set(volatile)
+        try:
+            providers = tuple(c.get_namespaced_providers(namespace, group_id))
+        finally:
+            _RESOLUTION_VOLATILE.reset(token)
+
+        # containers only implementing get_namespaced_group return values instead of providers
+        if not volatile[0]:
+            resolutions[key] = providers
+
+    return providers
+
+
+# set while a lookup is resolved, and flagged when it reaches values that can not be remembered
+_RESOLUTION_VOLATILE: ContextVar[list[bool] | None] = ContextVar(
+    "rats_apps_resolution_volatile",
+    default=None,
+)
+
+
+def _mark_resolution_volatile() -> None:
+    volatile = _RESOLUTION_VOLATILE.get()
+    if volatile is not None:
+        volatile[0] = True
+
+
+def _get_value(value: T_ServiceType) -> T_ServiceType:
+    return value
 
 
 def _get_subcontainers(c: Container) -> Iterator[Container]:
@@ -135,6 +388,7 @@ def _get_subcontainers(c: Container) -> Iterator[Container]:
 class _ProviderInfo(ExtNamedTuple, Generic[T_ServiceType]):
     attr: str
     group_id: ServiceId[T_ServiceType]
+    lifetime: str = ServiceLifetimes.SINGLETON
 
 
 def _get_cached_services_for_group(
@@ -142,40 +396,199 @@ def _get_cached_services_for_group(
     namespace: str,
     group_id: ServiceId[T_ServiceType],
 ) -> Iterator[T_ServiceType]:
-    provider_cache = _get_provider_cache(c)
+    for provider in _get_cached_providers_for_group(c, namespace, group_id):
+        yield _get_cached_service(c, namespace, provider)
+
+
+def _get_annotated_provider(
+    c: Container,
+    namespace: str,
+    provider: _ProviderInfo[T_ServiceType],
+) -> Provider[Any]:
+    if namespace in [ProviderNamespaces.ASYNC_SERVICES, ProviderNamespaces.ASYNC_GROUPS]:
+        return partial(_aget_cached_service, c, namespace, provider)
+
+    return partial(_get_cached_service, c, namespace, provider)
+
+
+def get_provider_annotations(provider: Provider[Any], namespace: str) -> tuple[Any, ...]:
+    """
+    Find the annotations, within a namespace, of the container method behind a provider.
+
+    Providers are found through the containers that delegate their lookups, so the annotations of
+    a method can be read wherever its service is resolved. Providers that are not container
+    methods, like the ones of a [rats.apps.StaticContainer][], have no annotations.
+    """
+    if not isinstance(provider, partial) or provider.func not in [
+        _get_cached_service,
+        _aget_cached_service,
+    ]:
+        return ()
+
+    c, _, info = cast(tuple[Container, str, _ProviderInfo[Any]], provider.args)
+    tates = annotations.get_class_annotations(type(c)).with_namespace(namespace)
+    return tuple(
+        group for tate in tates.annotations if tate.name == info.attr for group in tate.groups
+    )
+
+
+def _get_cached_providers_for_group(
+    c: Container,
+    namespace: str,
+    group_id: ServiceId[T_ServiceType],
+) -> list[_ProviderInfo[T_ServiceType]]:
     info_cache = _get_provider_info_cache(c)
 
     if (namespace, group_id) not in info_cache:
         info_cache[(namespace, group_id)] = list(_get_providers_for_group(c, namespace, group_id))
 
-    for provider in info_cache[(namespace, group_id)]:
-        if provider not in provider_cache:
-            if namespace in [
-                ProviderNamespaces.CONTAINERS,
-                ProviderNamespaces.SERVICES,
-                ProviderNamespaces.FALLBACK_SERVICES,
-            ]:
-                provider_cache[provider] = getattr(c, provider.attr)()
-            else:
-                provider_cache[provider] = list(getattr(c, provider.attr)())
+    return info_cache[(namespace, group_id)]
+
+
+def _get_cached_service(
+    c: Container,
+    namespace: str,
+    provider: _ProviderInfo[T_ServiceType],
+) -> T_ServiceType:
+    if provider.lifetime == ServiceLifetimes.TRANSIENT:
+        return _create_service(c, namespace, provider)
+
+    if provider.lifetime == ServiceLifetimes.SCOPED:
+        scope = get_current_scope(f"{type(c).__name__}.{provider.attr}")
+        return scope.get_or_create(
+            c, (namespace, provider), partial(_create_service, c, namespace, provider)
+        )
+
+    provider_cache = _get_service_cache(c, namespace)
+
+    # cache policies can evict entries at any time, so each lookup reads the cache exactly once
+    service = provider_cache.get(provider, _MISSING)
+    if service is not _MISSING:
+        return service
+
+    # only the first call to a provider pays for the lock, waiting on any concurrent construction
+    with _get_provider_lock(c, provider):
+        service = provider_cache.get(provider, _MISSING)
+        if service is _MISSING:
+            service = _create_service(c, namespace, provider)
+            provider_cache[provider] = service
+
+        return service
+
+
+def _create_service(
+    c: Container,
+    namespace: str,
+    provider: _ProviderInfo[T_ServiceType],
+) -> T_ServiceType:
+    if namespace in [
+        ProviderNamespaces.CONTAINERS,
+        ProviderNamespaces.SERVICES,
+        ProviderNamespaces.FALLBACK_SERVICES,
+    ]:
+        return getattr(c, provider.attr)()
+    elif provider.lifetime == ServiceLifetimes.TRANSIENT:
+        # transient groups are never cached, so they are streamed to the caller as they are yielded
+        return getattr(c, provider.attr)()
+    else:
+        return cast(T_ServiceType, list(getattr(c, provider.attr)()))
+
+
+async def _aget_cached_service(
+    c: Container,
+    namespace: str,
+    provider: _ProviderInfo[T_ServiceType],
+) -> T_ServiceType:
+    service = _get_provider_cache(c).get(provider, _MISSING)
+    if service is not _MISSING:
+        return service
+
+    # concurrent callers in the same event loop wait on the same task instead of calling the
+    # provider again; tasks can not be awaited from other loops, so each loop gets its own
+    key = (asyncio.get_running_loop(), provider)
+    tasks: dict[tuple[asyncio.AbstractEventLoop, _ProviderInfo[Any]], asyncio.Future[Any]] = (
+        _get_instance_cache(c, "__rats_apps_provider_tasks__")
+    )
+    with _get_provider_lock(c, provider):
+        task = tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(_acreate_service(c, namespace, provider))
+            tasks[key] = task
+
+    return await asyncio.shield(task)
+
+
+async def _acreate_service(
+    c: Container,
+    namespace: str,
+    provider: _ProviderInfo[T_ServiceType],
+) -> T_ServiceType:
+    provider_cache = _get_provider_cache(c)
+    tasks: dict[tuple[asyncio.AbstractEventLoop, _ProviderInfo[Any]], asyncio.Future[Any]] = (
+        _get_instance_cache(c, "__rats_apps_provider_tasks__")
+    )
+    key = (asyncio.get_running_loop(), provider)
+
+    try:
+        if namespace == ProviderNamespaces.ASYNC_SERVICES:
+            created = await getattr(c, provider.attr)()
+        else:
+            created = cast(T_ServiceType, [x async for x in getattr(c, provider.attr)()])
+
+        with _get_provider_lock(c, provider):
+            # another event loop might have created the service first, and every caller gets it
+            service = provider_cache.get(provider, _MISSING)
+            if service is _MISSING:
+                service = created
+                provider_cache[provider] = service
+    finally:
+        with _get_provider_lock(c, provider):
+            tasks.pop(key, None)
+
+    return service
+
+
+_INSTANCE_CACHES_LOCK = threading.Lock()
+_MISSING = object()
+
+
+def _get_instance_cache(obj: object, attr: str) -> dict[Any, Any]:
+    if not hasattr(obj, attr):
+        with _INSTANCE_CACHES_LOCK:
+            if not hasattr(obj, attr):
+                setattr(obj, attr, {})
+
+    return getattr(obj, attr)
+
+
+def _get_provider_cache(obj: object) -> MutableMapping[_ProviderInfo[Any], Any]:
+    # replaced by the cache created by the policy given to [rats.apps.set_cache_policy][]
+    return _get_instance_cache(obj, "__rats_apps_provider_cache__")
+
 
-        yield provider_cache[provider]
+def _get_service_cache(obj: object, namespace: str) -> MutableMapping[_ProviderInfo[Any], Any]:
+    if namespace == ProviderNamespaces.CONTAINERS:
+        # sub-containers hold their own caches, so they are never evicted by a cache policy
+        return _get_instance_cache(obj, "__rats_apps_container_cache__")
 
+    return _get_provider_cache(obj)
 
-def _get_provider_cache(obj: object) -> dict[_ProviderInfo[Any], Any]:
-    if not hasattr(obj, "__rats_apps_provider_cache__"):
-        obj.__rats_apps_provider_cache__ = {}  # type: ignore[reportAttributeAccessIssue]
 
-    return obj.__rats_apps_provider_cache__  # type: ignore[reportAttributeAccessIssue]
+def _get_provider_lock(obj: object, provider: _ProviderInfo[Any]) -> threading.RLock:
+    locks: dict[_ProviderInfo[Any], threading.RLock] = _get_instance_cache(
+        obj, "__rats_apps_provider_locks__"
+    )
+    if provider not in locks:
+        # re-entrant, so a provider depending on itself fails the same way it does without locks
+        locks.setdefault(provider, threading.RLock())
+
+    return locks[provider]
 
 
 def _get_provider_info_cache(
     obj: object,
 ) -> dict[tuple[str, ServiceId[Any]], list[_ProviderInfo[Any]]]:
-    if not hasattr(obj, "__rats_apps_provider_info_cache__"):
-        obj.__rats_apps_provider_info_cache__ = {}  # type: ignore[reportAttributeAccessIssue]
-
-    return obj.__rats_apps_provider_info_cache__  # type: ignore[reportAttributeAccessIssue]
+    return _get_instance_cache(obj, "__rats_apps_provider_info_cache__")
 
 
 def _get_providers_for_group(
@@ -185,9 +598,129 @@ def _get_providers_for_group(
 ) -> Iterator[_ProviderInfo[T_ServiceType]]:
     tates = annotations.get_class_annotations(type(c))
     groups = tates.with_group(namespace, cast(NamedTuple, group_id))
+    lifetimes = {
+        annotation.name: annotation.groups[0].name
+        for annotation in tates.with_namespace(LIFETIMES_NAMESPACE).annotations
+    }
 
     for annotation in groups.annotations:
-        yield _ProviderInfo(annotation.name, group_id)
+        yield _ProviderInfo(
+            annotation.name,
+            group_id,
+            lifetimes.get(annotation.name, ServiceLifetimes.SINGLETON),
+        )
+
+
+_IndexEntry = tuple[Container, Provider[Any] | None]
+
+
+class _ContainerIndex:
+    """
+    Flattened view of a container tree, mapping each lookup to the providers that answer it.
+
+    The tree is walked once, when the index is created, and the list of containers is kept in the
+    same order they would be visited by [rats.apps.Container.get_namespaced_providers][]. Lookups
+    are resolved against that list the first time they are seen and remembered after that.
+    """
+
+    _nodes: tuple[Container, ...]
+    _entries: dict[tuple[str, ServiceId[Any]], tuple[_IndexEntry, ...]]
+
+    def __init__(self, root: Container) -> None:
+        self._nodes = tuple(iter_container_tree(root))
+        self._entries = {}
+
+    def get_namespaced_providers(
+        self,
+        namespace: str,
+        group_id: ServiceId[T_ServiceType],
+    ) -> Iterator[Provider[T_ServiceType]]:
+        for c, provider in self._get_entries(namespace, group_id):
+            if provider is None:
+                yield from c.get_namespaced_providers(namespace, group_id)
+            else:
+                yield provider
+
+    def _get_entries(
+        self,
+        namespace: str,
+        group_id: ServiceId[Any],
+    ) -> tuple[_IndexEntry, ...]:
+        key = (namespace, group_id)
+        if key not in self._entries:
+            entries: list[_IndexEntry] = []
+            for node in self._nodes:
+                if not _uses_default_resolution(node):
+                    entries.append((node, None))
+                    continue
+
+                for provider in _get_cached_providers_for_group(node, namespace, group_id):
+                    entries.append((node, _get_annotated_provider(node, namespace, provider)))
+
+            self._entries[key] = tuple(entries)
+
+        return self._entries[key]
+
+
+def iter_container_tree(c: Container) -> Iterator[Container]:
+    """Walk a tree of containers, creating them, in the order they are searched for providers."""
+    subcontainers = getattr(c, "__rats_apps_subcontainers__", None)
+    if subcontainers is not None:
+        # containers that only group other containers are flattened into the index
+        for subcontainer in subcontainers():
+            yield from iter_container_tree(subcontainer)
+        return
+
+    yield c
+
+    if _uses_default_resolution(c):
+        for subcontainer in _get_subcontainers(c):
+            yield from iter_container_tree(subcontainer)
+
+
+def _uses_default_resolution(c: Container) -> bool:
+    return (
+        type(c).get_namespaced_group is Container.get_namespaced_group
+        and type(c).get_namespaced_providers is Container.get_namespaced_providers
+    )
+
+
+def _get_container_index(obj: object) -> _ContainerIndex | None:
+    return getattr(obj, "__rats_apps_container_index__", None)
+
+
+T_Container = TypeVar("T_Container", bound=Container)
+
+
+def compile_container(c: T_Container) -> T_Container:
+    """
+    Build a flat resolution index for a container tree and attach it to the root container.
+
+    By default, every lookup walks the tree of sub-containers recursively. Once compiled, lookups
+    made through the root container are answered from a flat list of the providers found in the
+    tree, computed the first time each service id is requested, without walking the tree again.
+
+    Compiling a container creates every sub-container in the tree right away. Containers that
+    implement their own lookup methods, like [rats.apps.StaticContainer][], are kept in the index
+    as-is and are asked for their providers on every lookup.
+
+    Example:
+        ```python
+        from rats import apps
+
+        app = apps.compile_container(
+            apps.AppBundle(app_plugin=Application, container_plugin=Plugin)
+        )
+        app.execute()
+        ```
+
+    Args:
+        c: the root container of the tree; only lookups made through this instance use the index.
+
+    Returns: the same container instance, to allow chaining.
+    """
+    c.__rats_apps_container_index__ = _ContainerIndex(c)  # type: ignore[reportAttributeAccessIssue]
+    return c
 
 
 DEFAULT_CONTAINER_GROUP = ServiceId[Container](f"{__name__}:__default__")
@@ -208,6 +741,14 @@ class ServiceNotFoundError(RuntimeError, Generic[T_ServiceType]):
         self.service_id = service_id
 
 
+class AsyncServiceError(ServiceNotFoundError[T_ServiceType]):
+    def __init__(self, service_id: ServiceId[T_ServiceType]) -> None:
+        RuntimeError.__init__(
+            self, f"Service id only has async providers, retrieve it with aget(): {service_id}"
+        )
+        self.service_id = service_id
+
+
 class DuplicateServiceError(RuntimeError, Generic[T_ServiceType]):
     service_id: ServiceId[T_ServiceType]
 
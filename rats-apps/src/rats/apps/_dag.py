@@ -0,0 +1,204 @@
+import contextvars
+import logging
+from collections.abc import Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, final
+
+from ._annotations import DEPENDENCIES_NAMESPACE
+from ._container import Container, ServiceNotFoundError, get_provider_annotations
+from ._ids import ServiceId, T_ExecutableType
+from ._namespaces import ProviderNamespaces
+from ._runtimes import ExceptionGroupCompat, Runtime, ThreadPoolRuntime
+
+logger = logging.getLogger(__name__)
+
+_Graph = dict[ServiceId[Any], tuple[ServiceId[Any], ...]]
+
+
+@final
+class DagRuntime(Runtime):
+    """
+    A runtime that executes services along with their dependencies, in dependency order.
+
+    Dependencies are declared with [rats.apps.depends_on][], on the methods providing the
+    executables. Running an executable also runs everything it depends on, directly or not, and
+    each executable is run once, as soon as all of its dependencies have completed, in a pool of
+    up to `max_concurrency` threads. When an executable fails, the executables depending on it are
+    skipped, while independent ones keep running. Once everything else has completed, the failures
+    are raised together, like in [rats.apps.ThreadPoolRuntime][].
+
+    Example:
+        ```python
+        from rats import apps
+
+        runtime = apps.DagRuntime(app, max_concurrency=4)
+        for i, stage in enumerate(runtime.plan(ExampleServices.EVALUATE)):
+            print(f"stage {i}: {[exe_id.name for exe_id in stage]}")
+
+        runtime.execute(ExampleServices.EVALUATE)
+        ```
+    """
+
+    _app: Container
+    _max_concurrency: int | None
+    _dry_run: bool
+
+    def __init__(
+        self,
+        app: Container,
+        max_concurrency: int | None = None,
+        *,
+        dry_run: bool = False,
+    ) -> None:
+        """
+        Create a runtime executing the services of a container.
+
+        Args:
+            app: the container the executables and their dependencies are retrieved from.
+            max_concurrency: the most executables run at once; uses the python thread pool default
+                when not provided.
+            dry_run: print the planned stages instead of executing anything.
+        """
+        self._app = app
+        self._max_concurrency = max_concurrency
+        self._dry_run = dry_run
+
+    def plan(
+        self, *exe_ids: ServiceId[T_ExecutableType]
+    ) -> tuple[tuple[ServiceId[Any], ...], ...]:
+        """
+        Group the executables, and their dependencies, into stages that can run in parallel.
+
+        Every executable depends only on executables in earlier stages. [rats.apps.DagRuntime][]
+        does not wait for a whole stage to complete, and starts executables as soon as their own
+        dependencies complete. Within a stage, the given executables come first, followed by the
+        dependencies in the order they were found, with the dependencies of each executable sorted
+        by name.
+
+        Raises:
+            ServiceNotFoundError: if an executable, or one of its dependencies, is not provided.
+            ValueError: if the dependencies of the executables form a cycle.
+        """
+        return _get_stages(self._get_graph(exe_ids))
+
+    def execute(self, *exe_ids: ServiceId[T_ExecutableType]) -> None:
+        """Execute a list of executables, after the executables they depend on."""
+        graph = self._get_graph(exe_ids)
+        stages = _get_stages(graph)
+        if self._dry_run:
+            for i, stage in enumerate(stages):
+                print(f"stage {i}: {', '.join(exe_id.name for exe_id in stage)}")
+            return
+
+        self._run(graph)
+
+    def execute_group(self, *exe_group_ids: ServiceId[T_ExecutableType]) -> None:
+        """
+        Execute every executable in one or more groups concurrently.
+
+        Executables in groups have no id of their own, so they can not have dependencies.
+        """
+        if self._dry_run:
+            print(f"stage 0: {', '.join(group_id.name for group_id in exe_group_ids)}")
+            return
+
+        ThreadPoolRuntime(self._app, self._max_concurrency).execute_group(*exe_group_ids)
+
+    def _get_graph(self, exe_ids: Iterable[ServiceId[Any]]) -> _Graph:
+        graph: _Graph = {}
+        pending = list(exe_ids)
+        while len(pending) > 0:
+            exe_id = pending.pop(0)
+            if exe_id in graph:
+                continue
+
+            graph[exe_id] = self._get_dependencies(exe_id)
+            pending.extend(graph[exe_id])
+
+        return graph
+
+    def _get_dependencies(self, exe_id: ServiceId[Any]) -> tuple[ServiceId[Any], ...]:
+        # read from the providers, so plugins behind containers with their own lookups are found
+        providers = list(self._app.get_namespaced_providers(ProviderNamespaces.SERVICES, exe_id))
+        if len(providers) == 0:
+            providers = list(
+                self._app.get_namespaced_providers(ProviderNamespaces.FALLBACK_SERVICES, exe_id)
+            )
+        if len(providers) == 0:
+            raise ServiceNotFoundError(exe_id)
+
+        dependencies = {
+            dep
+            for provider in providers
+            for dep in get_provider_annotations(provider, DEPENDENCIES_NAMESPACE)
+        }
+        # annotations do not keep the order of their groups, so dependencies are sorted by name
+        return tuple(sorted(dependencies, key=lambda dep: dep.name))
+
+    def _run(self, graph: _Graph) -> None:
+        remaining = {exe_id: set(deps) for exe_id, deps in graph.items()}
+        dependents: dict[ServiceId[Any], list[ServiceId[Any]]] = {}
+        for exe_id, deps in graph.items():
+            for dep in deps:
+                dependents.setdefault(dep, []).append(exe_id)
+
+        errors: list[BaseException] = []
+        running: dict[Future[None], ServiceId[Any]] = {}
+        with ThreadPoolExecutor(self._max_concurrency, thread_name_prefix="rats-dag") as executor:
+
+            def _submit_ready() -> None:
+                for exe_id in [exe_id for exe_id, deps in remaining.items() if len(deps) == 0]:
+                    del remaining[exe_id]
+                    # each executable sees the context of the caller, like the active scope
+                    context = contextvars.copy_context()
+                    running[executor.submit(context.run, self._execute_one, exe_id)] = exe_id
+
+            def _skip_dependents(exe_id: ServiceId[Any]) -> None:
+                for dependent in dependents.get(exe_id, []):
+                    if remaining.pop(dependent, None) is not None:
+                        logger.warning(f"skipping {dependent.name}, after {exe_id.name} failed")
+                        _skip_dependents(dependent)
+
+            _submit_ready()
+            while len(running) > 0:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    exe_id = running.pop(future)
+                    error = future.exception()
+                    if error is not None:
+                        errors.append(error)
+                        _skip_dependents(exe_id)
+                        continue
+
+                    for dependent in dependents.get(exe_id, []):
+                        if dependent in remaining:
+                            remaining[dependent].discard(exe_id)
+
+                _submit_ready()
+
+        if len(errors) > 0:
+            raise ExceptionGroupCompat(f"{len(errors)} executable(s) failed", errors)
+
+    def _execute_one(self, exe_id: ServiceId[Any]) -> None:
+        logger.debug(f"executing {exe_id.name}")
+        self._app.get(exe_id).execute()
+
+
+def _get_stages(graph: _Graph) -> tuple[tuple[ServiceId[Any], ...], ...]:
+    stages: list[tuple[ServiceId[Any], ...]] = []
+    done: set[ServiceId[Any]] = set()
+    remaining = dict(graph)
+    while len(remaining) > 0:
+        stage = tuple(
+            exe_id for exe_id, deps in remaining.items() if all(dep in done for dep in deps)
+        )
+        if len(stage) == 0:
+            names = ", ".join(exe_id.name for exe_id in remaining)
+            raise ValueError(f"dependency cycle between executables: {names}")
+
+        for exe_id in stage:
+            del remaining[exe_id]
+        done.update(stage)
+        stages.append(stage)
+
+    return tuple(stages)
@@ -0,0 +1,150 @@
+import hashlib
+import json
+import logging
+import os
+import sys
+import threading
+from importlib import metadata
+from importlib.metadata import EntryPoint
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_DISABLE_ENV = "RATS_ENTRY_POINTS_CACHE"
+_DIRECTORY_ENV = "RATS_ENTRY_POINTS_CACHE_DIR"
+# bumped when the format of the index files changes
+_FORMAT_VERSION = 1
+
+_Index = dict[str, tuple[EntryPoint, ...]]
+_INDEXES: dict[str, _Index] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_entry_points(group: str) -> tuple[EntryPoint, ...]:
+    """
+    Get the entry points of a group, like [importlib.metadata.entry_points][] does.
+
+    Finding entry points means reading the metadata of every installed distribution, so the
+    entry points of all groups are indexed once and stored in the user cache directory, to be
+    reused by other processes. The index is rebuilt when any `sys.path` entry, or any of the
+    `.dist-info` and `.egg-info` directories within them, is modified, which happens when packages
+    are installed, upgraded, or removed.
+
+    The index is stored in `$XDG_CACHE_HOME/rats` on linux, or the equivalent directory on other
+    platforms. Use the `RATS_ENTRY_POINTS_CACHE_DIR` environment variable to choose a different
+    directory, or set `RATS_ENTRY_POINTS_CACHE=0` to always read the installed metadata.
+
+    Args:
+        group: the name of the entry point group, like `rats.runtime.apps`.
+    """
+    if os.environ.get(_DISABLE_ENV, "1").lower() in ("0", "false"):
+        return tuple(metadata.entry_points(group=group))
+
+    try:
+        key = _get_index_key()
+    except Exception:
+        logger.debug("failed to compute the entry points index key", exc_info=True)
+        return tuple(metadata.entry_points(group=group))
+
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(key)
+        if index is None:
+            index = _load_index(key)
+            _INDEXES[key] = index
+
+    return index.get(group, ())
+
+
+def _load_index(key: str) -> _Index:
+    path = _get_index_path()
+    try:
+        data = json.loads(path.read_text())
+        if data["version"] == _FORMAT_VERSION and data["key"] == key:
+            return {
+                group: tuple(
+                    EntryPoint(name=name, value=value, group=group) for name, value in eps
+                )
+                for group, eps in data["groups"].items()
+            }
+    except FileNotFoundError:
+        pass
+    except Exception:
+        logger.debug(f"ignoring unreadable entry points index: {path}", exc_info=True)
+
+    logger.debug(f"building entry points index: {path}")
+    index: dict[str, list[EntryPoint]] = {}
+    for entry in _get_all_entry_points():
+        index.setdefault(entry.group, []).append(entry)
+
+    data = {
+        "version": _FORMAT_VERSION,
+        "key": key,
+        "groups": {group: [[e.name, e.value] for e in eps] for group, eps in index.items()},
+    }
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(data))
+        # replaced atomically, so concurrent processes never read partial files
+        tmp_path.replace(path)
+    except OSError:
+        logger.debug(f"failed to write entry points index: {path}", exc_info=True)
+        tmp_path.unlink(missing_ok=True)
+
+    return {group: tuple(eps) for group, eps in index.items()}
+
+
+def _get_all_entry_points() -> list[EntryPoint]:
+    # like importlib.metadata.entry_points(), only the first distribution found with a name is used
+    seen: set[str] = set()
+    entries: list[EntryPoint] = []
+    for dist in metadata.distributions():
+        name = (dist.metadata["Name"] or "").lower().replace("-", "_")
+        if name in seen:
+            continue
+
+        seen.add(name)
+        entries.extend(dist.entry_points)
+
+    return entries
+
+
+def _get_index_key() -> str:
+    stamps: list[str] = [sys.version]
+    for entry in sys.path:
+        path = Path(entry or ".")
+        try:
+            stamps.append(f"{entry}:{path.stat().st_mtime_ns}")
+        except OSError:
+            stamps.append(f"{entry}:missing")
+            continue
+
+        if not path.is_dir():
+            continue
+
+        with os.scandir(path) as children:
+            for child in sorted(children, key=lambda c: c.name):
+                if child.name.endswith((".dist-info", ".egg-info")):
+                    stamps.append(f"{child.name}:{child.stat().st_mtime_ns}")
+
+    return hashlib.sha256("\n".join(stamps).encode()).hexdigest()
+
+
+def _get_index_path() -> Path:
+    # one index per environment, so environments sharing the cache directory do not evict each other
+    environment = hashlib.sha256(f"{sys.prefix}:{sys.executable}".encode()).hexdigest()[:16]
+    return _get_cache_dir() / f"entry-points-{environment}.json"
+
+
+def _get_cache_dir() -> Path:
+    directory = os.environ.get(_DIRECTORY_ENV)
+    if directory:
+        return Path(directory)
+
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or str(Path.home() / "AppData" / "Local")
+        return Path(base) / "rats" / "cache"
+    elif sys.platform == "darwin":
+        return Path.home() / "Library" / "Caches" / "rats"
+
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "rats"
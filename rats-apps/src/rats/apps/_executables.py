@@ -17,6 +17,18 @@ class Executable(Protocol):
         """Execute the application."""
 
 
+class AsyncExecutable(Protocol):
+    """
+    The async counterpart of [rats.apps.Executable][].
+
+    Run by [rats.apps.AsyncStandardRuntime][], within an already running event loop.
+    """
+
+    @abstractmethod
+    async def execute(self) -> None:
+        """Execute the application."""
+
+
 class App(Executable):
     """
     Wraps a plain callable objects as a [rats.apps.Executable][].
@@ -0,0 +1,110 @@
+import logging
+import threading
+from collections.abc import Callable, Iterator
+from typing import Any, final
+
+logger = logging.getLogger(__name__)
+_NOT_REALIZED = object()
+
+
+@final
+class LazyService:
+    """
+    Proxy for a service that is only created the first time it is used.
+
+    Instances are returned by [rats.apps.Container.get_lazy][], and forward attribute access, calls,
+    iteration, comparisons, and context manager usage to the proxied service, which is created by
+    the first of those operations. Use [rats.apps.is_realized][] to find out if the service was
+    created, without creating it.
+    """
+
+    __slots__ = ("_rats_lazy_lock", "_rats_lazy_name", "_rats_lazy_provider", "_rats_lazy_value")
+
+    def __init__(self, name: str, provider: Callable[[], Any]) -> None:
+        object.__setattr__(self, "_rats_lazy_name", name)
+        object.__setattr__(self, "_rats_lazy_provider", provider)
+        object.__setattr__(self, "_rats_lazy_lock", threading.Lock())
+        object.__setattr__(self, "_rats_lazy_value", _NOT_REALIZED)
+
+    def _rats_lazy_realize(self) -> Any:
+        value = object.__getattribute__(self, "_rats_lazy_value")
+        if value is not _NOT_REALIZED:
+            return value
+
+        with object.__getattribute__(self, "_rats_lazy_lock"):
+            value = object.__getattribute__(self, "_rats_lazy_value")
+            if value is _NOT_REALIZED:
+                name = object.__getattribute__(self, "_rats_lazy_name")
+                logger.debug(f"realizing lazy service: {name}")
+                value = object.__getattribute__(self, "_rats_lazy_provider")()
+                object.__setattr__(self, "_rats_lazy_value", value)
+
+            return value
+
+    @property
+    def __class__(self) -> type[Any]:  # type: ignore[reportIncompatibleVariableOverride]
+        # makes isinstance() checks against the proxied service work, at the cost of creating it
+        value: object = self._rats_lazy_realize()
+        return type(value)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._rats_lazy_realize(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._rats_lazy_realize(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self._rats_lazy_realize(), name)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._rats_lazy_realize()(*args, **kwargs)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._rats_lazy_realize())
+
+    def __len__(self) -> int:
+        return len(self._rats_lazy_realize())
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self._rats_lazy_realize()
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._rats_lazy_realize()[key]
+
+    def __bool__(self) -> bool:
+        return bool(self._rats_lazy_realize())
+
+    def __eq__(self, other: object) -> bool:
+        return self._rats_lazy_realize() == other
+
+    def __hash__(self) -> int:
+        return hash(self._rats_lazy_realize())
+
+    def __enter__(self) -> Any:
+        return self._rats_lazy_realize().__enter__()
+
+    def __exit__(self, *args: Any) -> Any:
+        return self._rats_lazy_realize().__exit__(*args)
+
+    def __str__(self) -> str:
+        return str(self._rats_lazy_realize())
+
+    def __repr__(self) -> str:
+        # repr is used by debuggers and logs, so it should not create the service
+        name = object.__getattribute__(self, "_rats_lazy_name")
+        if not is_realized(self):
+            return f"<LazyService {name} (not realized)>"
+
+        return repr(object.__getattribute__(self, "_rats_lazy_value"))
+
+
+def is_realized(service: Any) -> bool:
+    """
+    Check if a service returned by [rats.apps.Container.get_lazy][] has been created.
+
+    Services that are not lazy proxies are always considered to be realized.
+    """
+    if type(service) is not LazyService:
+        return True
+
+    return object.__getattribute__(service, "_rats_lazy_value") is not _NOT_REALIZED
@@ -4,3 +4,5 @@ class ProviderNamespaces:
     CONTAINERS = "containers"
     FALLBACK_SERVICES = "fallback-services"
     FALLBACK_GROUPS = "fallback-groups"
+    ASYNC_SERVICES = "async-services"
+    ASYNC_GROUPS = "async-groups"
@@ -1,43 +1,144 @@
-from collections.abc import Iterable, Iterator
-from functools import cache
-from importlib.metadata import entry_points
+import logging
+import threading
+from collections.abc import Collection, Iterator
+from importlib.metadata import EntryPoint
+from typing import Any, NamedTuple
 
-from ._container import Container
+from ._caches import inherit_cache_policy
+from ._container import Container, Provider
+from ._entry_points import get_entry_points
 from ._ids import ServiceId, T_ServiceType
 
+logger = logging.getLogger(__name__)
+
+
+class PluginManifest(NamedTuple):
+    """
+    The services a plugin of a [rats.apps.PythonEntryPointContainer][] can provide.
+
+    Manifests are registered in the `<group>.manifests` entry point group, with the same name as
+    the plugin they describe, and allow the container to skip importing plugins that can not
+    provide the services being looked up. Define manifests in modules that import little more than
+    the service ids, since every manifest is loaded by the first lookup made through the container.
+
+    Example:
+        ```toml
+        [project.entry-points."example.plugins"]
+        "example-azure" = "example.azure:AzurePlugin"
+
+        [project.entry-points."example.plugins.manifests"]
+        "example-azure" = "example.azure_manifest:MANIFEST"
+        ```
+
+        ```python
+        from rats import apps
+
+        from ._ids import AzureServices
+
+        MANIFEST = apps.PluginManifest(service_ids=[AzureServices.BLOB_CLIENT])
+        ```
+    """
+
+    namespaces: Collection[str] = ()
+    """The namespaces of the provided services, or empty if the plugin uses any namespace."""
+    service_ids: Collection[ServiceId[Any]] = ()
+    """The ids of the provided services and groups, or empty if any id can be provided."""
+
+    def provides(self, namespace: str, service_id: ServiceId[Any]) -> bool:
+        """Check if the plugin might provide a service, without loading the plugin."""
+        if self.namespaces and namespace not in self.namespaces:
+            return False
+
+        return not self.service_ids or service_id in self.service_ids
+
 
 class PythonEntryPointContainer(Container):
     """
     A container that loads plugins using [importlib.metadata.entry_points][].
 
+    Entry points are found using an index shared across processes, see
+    [rats.apps.get_entry_points][].
+
     When looking for groups, the container loads the specified entry_points and defers the lookups
     to the plugins. Plugin containers are expected to be Callable[[Container], Container] objects,
     where the input container is typically the root application container.
 
+    Plugins are only imported once a lookup reaches them. Plugins described by a
+    [rats.apps.PluginManifest][] in the `<group>.manifests` entry point group are only imported
+    when they can provide the service being looked up, while plugins without a manifest are
+    imported by the first lookup.
+
     TODO: How do we better specify the API for plugins without relying on documentation?
     """
 
     _app: Container
     _group: str
     _names: tuple[str, ...]
+    _lock: threading.RLock
+    _plugins: tuple[tuple[EntryPoint, PluginManifest | None], ...] | None
+    _containers: dict[str, Container]
 
     def __init__(self, app: Container, group: str, *names: str) -> None:
         self._app = app
         self._group = group
         self._names = names
+        self._lock = threading.RLock()
+        self._plugins = None
+        self._containers = {}
 
-    def get_namespaced_group(
+    def get_namespaced_providers(
         self,
         namespace: str,
         group_id: ServiceId[T_ServiceType],
-    ) -> Iterator[T_ServiceType]:
-        for container in self._load_containers():
-            yield from container.get_namespaced_group(namespace, group_id)
-
-    @cache  # noqa: B019
-    def _load_containers(self) -> Iterable[Container]:
-        entries = entry_points(group=self._group)
-        return tuple(entry.load()(self._app) for entry in entries if self._is_enabled(entry.name))
+    ) -> Iterator[Provider[T_ServiceType]]:
+        for entry, manifest in self._get_plugins():
+            if manifest is not None and not manifest.provides(namespace, group_id):
+                continue
+
+            yield from self._load_container(entry).get_namespaced_providers(namespace, group_id)
+
+    def _get_plugins(self) -> tuple[tuple[EntryPoint, PluginManifest | None], ...]:
+        with self._lock:
+            if self._plugins is None:
+                manifests = {
+                    entry.name: entry
+                    for entry in get_entry_points(f"{self._group}.manifests")
+                    if self._is_enabled(entry.name)
+                }
+                self._plugins = tuple(
+                    (entry, self._load_manifest(manifests.get(entry.name)))
+                    for entry in get_entry_points(self._group)
+                    if self._is_enabled(entry.name)
+                )
+
+            return self._plugins
+
+    def _load_manifest(self, entry: EntryPoint | None) -> PluginManifest | None:
+        if entry is None:
+            return None
+
+        manifest = entry.load()
+        if not isinstance(manifest, PluginManifest):
+            raise TypeError(
+                f"plugin manifest {entry.name} in {entry.group} is not a PluginManifest: {manifest}"
+            )
+
+        return manifest
+
+    def _load_container(self, entry: EntryPoint) -> Container:
+        with self._lock:
+            if entry.name not in self._containers:
+                logger.debug(f"loading plugin {entry.name} from {self._group}")
+                plugin = entry.load()(self._app)
+                inherit_cache_policy(self, plugin)
+                self._containers[entry.name] = plugin
+
+            return self._containers[entry.name]
+
+    def __rats_apps_created_subcontainers__(self) -> tuple[Container, ...]:
+        """Used by [rats.apps.cache_report][] to walk the tree without loading plugins."""
+        with self._lock:
+            return tuple(self._containers.values())
 
     def _is_enabled(self, plugin_name: str) -> bool:
         return len(self._names) == 0 or plugin_name in self._names
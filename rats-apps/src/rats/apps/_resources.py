@@ -0,0 +1,303 @@
+import contextvars
+import logging
+import os
+import threading
+from collections.abc import Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from pathlib import Path
+from typing import Any, NamedTuple, cast, final
+
+from ._container import (
+    Container,
+    DuplicateServiceError,
+    Provider,
+    ServiceNotFoundError,
+    get_provider_annotations,
+)
+from ._executables import Executable
+from ._ids import ServiceId, T_ExecutableType
+from ._namespaces import ProviderNamespaces
+from ._runtimes import ExceptionGroupCompat, Runtime
+
+logger = logging.getLogger(__name__)
+
+RESOURCES_NAMESPACE = "service-resources"
+
+
+class ResourceHints(NamedTuple):
+    """The resources an executable is expected to use while running, see [rats.apps.resources][]."""
+
+    cpus: float = 1
+    """The number of cores kept busy by the executable."""
+    memory_mb: int = 0
+    """The peak memory allocated by the executable, in megabytes."""
+
+
+DEFAULT_RESOURCE_HINTS = ResourceHints()
+
+
+class MachineCapacity(NamedTuple):
+    """The resources available to the current process, see [rats.apps.detect_capacity][]."""
+
+    cpus: float
+    """The number of cores the process can use."""
+    memory_mb: int | None
+    """The memory the process can use, in megabytes, or `None` if it could not be detected."""
+
+
+def detect_capacity(cgroup_path: str = "/sys/fs/cgroup") -> MachineCapacity:
+    """
+    Detect the cores and memory available to the current process.
+
+    Cores are counted with `os.sched_getaffinity` where available, or `os.cpu_count`, and memory
+    defaults to the physical memory of the machine. Both are further limited by the cgroup v2, or
+    v1, limits found in the given directory, like the ones set on containers.
+
+    Args:
+        cgroup_path: the directory the cgroup file system is mounted on.
+    """
+    cpus = float(len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else 0)
+    cpus = cpus or float(os.cpu_count() or 1)
+    memory_mb = _get_physical_memory_mb()
+
+    root = Path(cgroup_path)
+    cpu_limit = _read_cgroup_cpus(root)
+    if cpu_limit is not None:
+        cpus = min(cpus, cpu_limit)
+
+    memory_limit = _read_cgroup_memory_mb(root)
+    if memory_limit is not None:
+        memory_mb = memory_limit if memory_mb is None else min(memory_mb, memory_limit)
+
+    return MachineCapacity(cpus, memory_mb)
+
+
+def _get_physical_memory_mb() -> int | None:
+    try:
+        return os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") // 2**20
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def _read_cgroup_cpus(root: Path) -> float | None:
+    # cgroup v2 stores "<quota> <period>", with a quota of "max" when unlimited
+    v2 = _read_text(root / "cpu.max")
+    if v2 is not None:
+        quota, _, period = v2.partition(" ")
+        if quota != "max" and period:
+            return int(quota) / int(period)
+        return None
+
+    quota = _read_text(root / "cpu" / "cpu.cfs_quota_us")
+    period = _read_text(root / "cpu" / "cpu.cfs_period_us")
+    if quota is not None and period is not None and int(quota) > 0:
+        return int(quota) / int(period)
+
+    return None
+
+
+def _read_cgroup_memory_mb(root: Path) -> int | None:
+    limit = _read_text(root / "memory.max")
+    if limit is None:
+        limit = _read_text(root / "memory" / "memory.limit_in_bytes")
+
+    # cgroup v1 reports unlimited memory as a very large number
+    if limit is None or limit == "max" or int(limit) >= 2**60:
+        return None
+
+    return int(limit) // 2**20
+
+
+def _read_text(path: Path) -> str | None:
+    try:
+        return path.read_text().strip()
+    except (OSError, ValueError):
+        return None
+
+
+def get_rss_mb() -> int | None:
+    """Sample the resident memory of the current process, in megabytes, where supported."""
+    statm = _read_text(Path("/proc/self/statm"))
+    if statm is None:
+        return None
+
+    return int(statm.split()[1]) * os.sysconf("SC_PAGE_SIZE") // 2**20
+
+
+@final
+class ResourceRuntime(Runtime):
+    """
+    A runtime that runs executables concurrently, within the capacity of the machine.
+
+    Executables declare the cores and memory they use with [rats.apps.resources][], and default to
+    a single core with no memory. An executable is only started when the hints of the running
+    executables, plus its own, fit within the capacity, and while the resident memory of the
+    process, sampled before each start, leaves room for its memory hint. Executables are started
+    in the order they are given, each in its own thread, and one is always started when nothing
+    else is running, so executables larger than the machine still run, on their own.
+
+    Failures stop new executables from being started, and are raised together once the running
+    ones complete, like in [rats.apps.ThreadPoolRuntime][].
+
+    Example:
+        ```python
+        from rats import apps
+
+
+        class ExampleContainer(apps.Container):
+            @apps.group(ExampleServices.SHARDS)
+            @apps.resources(cpus=2, memory_mb=8192)
+            def _shards(self) -> Iterator[apps.Executable]:
+                for shard in range(16):
+                    yield apps.App(partial(process_shard, shard))
+
+
+        apps.ResourceRuntime(ExampleContainer()).execute_group(ExampleServices.SHARDS)
+        ```
+    """
+
+    _app: Container
+    _capacity: MachineCapacity
+    _poll_seconds: float
+
+    def __init__(
+        self,
+        app: Container,
+        capacity: MachineCapacity | None = None,
+        *,
+        poll_seconds: float = 0.1,
+    ) -> None:
+        """
+        Create a runtime executing the services of a container.
+
+        Args:
+            app: the container the executables are retrieved from.
+            capacity: the resources the executables can use; detected with
+                [rats.apps.detect_capacity][] when not provided.
+            poll_seconds: how often the memory of the process is sampled while executables are
+                held back by it.
+        """
+        self._app = app
+        self._capacity = detect_capacity() if capacity is None else capacity
+        self._poll_seconds = poll_seconds
+
+    def execute(self, *exe_ids: ServiceId[T_ExecutableType]) -> None:
+        """Execute a list of executables concurrently, within the capacity of the machine."""
+        providers = (self._get_provider(exe_id) for exe_id in exe_ids)
+        self._execute_all((provider(), _get_hints(provider)) for provider in providers)
+
+    def execute_group(self, *exe_group_ids: ServiceId[T_ExecutableType]) -> None:
+        """
+        Execute every executable in one or more groups, within the capacity of the machine.
+
+        The hints given to a group provider apply to each of the executables it provides.
+        """
+        self._execute_all(
+            (exe, _get_hints(provider))
+            for exe_group_id in exe_group_ids
+            for provider in self._get_group_providers(exe_group_id)
+            for exe in cast(Iterable[Executable], provider())
+        )
+
+    def _get_provider(self, exe_id: ServiceId[Any]) -> Provider[Executable]:
+        providers = self._get_providers(exe_id, ProviderNamespaces.SERVICES)
+        if len(providers) == 0:
+            providers = self._get_providers(exe_id, ProviderNamespaces.FALLBACK_SERVICES)
+
+        if len(providers) > 1:
+            raise DuplicateServiceError(exe_id)
+        elif len(providers) == 0:
+            raise ServiceNotFoundError(exe_id)
+
+        return providers[0]
+
+    def _get_group_providers(self, group_id: ServiceId[Any]) -> list[Provider[Any]]:
+        providers = self._get_providers(group_id, ProviderNamespaces.GROUPS)
+        if len(providers) == 0:
+            providers = self._get_providers(group_id, ProviderNamespaces.FALLBACK_GROUPS)
+
+        return providers
+
+    def _get_providers(self, service_id: ServiceId[Any], namespace: str) -> list[Provider[Any]]:
+        # hints are read from the providers, so plugins behind any container are found
+        return list(self._app.get_namespaced_providers(namespace, service_id))
+
+    def _execute_all(self, exes: Iterable[tuple[Executable, ResourceHints]]) -> None:
+        errors: list[BaseException] = []
+        running: dict[Future[None], ResourceHints] = {}
+
+        def _collect(done: Iterable[Future[None]]) -> None:
+            for future in done:
+                running.pop(future)
+                error = future.exception()
+                if error is not None:
+                    errors.append(error)
+
+        for exe, hints in exes:
+            _collect([future for future in running if future.done()])
+            while (
+                len(running) > 0
+                and len(errors) == 0
+                and not self._can_start(hints, running.values())
+            ):
+                done, _ = wait(running, self._poll_seconds, return_when=FIRST_COMPLETED)
+                _collect(done)
+
+            if len(errors) > 0:
+                break
+
+            running[_start(exe)] = hints
+
+        _collect(wait(running).done)
+
+        if len(errors) > 0:
+            raise ExceptionGroupCompat(f"{len(errors)} executable(s) failed", errors)
+
+    def _can_start(self, hints: ResourceHints, running: Iterable[ResourceHints]) -> bool:
+        reserved = list(running)
+        if sum(h.cpus for h in reserved) + hints.cpus > self._capacity.cpus:
+            return False
+
+        memory_mb = self._capacity.memory_mb
+        if memory_mb is None:
+            return True
+
+        if sum(h.memory_mb for h in reserved) + hints.memory_mb > memory_mb:
+            return False
+
+        rss_mb = get_rss_mb()
+        if rss_mb is not None and rss_mb + hints.memory_mb > memory_mb:
+            logger.debug(f"holding back executable, process is using {rss_mb}MB of {memory_mb}MB")
+            return False
+
+        return True
+
+
+def _start(exe: Executable) -> Future[None]:
+    # a thread per admitted executable, so the capacity is the only limit on what runs at once
+    future: Future[None] = Future()
+    # the executable sees the context of the caller, like the active scope
+    context = contextvars.copy_context()
+
+    def _run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+
+        try:
+            context.run(exe.execute)
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(None)
+
+    threading.Thread(target=_run, name="rats-resources").start()
+    return future
+
+
+def _get_hints(provider: Provider[Any]) -> ResourceHints:
+    hints: list[ResourceHints] = list(get_provider_annotations(provider, RESOURCES_NAMESPACE))
+    if len(hints) == 0:
+        return DEFAULT_RESOURCE_HINTS
+
+    # a method annotated more than once uses the largest of each hint
+    return ResourceHints(max(h.cpus for h in hints), max(h.memory_mb for h in hints))
@@ -1,10 +1,17 @@
+import contextvars
+import inspect
 import logging
+import sys
+import threading
 from abc import abstractmethod
-from collections.abc import Callable
-from typing import Protocol, final
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Protocol, final
 
 from ._container import Container
+from ._executables import AsyncExecutable, Executable
 from ._ids import ServiceId, T_ExecutableType
+from ._shards import FULL_SHARD, Shard
 
 logger = logging.getLogger(__name__)
 
@@ -55,18 +62,170 @@ class NullRuntime(Runtime):
 
 @final
 class StandardRuntime(Runtime):
-    """A simple runtime that executes sequentially and in a single thread."""
+    """
+    A simple runtime that executes sequentially and in a single thread.
+
+    Given a [rats.apps.Shard][], the runtime only executes its slice of the given groups, taken
+    from their members one after the other, allowing several processes, each given a different
+    shard, to split the execution of the same groups.
+    """
 
     _app: Container
+    _shard: Shard
 
-    def __init__(self, app: Container) -> None:
+    def __init__(self, app: Container, shard: Shard = FULL_SHARD) -> None:
         self._app = app
+        self._shard = shard
 
     def execute(self, *exe_ids: ServiceId[T_ExecutableType]) -> None:
         for exe_id in exe_ids:
             self._app.get(exe_id).execute()
 
     def execute_group(self, *exe_group_ids: ServiceId[T_ExecutableType]) -> None:
+        # selected once across the groups, so small groups are not all run by the first shards
+        exes = (exe for exe_group_id in exe_group_ids for exe in self._app.get_group(exe_group_id))
+        for exe in self._shard.select(exes):
+            exe.execute()
+
+
+@final
+class ThreadPoolRuntime(Runtime):
+    """
+    A runtime that executes concurrently, in a pool of threads.
+
+    Both [rats.apps.ThreadPoolRuntime.execute][] and [rats.apps.ThreadPoolRuntime.execute_group][]
+    run the given executables concurrently, so this runtime is mostly useful when the executables
+    spend their time waiting on I/O, like uploads or calls to remote services. Executables are
+    retrieved from the container in the calling thread, and run in no particular order.
+
+    Once any executable fails, the executables that have not started are cancelled, and the ones
+    already running are waited on. Every failure is then raised together, in the order they
+    happened, as an `ExceptionGroup`. On python 3.10, where `ExceptionGroup` does not exist, an
+    `Exception` with the same `exceptions` attribute is raised instead.
+
+    Example:
+        ```python
+        from rats import apps
+
+        runtime = apps.ThreadPoolRuntime(app, max_workers=8)
+        runtime.execute_group(ExampleServices.UPLOADS)
+        ```
+    """
+
+    _app: Container
+    _max_workers: int | None
+
+    def __init__(self, app: Container, max_workers: int | None = None) -> None:
+        """
+        Create a runtime executing the services of a container.
+
+        Args:
+            app: the container the executables are retrieved from.
+            max_workers: the size of the thread pool; uses the python default when not provided.
+        """
+        self._app = app
+        self._max_workers = max_workers
+
+    def execute(self, *exe_ids: ServiceId[T_ExecutableType]) -> None:
+        """Execute a list of executables concurrently."""
+        self._execute_all(self._app.get(exe_id) for exe_id in exe_ids)
+
+    def execute_group(self, *exe_group_ids: ServiceId[T_ExecutableType]) -> None:
+        """Execute every executable in one or more groups concurrently."""
+        self._execute_all(
+            exe for exe_group_id in exe_group_ids for exe in self._app.get_group(exe_group_id)
+        )
+
+    def _execute_all(self, exes: Iterable[Executable]) -> None:
+        lock = threading.Lock()
+        futures: list[Future[None]] = []
+        errors: list[BaseException] = []
+
+        def _on_done(future: Future[None]) -> None:
+            error = None if future.cancelled() else future.exception()
+            if error is None:
+                return
+
+            with lock:
+                errors.append(error)
+                if len(errors) == 1:
+                    logger.debug(f"cancelling pending executables after failure: {error!r}")
+                    for pending in futures:
+                        pending.cancel()
+
+        with ThreadPoolExecutor(self._max_workers, thread_name_prefix="rats-runtime") as executor:
+            for exe in exes:
+                with lock:
+                    if len(errors) > 0:
+                        break
+                    # each executable sees the context of the caller, like the active scope
+                    future = executor.submit(contextvars.copy_context().run, exe.execute)
+                    futures.append(future)
+
+                future.add_done_callback(_on_done)
+
+        if len(errors) > 0:
+            raise ExceptionGroupCompat(f"{len(errors)} executable(s) failed", errors)
+
+
+if sys.version_info >= (3, 11):
+    ExceptionGroupCompat = BaseExceptionGroup  # noqa: F821
+else:
+
+    class ExceptionGroupCompat(Exception):
+        """Stands in for the `ExceptionGroup` class added in python 3.11."""
+
+        message: str
+        exceptions: tuple[BaseException, ...]
+
+        def __init__(self, message: str, exceptions: Iterable[BaseException]) -> None:
+            self.message = message
+            self.exceptions = tuple(exceptions)
+            super().__init__(message, self.exceptions)
+
+
+class AsyncRuntime(Protocol):
+    """
+    The async counterpart of [rats.apps.Runtime][].
+
+    Executables run by async runtimes can implement either [rats.apps.Executable][] or
+    [rats.apps.AsyncExecutable][].
+    """
+
+    @abstractmethod
+    async def execute(self, *exe_ids: ServiceId[Any]) -> None:
+        """Execute a list of executables sequentially."""
+
+    @abstractmethod
+    async def execute_group(self, *exe_group_ids: ServiceId[Any]) -> None:
+        """Execute one or more groups of executables sequentially."""
+
+
+@final
+class AsyncStandardRuntime(AsyncRuntime):
+    """
+    A simple runtime that executes sequentially, within the running event loop.
+
+    Executables are retrieved with [rats.apps.Container.aget][] and
+    [rats.apps.Container.aget_group][], allowing them to be provided by async providers.
+    """
+
+    _app: Container
+
+    def __init__(self, app: Container) -> None:
+        self._app = app
+
+    async def execute(self, *exe_ids: ServiceId[Any]) -> None:
+        for exe_id in exe_ids:
+            await _aexecute(await self._app.aget(exe_id))
+
+    async def execute_group(self, *exe_group_ids: ServiceId[Any]) -> None:
         for exe_group_id in exe_group_ids:
-            for exe in self._app.get_group(exe_group_id):
-                exe.execute()
+            async for exe in self._app.aget_group(exe_group_id):
+                await _aexecute(exe)
+
+
+async def _aexecute(exe: Executable | AsyncExecutable) -> None:
+    result = exe.execute()
+    if inspect.isawaitable(result):
+        await result
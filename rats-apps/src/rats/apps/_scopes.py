@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable, Hashable
+from contextvars import ContextVar, Token
+from types import TracebackType
+from typing import Any, NamedTuple, TypeVar, final
+
+logger = logging.getLogger(__name__)
+T = TypeVar("T")
+
+
+class ServiceLifetimes:
+    """
+    The lifetimes that can be given to services and service groups.
+
+    ```python
+    from rats import apps
+
+
+    class ExampleContainer(apps.Container):
+        @apps.service(ExampleServices.REQUEST_STATE, lifetime=apps.ServiceLifetimes.SCOPED)
+        def _request_state(self) -> RequestState:
+            return RequestState()
+    ```
+    """
+
+    SINGLETON = "singleton"
+    """The default; the service is created once and cached by its container."""
+    TRANSIENT = "transient"
+    """The service is created again every time it is retrieved, and is never cached."""
+    SCOPED = "scoped"
+    """The service is created once per [rats.apps.ServiceScope][], and disposed with it."""
+
+
+LIFETIMES_NAMESPACE = "service-lifetimes"
+
+
+class ServiceLifetime(NamedTuple):
+    """Annotation attached to providers that do not use the default singleton lifetime."""
+
+    name: str
+
+
+@final
+class ServiceScope:
+    """
+    Caches the services with a [rats.apps.ServiceLifetimes.SCOPED][] lifetime.
+
+    Use the scope as a context manager; services retrieved within the block are cached by the
+    scope, and disposed of when the block ends, by calling their `close()` method, or their
+    `__exit__()` method if there is no `close()` method. Scopes follow [contextvars][] semantics,
+    so concurrent asyncio tasks can each run within their own scope.
+
+    ```python
+    from rats import apps
+
+    with apps.ServiceScope():
+        state = app.get(ExampleServices.REQUEST_STATE)
+        assert state is app.get(ExampleServices.REQUEST_STATE)
+
+    # state has been closed, and a new instance is created in the next scope
+    ```
+    """
+
+    _services: dict[tuple[int, Hashable], tuple[object, Any]]
+    _lock: threading.RLock
+    _tokens: list[Token[ServiceScope | None]]
+
+    def __init__(self) -> None:
+        self._services = {}
+        self._lock = threading.RLock()
+        self._tokens = []
+
+    def __enter__(self) -> ServiceScope:
+        self._tokens.append(_CURRENT_SCOPE.set(self))
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        _CURRENT_SCOPE.reset(self._tokens.pop())
+        self.close()
+
+    def get_or_create(self, owner: object, key: Hashable, factory: Callable[[], T]) -> T:
+        """
+        Retrieve a service cached in this scope, calling the factory the first time it is needed.
+
+        Args:
+            owner: the container the service belongs to; kept alive until the scope is closed.
+            key: identifies the service within the owner.
+            factory: creates the service when it is not yet cached.
+        """
+        scope_key = (id(owner), key)
+        if scope_key not in self._services:
+            with self._lock:
+                if scope_key not in self._services:
+                    self._services[scope_key] = (owner, factory())
+
+        return self._services[scope_key][1]
+
+    def close(self) -> None:
+        """Dispose of the services created in this scope, in the reverse order of creation."""
+        with self._lock:
+            services = [service for _, service in reversed(self._services.values())]
+            self._services.clear()
+
+        errors: list[Exception] = []
+        for service in services:
+            # service groups are cached as lists, and each of their services is disposed of
+            instances: list[Any] = service if isinstance(service, list) else [service]  # type: ignore[reportUnknownVariableType]
+            for instance in instances:
+                try:
+                    _dispose(instance)
+                except Exception as e:
+                    logger.exception(f"failed to dispose scoped service: {instance}")
+                    errors.append(e)
+
+        if len(errors) > 0:
+            raise errors[0]
+
+
+class ScopeNotFoundError(RuntimeError):
+    """Raised when a scoped service is retrieved outside of a [rats.apps.ServiceScope][]."""
+
+    def __init__(self, name: str) -> None:
+        super().__init__(f"Scoped service retrieved outside of a service scope: {name}")
+
+
+_CURRENT_SCOPE: ContextVar[ServiceScope | None] = ContextVar(
+    "rats_apps_service_scope",
+    default=None,
+)
+
+
+def get_current_scope(name: str) -> ServiceScope:
+    """Get the active scope, or raise an error naming the service that needed it."""
+    scope = _CURRENT_SCOPE.get()
+    if scope is None:
+        raise ScopeNotFoundError(name)
+
+    return scope
+
+
+def _dispose(instance: Any) -> None:
+    if callable(getattr(instance, "close", None)):
+        instance.close()
+    elif callable(getattr(instance, "__exit__", None)):
+        instance.__exit__(None, None, None)
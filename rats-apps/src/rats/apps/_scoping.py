@@ -1,23 +1,48 @@
+import threading
 from collections.abc import Callable
 from types import FunctionType
-from typing import Any, ParamSpec, TypeVar
+from typing import Any, NamedTuple, ParamSpec, TypeVar, cast
 
-from ._ids import ServiceId
+from ._ids import ServiceId, T_ServiceType
 
 T = TypeVar("T", bound=type)
 P = ParamSpec("P")
 
 
+class ServiceIdOrigin(NamedTuple):
+    """Where a [rats.apps.ServiceId][] scoped by [rats.apps.autoscope][] was declared."""
+
+    module: str
+    """The name of the module defining the class."""
+    qualname: str
+    """The qualified name of the class decorated with [rats.apps.autoscope][]."""
+    attr: str
+    """The name of the class attribute, or static method, returning the service id."""
+
+
 def autoscope(cls: T) -> T:
-    """Decorator to automatically scope ServiceId attributes in a class."""
+    """
+    Decorator to automatically scope ServiceId attributes in a class.
+
+    Scoped service ids are interned, see [rats.apps.intern_service_id][], and the ids returned by
+    the static methods of the class are remembered by name, so calling them repeatedly returns the
+    same instance without formatting the scoped name again. The class and attribute that declared
+    each scoped id can be found with [rats.apps.get_service_id_origin][].
+    """
+
+    def _wrap(prop_name: str, func: Callable[P, Any]) -> Callable[P, Any]:
+        scoped: dict[str, ServiceId[Any]] = {}
 
-    def _wrap(func: Callable[P, Any]) -> Callable[P, Any]:
         def _wrapper(*args: P.args, **kwargs: P.kwargs) -> ServiceId[Any]:
             result = func(*args, **kwargs)
             if not isinstance(result, ServiceId):
                 return result
 
-            return ServiceId[Any](scope_service_name(cls.__module__, cls.__name__, result.name))
+            name = cast(ServiceId[Any], result).name
+            if name not in scoped:
+                scoped[name] = _scope(cls, prop_name, name)
+
+            return scoped[name]
 
         return _wrapper
 
@@ -27,17 +52,72 @@ def autoscope(cls: T) -> T:
         non_ns = getattr(cls, prop_name)
 
         if isinstance(non_ns, FunctionType):
-            setattr(cls, prop_name, _wrap(non_ns))
+            setattr(cls, prop_name, _wrap(prop_name, non_ns))
         else:
             if not isinstance(non_ns, ServiceId):
                 continue
 
-            prop = ServiceId[Any](scope_service_name(cls.__module__, cls.__name__, non_ns.name))
-            setattr(cls, prop_name, prop)
+            setattr(cls, prop_name, _scope(cls, prop_name, cast(ServiceId[Any], non_ns).name))
 
     return cls
 
 
+def intern_service_id(
+    service_id: ServiceId[T_ServiceType],
+    *,
+    register: bool = True,
+) -> ServiceId[T_ServiceType]:
+    """
+    Get the canonical instance of a service id, registering it if it was not seen before.
+
+    Interned ids compare by identity before comparing their names, which makes them cheaper to use
+    as dictionary keys. Ids are interned for the life of the process, so ids read from external
+    data should not be registered, since the registry would keep growing.
+
+    Args:
+        service_id: the id to intern.
+        register: register the id if it was not seen before; otherwise, ids that were not seen
+            before are returned as-is.
+    """
+    if not register:
+        return cast(ServiceId[T_ServiceType], _INTERNED.get(service_id.name, service_id))
+
+    with _REGISTRY_LOCK:
+        return cast(ServiceId[T_ServiceType], _INTERNED.setdefault(service_id.name, service_id))
+
+
+def get_service_id_origin(service_id: ServiceId[Any] | str) -> ServiceIdOrigin | None:
+    """
+    Find the class attribute that declared a service id scoped by [rats.apps.autoscope][].
+
+    Args:
+        service_id: the service id, or its name.
+
+    Returns: the origin of the id, or None for ids that were not created by autoscoped classes.
+    """
+    name = service_id if isinstance(service_id, str) else service_id.name
+    return _ORIGINS.get(name)
+
+
+_REGISTRY_LOCK = threading.Lock()
+_INTERNED: dict[str, ServiceId[Any]] = {}
+_ORIGINS: dict[str, ServiceIdOrigin] = {}
+
+
+def _scope(cls: type, prop_name: str, name: str) -> ServiceId[Any]:
+    scoped_name = scope_service_name(cls.__module__, cls.__name__, name)
+    with _REGISTRY_LOCK:
+        # keeps the first declaration when two classes end up with the same scoped name
+        _ORIGINS.setdefault(
+            scoped_name, ServiceIdOrigin(cls.__module__, cls.__qualname__, prop_name)
+        )
+        if scoped_name not in _INTERNED:
+            # avoids the cost of subscripting the generic class, which makes no runtime difference
+            _INTERNED[scoped_name] = cast(ServiceId[Any], ServiceId(scoped_name))
+
+        return _INTERNED[scoped_name]
+
+
 def scope_service_name(module_name: str, cls_name: str, name: str) -> str:
     """Generate a ServiceId name based on an objects module and class name."""
     return f"{module_name}:{cls_name}[{name}]"
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from typing import TypeVar
+
+T = TypeVar("T")
+
+SHARD_ENV = "RATS_SHARD"
+
+
+@dataclass(frozen=True)
+class Shard:
+    """
+    One of `count` slices of a group, allowing independent processes to split its work.
+
+    Every process given a different shard of the same count selects a different slice of the
+    same group, without any coordination, as long as the group is listed in the same order in
+    every process. Items are assigned to shards round-robin, by their position in the group.
+
+    Example:
+        ```python
+        from rats import apps
+
+        shard = apps.Shard.from_env() or apps.Shard.parse("0/4")
+        for item in shard.select(app.get_group(ExampleServices.ITEMS)):
+            process(item)
+        ```
+    """
+
+    index: int
+    """The position of the shard, starting at zero."""
+    count: int
+    """The number of shards the group is split into."""
+
+    @staticmethod
+    def parse(spec: str) -> Shard:
+        """
+        Create a shard from its `index/count` representation, like `0/4`.
+
+        Raises:
+            ValueError: if the spec is malformed, or the index is not between 0 and `count - 1`.
+        """
+        index, sep, count = spec.partition("/")
+        if not sep or not index.strip().isdigit() or not count.strip().isdigit():
+            raise ValueError(f"invalid shard, expected index/count, like 0/4: {spec!r}")
+
+        return Shard(int(index), int(count))
+
+    def __post_init__(self) -> None:
+        if self.count < 1 or not 0 <= self.index < self.count:
+            raise ValueError(f"invalid shard, the index must be within 0 and count - 1: {self}")
+
+    @staticmethod
+    def from_env(environ: Mapping[str, str] | None = None) -> Shard | None:
+        """
+        Find the shard of the current process in the environment variables.
+
+        The `RATS_SHARD` variable is used first, in the same format as [rats.apps.Shard.parse][],
+        followed by the `RANK` and `WORLD_SIZE` variables set by distributed launchers like
+        `torchrun`.
+
+        Args:
+            environ: the variables to read; defaults to `os.environ`.
+
+        Returns: the shard of the process, or `None` if the variables are not set.
+        """
+        env = os.environ if environ is None else environ
+        spec = env.get(SHARD_ENV)
+        if spec:
+            return Shard.parse(spec)
+
+        rank = env.get("RANK")
+        world_size = env.get("WORLD_SIZE")
+        if rank and world_size:
+            return Shard.parse(f"{rank}/{world_size}")
+
+        return None
+
+    def contains(self, position: int) -> bool:
+        """Check if the item at the given position of a group belongs to this shard."""
+        return position % self.count == self.index
+
+    def select(self, items: Iterable[T]) -> Iterator[T]:
+        """Yield the items of a group that belong to this shard, consuming the group lazily."""
+        for position, item in enumerate(items):
+            if self.contains(position):
+                yield item
+
+    def __str__(self) -> str:
+        return f"{self.index}/{self.count}"
+
+
+FULL_SHARD = Shard(0, 1)
+"""The only shard of a group split into one, selecting every item."""
@@ -1,4 +1,6 @@
-from collections.abc import Iterator
+import asyncio
+import threading
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass
 from typing import Any, Generic
 
@@ -6,6 +8,8 @@ from ._container import Container, Provider
 from ._ids import ServiceId, T_ServiceType
 from ._namespaces import ProviderNamespaces
 
+_MISSING = object()
+
 
 @dataclass(frozen=True)
 class StaticProvider(Generic[T_ServiceType]):
@@ -15,19 +19,99 @@ class StaticProvider(Generic[T_ServiceType]):
 
 
 class StaticContainer(Container):
-    _providers: tuple[StaticProvider[Any], ...]
+    """
+    A container providing services from a fixed set of [rats.apps.StaticProvider][] instances.
+
+    Providers are indexed by namespace and service id when the container is created, so lookups
+    take the same time regardless of how many providers the container holds. By default, the
+    providers are called every time their services are retrieved. With `memoize=True`, each
+    provider is called once, and its result is reused like the services of annotated container
+    methods with the default [rats.apps.ServiceLifetimes.SINGLETON][] lifetime: group providers
+    are consumed into a list, and async providers are awaited once.
+    """
+
+    _index: dict[tuple[str, ServiceId[Any]], tuple[Provider[Any], ...]]
+
+    def __init__(self, *providers: StaticProvider[Any], memoize: bool = False) -> None:
+        index: dict[tuple[str, ServiceId[Any]], list[Provider[Any]]] = {}
+        for provider in providers:
+            call = _MemoizedProvider(provider) if memoize else provider.call
+            index.setdefault((provider.namespace, provider.service_id), []).append(call)
 
-    def __init__(self, *providers: StaticProvider[Any]) -> None:
-        self._providers = providers
+        self._index = {key: tuple(calls) for key, calls in index.items()}
 
-    def get_namespaced_group(
+    def get_namespaced_providers(
         self,
         namespace: str,
         group_id: ServiceId[T_ServiceType],
-    ) -> Iterator[T_ServiceType]:
-        for provider in self._providers:
-            if provider.namespace == namespace and provider.service_id == group_id:
-                yield provider.call()
+    ) -> Iterator[Provider[T_ServiceType]]:
+        yield from self._index.get((namespace, group_id), ())
+
+
+class _MemoizedProvider(Generic[T_ServiceType]):
+    _provider: StaticProvider[T_ServiceType]
+    _lock: threading.Lock
+    _tasks: dict[asyncio.AbstractEventLoop, asyncio.Future[Any]]
+    _value: Any
+
+    def __init__(self, provider: StaticProvider[T_ServiceType]) -> None:
+        self._provider = provider
+        self._lock = threading.Lock()
+        self._tasks = {}
+        self._value = _MISSING
+
+    def __call__(self) -> Any:
+        namespace = self._provider.namespace
+        if namespace in [ProviderNamespaces.ASYNC_SERVICES, ProviderNamespaces.ASYNC_GROUPS]:
+            return self._aget()
+
+        if self._value is _MISSING:
+            with self._lock:
+                if self._value is _MISSING:
+                    value: Any = self._provider.call()
+                    if namespace in [
+                        ProviderNamespaces.GROUPS,
+                        ProviderNamespaces.FALLBACK_GROUPS,
+                    ]:
+                        value = list(value)
+                    self._value = value
+
+        return self._value
+
+    async def _aget(self) -> Any:
+        if self._value is not _MISSING:
+            return self._value
+
+        # concurrent callers in the same event loop wait on the same task instead of calling the
+        # provider again; tasks can not be awaited from other loops, so each loop gets its own
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            task = self._tasks.get(loop)
+            if task is None:
+                task = asyncio.ensure_future(self._acreate())
+                self._tasks[loop] = task
+
+        return await asyncio.shield(task)
+
+    async def _acreate(self) -> Any:
+        # async providers return awaitables, or async iterators for groups
+        call: Callable[[], Any] = self._provider.call
+        loop = asyncio.get_running_loop()
+        try:
+            if self._provider.namespace == ProviderNamespaces.ASYNC_SERVICES:
+                value = await call()
+            else:
+                value = [x async for x in call()]
+
+            with self._lock:
+                # another event loop might have created the value first, and every caller gets it
+                if self._value is _MISSING:
+                    self._value = value
+        finally:
+            with self._lock:
+                self._tasks.pop(loop, None)
+
+        return self._value
 
 
 def static_service(
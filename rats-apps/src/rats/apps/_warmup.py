@@ -0,0 +1,99 @@
+import contextvars
+import logging
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, NamedTuple
+
+from ._container import Container
+from ._ids import ServiceId
+from ._namespaces import ProviderNamespaces
+
+logger = logging.getLogger(__name__)
+
+
+class ServiceTiming(NamedTuple):
+    """The time it took to retrieve a service, or service group, from a container."""
+
+    service_id: ServiceId[Any]
+    """The id of the retrieved service or service group."""
+    namespace: str
+    """Either `ProviderNamespaces.SERVICES` or `ProviderNamespaces.GROUPS`."""
+    seconds: float
+    """Wall time spent retrieving the service, including any time waiting on its dependencies."""
+
+
+def warmup(
+    app: Container,
+    *service_ids: ServiceId[Any],
+    group_ids: Iterable[ServiceId[Any]] = (),
+    max_workers: int | None = None,
+) -> tuple[ServiceTiming, ...]:
+    """
+    Concurrently retrieve a set of services and service groups to fill the container caches.
+
+    Services are retrieved from a thread pool, so this is mostly useful when the services spend
+    their construction time waiting on I/O, like loading credentials or configuration. Once
+    warmed up, the same instances are returned by calls to [rats.apps.Container.get][] and
+    [rats.apps.Container.get_group][].
+
+    Example:
+        ```python
+        from rats import apps
+
+        app = apps.AppBundle(app_plugin=Application)
+        for timing in apps.warmup(app, AppServices.CLIENT, group_ids=[AppServices.CONFIGS]):
+            print(f"{timing.service_id.name}: {timing.seconds:.3f}s")
+        app.execute()
+        ```
+
+    Args:
+        app: the container the services are retrieved from.
+        *service_ids: the services to retrieve with [rats.apps.Container.get][].
+        group_ids: the service groups to retrieve with [rats.apps.Container.get_group][].
+        max_workers: the size of the thread pool; uses the python default when not provided.
+
+    Returns: the time spent retrieving each service, in the order they were requested.
+    """
+
+    def _get_service(service_id: ServiceId[Any]) -> None:
+        app.get(service_id)
+
+    def _get_group(group_id: ServiceId[Any]) -> None:
+        list(app.get_group(group_id))
+
+    def _timed(
+        service_id: ServiceId[Any],
+        namespace: str,
+        get: Callable[[ServiceId[Any]], None],
+    ) -> ServiceTiming:
+        start = time.perf_counter()
+        get(service_id)
+        timing = ServiceTiming(service_id, namespace, time.perf_counter() - start)
+        logger.debug(f"warmed up {namespace} {service_id.name} in {timing.seconds:.3f}s")
+        return timing
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            *[
+                executor.submit(
+                    contextvars.copy_context().run,
+                    _timed,
+                    service_id,
+                    ProviderNamespaces.SERVICES,
+                    _get_service,
+                )
+                for service_id in service_ids
+            ],
+            *[
+                executor.submit(
+                    contextvars.copy_context().run,
+                    _timed,
+                    group_id,
+                    ProviderNamespaces.GROUPS,
+                    _get_group,
+                )
+                for group_id in group_ids
+            ],
+        ]
+        return tuple(future.result() for future in futures)
@@ -5,6 +5,8 @@ from typing import Any, Protocol, final
 
 import click
 
+from rats import annotations as anns
+
 from ._annotations import get_class_commands
 
 logger = logging.getLogger(__name__)
@@ -32,6 +34,11 @@ class Container(Protocol):
         ```
     """
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Collect the annotated commands of each container class when the class is defined."""
+        super().__init_subclass__(**kwargs)
+        anns.register_class(cls)
+
     def attach(self, group: click.Group) -> None:
         """
         Attach this container's provided cli commands to the provided [click.Group][].
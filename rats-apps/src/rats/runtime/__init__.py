@@ -52,12 +52,14 @@ Our example application looks for any context services, which can be provided to
 """
 
 from ._app import Application, AppServices, main
+from ._process_pool import ProcessPoolRuntime
 from ._request import DuplicateRequestError, Request, RequestNotFoundError
 
 __all__ = [
     "AppServices",
     "Application",
     "DuplicateRequestError",
+    "ProcessPoolRuntime",
     "Request",
     "RequestNotFoundError",
     "main",
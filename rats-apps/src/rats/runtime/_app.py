@@ -3,9 +3,6 @@ from __future__ import annotations
 import json
 import logging
 import sys
-from collections.abc import Iterator
-from functools import cache
-from importlib import metadata
 from importlib.metadata import EntryPoint
 from pathlib import Path
 from typing import Any, final
@@ -40,6 +37,27 @@ class AppServices:
                 print(f"{item.service_id} -> {item.values}")
     ```
     """
+    SHARD = apps.ServiceId[apps.Shard]("shard")
+    """
+    The [rats.apps.Shard][] of the work the application run using `rats-runtime run` should do.
+
+    Given with the `--shard i/N` option, or found by [rats.apps.Shard.from_env][] when the option
+    is not used, and [rats.apps.FULL_SHARD][] otherwise. Pass it to [rats.apps.StandardRuntime][],
+    or select the slice of a group of context values, so processes started with different shards
+    split the work between them.
+
+    ```python
+    from rats import apps, runtime
+
+
+    class Application(apps.AppContainer, apps.PluginMixin):
+        def execute(self) -> None:
+            shard = self._app.get(runtime.AppServices.SHARD)
+            apps.StandardRuntime(self._app, shard).execute_group(ExampleServices.JOBS)
+            for data in shard.select(self._app.get_group(ExampleServices.EXAMPLE_DATA)):
+                print(f"processing {data}")
+    ```
+    """
     REQUEST = apps.ServiceId[Request]("runtime-details-client")
     """
     The request information, available after the call to [rats.runtime.Application.execute][].
@@ -88,7 +106,16 @@ class Application(apps.AppContainer, cli.Container, apps.PluginMixin):
     @click.argument("app-ids", nargs=-1)
     @click.option("--context", default="{}")
     @click.option("--context-file")
-    def _run(self, app_ids: tuple[str, ...], context: str, context_file: str | None) -> None:
+    @click.option(
+        "--shard", help="Only run a slice of the groups, given as index/count, like 0/4."
+    )
+    def _run(
+        self,
+        app_ids: tuple[str, ...],
+        context: str,
+        context_file: str | None,
+        shard: str | None,
+    ) -> None:
         """Run one or more apps, adding an optional additional context."""
         if self._request is not None:
             print(self._request)
@@ -103,6 +130,12 @@ class Application(apps.AppContainer, cli.Container, apps.PluginMixin):
             data = yaml.safe_load(p.read_text())
             ctx_collection = ctx_collection.merge(app_context.loads(json.dumps(data)))
 
+        app_shard = (
+            apps.Shard.parse(shard) if shard else apps.Shard.from_env()
+        ) or apps.FULL_SHARD
+        if app_shard != apps.FULL_SHARD:
+            logger.info(f"running shard {app_shard}")
+
         self._request = Request(
             app_ids=app_ids,
             context=ctx_collection,
@@ -117,6 +150,11 @@ class Application(apps.AppContainer, cli.Container, apps.PluginMixin):
                         service_id=AppServices.CONTEXT,
                         call=lambda: ctx,
                     ),
+                    apps.StaticProvider(
+                        namespace=apps.ProviderNamespaces.SERVICES,
+                        service_id=AppServices.SHARD,
+                        call=lambda: app_shard,
+                    ),
                 ),
             )
 
@@ -134,9 +172,8 @@ class Application(apps.AppContainer, cli.Container, apps.PluginMixin):
 
         raise RuntimeError(f"rats app-id not found: {name}")
 
-    @cache  # noqa: B019
-    def _get_app_entrypoints(self) -> Iterator[EntryPoint]:
-        yield from metadata.entry_points(group="rats.runtime.apps")
+    def _get_app_entrypoints(self) -> tuple[EntryPoint, ...]:
+        return apps.get_entry_points("rats.runtime.apps")
 
     @apps.service(AppServices.REQUEST)
     def _request_provider(self) -> Request:
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import multiprocessing.context
+from concurrent.futures import FIRST_EXCEPTION, Future, ProcessPoolExecutor, wait
+from itertools import islice
+from typing import Any, final
+
+from rats import app_context, apps
+
+from ._app import AppServices
+
+# the application of each worker process, created once by the pool initializer
+_WORKER_APPS: list[apps.AppContainer] = []
+
+
+@final
+class ProcessPoolRuntime(apps.Runtime):
+    """
+    A runtime that executes services in a pool of worker processes.
+
+    Each worker process creates its own application from the given [rats.apps.AppPlugin][], along
+    with the [rats.app_context.Collection][] of the parent process, made available through
+    [rats.runtime.AppServices.CONTEXT][]. Workers are started on first use and kept running across
+    calls, so the application of each worker is only created once, until the runtime is shut down.
+
+    Only service ids are sent to the workers, so the plugin must be picklable, like a class or a
+    function defined at the top level of a module. Executables run in no particular order. Once
+    any of them fails, the ones that have not started are cancelled, and every failure is raised
+    in a [rats.apps.ExceptionGroupCompat][] after the running ones complete.
+
+    Example:
+        ```python
+        from rats import app_context, runtime
+
+        with runtime.ProcessPoolRuntime(Application, context, max_workers=4) as pool:
+            pool.execute_group(AppServices.SHARDS)
+        ```
+    """
+
+    _app_plugin: apps.AppPlugin
+    _context: app_context.Collection[Any]
+    _max_workers: int | None
+    _mp_context: multiprocessing.context.BaseContext | None
+    _executor: ProcessPoolExecutor | None
+
+    def __init__(
+        self,
+        app_plugin: apps.AppPlugin,
+        context: app_context.Collection[Any] = app_context.EMPTY_COLLECTION,
+        *,
+        max_workers: int | None = None,
+        mp_context: multiprocessing.context.BaseContext | None = None,
+    ) -> None:
+        """
+        Create a runtime executing the services of an application in worker processes.
+
+        Args:
+            app_plugin: the picklable plugin creating the application in each worker.
+            context: the context made available to the application in each worker.
+            max_workers: the number of worker processes; uses the python default when not provided.
+            mp_context: the multiprocessing context used to start the workers.
+        """
+        self._app_plugin = app_plugin
+        self._context = context
+        self._max_workers = max_workers
+        self._mp_context = mp_context
+        self._executor = None
+
+    def execute(self, *exe_ids: apps.ServiceId[apps.T_ExecutableType]) -> None:
+        """Execute a list of executables concurrently, in the worker processes."""
+        executor = self._get_executor()
+        self._wait([executor.submit(_execute, exe_id) for exe_id in exe_ids])
+
+    def execute_group(self, *exe_group_ids: apps.ServiceId[apps.T_ExecutableType]) -> None:
+        """
+        Execute every executable in one or more groups concurrently, in the worker processes.
+
+        Executables can not be sent between processes, so each worker retrieves the group and
+        executes the member at a given position. Groups must list their executables in the same
+        order in every process.
+        """
+        executor = self._get_executor()
+        sizes = [executor.submit(_count_group, group_id) for group_id in exe_group_ids]
+        self._wait(sizes)
+        self._wait([
+            executor.submit(_execute_group_member, group_id, index)
+            for group_id, size in zip(exe_group_ids, sizes, strict=True)
+            for index in range(size.result())
+        ])
+
+    def shutdown(self) -> None:
+        """Stop the worker processes, waiting for any pending executables."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> ProcessPoolRuntime:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.shutdown()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                self._max_workers,
+                mp_context=self._mp_context,
+                initializer=_init_worker,
+                initargs=(self._app_plugin, app_context.dumps(self._context)),
+            )
+
+        return self._executor
+
+    def _wait(self, futures: list[Future[Any]]) -> None:
+        _, pending = wait(futures, return_when=FIRST_EXCEPTION)
+        for future in pending:
+            future.cancel()
+        wait(futures)
+
+        errors = [f.exception() for f in futures if not f.cancelled()]
+        failures = [error for error in errors if error is not None]
+        if len(failures) > 0:
+            raise apps.ExceptionGroupCompat(f"{len(failures)} executable(s) failed", failures)
+
+
+def _init_worker(app_plugin: apps.AppPlugin, context: str) -> None:
+    ctx = app_context.loads(context)
+    _WORKER_APPS.append(
+        apps.AppBundle(
+            app_plugin=app_plugin,
+            context=apps.StaticContainer(
+                apps.static_service(AppServices.CONTEXT, lambda: ctx),
+            ),
+        )
+    )
+
+
+def _execute(exe_id: apps.ServiceId[Any]) -> None:
+    _WORKER_APPS[0].get(exe_id).execute()
+
+
+def _count_group(group_id: apps.ServiceId[Any]) -> int:
+    return sum(1 for _ in _WORKER_APPS[0].get_group(group_id))
+
+
+def _execute_group_member(group_id: apps.ServiceId[Any], index: int) -> None:
+    for exe in islice(_WORKER_APPS[0].get_group(group_id), index, index + 1):
+        exe.execute()
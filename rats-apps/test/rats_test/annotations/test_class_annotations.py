@@ -0,0 +1,163 @@
+import gc
+import weakref
+from typing import Any, NamedTuple
+
+from rats import annotations, apps
+
+
+class _Id(NamedTuple):
+    name: str
+
+
+class _Base(apps.Container):
+    property_reads: int = 0
+
+    @property
+    def expensive(self) -> str:
+        type(self).property_reads += 1
+        return "expensive"
+
+    @annotations.annotation("example", _Id("b"))
+    def _b(self) -> None:
+        pass
+
+    @annotations.annotation("example", _Id("overridden"))
+    def _overridden(self) -> None:
+        pass
+
+    @staticmethod
+    @annotations.annotation("example", _Id("static"))
+    def _static() -> None:
+        pass
+
+
+class _Child(_Base):
+    @annotations.annotation("example", _Id("a"))
+    def _a(self) -> None:
+        pass
+
+    def _overridden(self) -> None:
+        pass
+
+
+class _Unregistered:
+    @annotations.annotation("example", _Id("a"))
+    def _a(self) -> None:
+        pass
+
+
+class TestClassAnnotations:
+    def test_annotations_are_collected_at_class_definition(self) -> None:
+        assert "__rats_class_annotations__" in vars(_Child)
+        tates = annotations.get_class_annotations(_Child)
+
+        assert tates is vars(_Child)["__rats_class_annotations__"]
+        assert [(x.name, x.groups) for x in tates.annotations] == [
+            ("_a", (_Id("a"),)),
+            ("_b", (_Id("b"),)),
+            ("_static", (_Id("static"),)),
+        ]
+        assert [x.name for x in annotations.get_class_annotations(_Base).annotations] == [
+            "_b",
+            "_overridden",
+            "_static",
+        ]
+
+    def test_descriptors_are_not_triggered(self) -> None:
+        class _Late(_Base):
+            pass
+
+        annotations.get_class_annotations(_Late)
+        assert _Base.property_reads == 0
+
+    def test_unregistered_classes(self) -> None:
+        class _UnregisteredChild(_Unregistered):
+            pass
+
+        tates = annotations.get_class_annotations(_UnregisteredChild)
+        assert [x.name for x in tates.annotations] == ["_a"]
+        assert "__rats_class_annotations__" not in vars(_UnregisteredChild)
+
+
+class _Grouped:
+    @annotations.annotation("example", _Id("x"))
+    @annotations.annotation("example", _Id("y"))
+    @annotations.annotation("other", _Id("x"))
+    def _first(self) -> None:
+        pass
+
+    @annotations.annotation("example", _Id("y"))
+    def _second(self) -> None:
+        pass
+
+
+class TestAnnotationsContainer:
+    def test_queries(self) -> None:
+        tates = annotations.get_class_annotations(_Grouped)
+
+        assert [x.name for x in tates.with_namespace("example").annotations] == [
+            "_first",
+            "_second",
+        ]
+        assert [x.name for x in tates.with_group("example", _Id("x")).annotations] == ["_first"]
+        assert [x.name for x in tates.with_group("example", _Id("y")).annotations] == [
+            "_first",
+            "_second",
+        ]
+        assert [x.namespace for x in tates.with_group("other", _Id("x")).annotations] == ["other"]
+        assert tates.with_group("other", _Id("y")) == annotations.AnnotationsContainer.empty()
+        assert tates.with_namespace("missing") == annotations.AnnotationsContainer.empty()
+
+    def test_queries_are_remembered(self) -> None:
+        tates = annotations.get_class_annotations(_Grouped)
+
+        assert tates.with_namespace("example") is tates.with_namespace("example")
+        assert tates.with_group("example", _Id("y")) is tates.with_group("example", _Id("y"))
+
+
+def _provider(self: Any) -> None:
+    pass
+
+
+def _create_dynamic_classes(i: int) -> tuple[weakref.ref[type], ...]:
+    @annotations.annotation("example", _Id(f"id-{i}"))
+    def _method(self: Any) -> None:
+        pass
+
+    container_class = type(f"_Dynamic{i}", (apps.Container,), {"_provider": _method})
+    plain_class = type(f"_Plain{i}", (), {"_provider": _method})
+    assert len(annotations.get_class_annotations(container_class).annotations) == 1
+    assert len(annotations.get_class_annotations(plain_class).annotations) == 1
+
+    return weakref.ref(container_class), weakref.ref(plain_class)
+
+
+class TestClassAnnotationsMemory:
+    def test_dynamic_classes_are_not_kept_alive(self) -> None:
+        refs = [ref for i in range(2000) for ref in _create_dynamic_classes(i)]
+        gc.collect()
+
+        assert [ref for ref in refs if ref() is not None] == []
+
+    def test_invalidation(self) -> None:
+        class _Registered(apps.Container):
+            pass
+
+        class _Plain:
+            pass
+
+        assert annotations.get_class_annotations(_Registered).annotations == ()
+        assert annotations.get_class_annotations(_Plain).annotations == ()
+
+        method = annotations.annotation("example", _Id("late"))(_provider)
+        setattr(_Registered, "_late", method)  # noqa: B010
+        setattr(_Plain, "_late", method)  # noqa: B010
+        assert annotations.get_class_annotations(_Registered).annotations == ()
+        assert annotations.get_class_annotations(_Plain).annotations == ()
+
+        annotations.invalidate_class_annotations(_Registered)
+        assert len(annotations.get_class_annotations(_Registered).annotations) == 1
+        assert annotations.get_class_annotations(_Plain).annotations == ()
+
+        annotations.invalidate_class_annotations()
+        assert len(annotations.get_class_annotations(_Plain).annotations) == 1
@@ -0,0 +1,130 @@
+import os
+import sys
+from pathlib import Path
+from typing import NamedTuple
+
+import pytest
+
+from rats import annotations
+
+
+class FruitId(NamedTuple):
+    name: str
+
+
+_FRUITS = """
+from rats import annotations
+from rats_test.annotations.test_discovery import FruitId
+
+
+@annotations.annotation("fruits", FruitId("apple"))
+def apple() -> None:
+    pass
+
+
+@annotations.annotation("fruits", FruitId("banana"))
+class Banana:
+    @annotations.annotation("fruits", FruitId("apple"))
+    @annotations.annotation("vegetables", FruitId("carrot"))
+    def cherry(self) -> None:
+        pass
+
+    @staticmethod
+    def plain() -> None:
+        pass
+"""
+
+# importing these modules fails, proving they were never imported
+_UNDECORATED = """
+raise RuntimeError("not expected to be imported")
+
+
+class Plain:
+    @property
+    def value(self) -> int:
+        return 1
+"""
+
+
+class TestDiscovery:
+    @pytest.fixture(autouse=True)
+    def _package(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        self._root = tmp_path / "rats_discovery_example"
+        (self._root / "nested").mkdir(parents=True)
+        (self._root / "__init__.py").write_text("")
+        (self._root / "fruits.py").write_text(_FRUITS)
+        (self._root / "undecorated.py").write_text(_UNDECORATED)
+        (self._root / "__main__.py").write_text(_UNDECORATED + "\n@decorated\ndef x(): ...\n")
+        (self._root / "nested" / "more_fruits.py").write_text(
+            _FRUITS.replace('"apple"', '"grape"')
+        )
+        monkeypatch.setattr(sys, "path", [str(tmp_path), *sys.path])
+        monkeypatch.setattr(sys, "dont_write_bytecode", True)
+        for name in list(sys.modules):
+            if name.startswith("rats_discovery_example"):
+                monkeypatch.delitem(sys.modules, name)
+
+    def test_discover(self) -> None:
+        fruits = annotations.discover("rats_discovery_example", "fruits")
+
+        assert fruits.namespace == "fruits"
+        assert [(x.module, x.qualname) for x in fruits.annotations] == [
+            ("rats_discovery_example.fruits", "apple"),
+            ("rats_discovery_example.fruits", "Banana"),
+            ("rats_discovery_example.fruits", "Banana.cherry"),
+            ("rats_discovery_example.nested.more_fruits", "apple"),
+            ("rats_discovery_example.nested.more_fruits", "Banana"),
+            ("rats_discovery_example.nested.more_fruits", "Banana.cherry"),
+        ]
+        assert [x.qualname for x in fruits.with_group(FruitId("apple"))] == [
+            "apple",
+            "Banana.cherry",
+        ]
+        assert set(fruits.group_ids()) == {FruitId("apple"), FruitId("banana"), FruitId("grape")}
+        assert fruits.with_group(FruitId("missing")) == ()
+        assert "rats_discovery_example.undecorated" not in sys.modules
+
+    def test_modules_are_scanned_again_when_changed(self) -> None:
+        assert annotations.discover("rats_discovery_example", "vegetables").with_group(
+            FruitId("carrot")
+        )
+        path = self._root / "undecorated.py"
+        path.write_text(_FRUITS)
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        found = annotations.discover("rats_discovery_example", "vegetables")
+        assert {x.module for x in found.annotations} == {
+            "rats_discovery_example.fruits",
+            "rats_discovery_example.nested.more_fruits",
+            "rats_discovery_example.undecorated",
+        }
+
+    def test_modules_without_the_given_decorators_are_not_imported(self) -> None:
+        (self._root / "ordering.py").write_text(
+            _UNDECORATED.replace("@property", "@functools.total_ordering")
+        )
+
+        found = annotations.discover(
+            "rats_discovery_example",
+            "fruits",
+            decorators=["annotations.annotation"],
+        )
+
+        assert len(found.annotations) == 6
+        assert "rats_discovery_example.ordering" not in sys.modules
+        with pytest.raises(RuntimeError):
+            annotations.discover("rats_discovery_example", "fruits")
+
+    def test_unchanged_modules_are_not_scanned_again(self) -> None:
+        first = annotations.discover("rats_discovery_example", "fruits")
+        del sys.modules["rats_discovery_example.fruits"]
+
+        second = annotations.discover("rats_discovery_example", "fruits")
+
+        assert second.annotations == first.annotations
+        assert "rats_discovery_example.fruits" not in sys.modules
+
+    def test_missing_package(self) -> None:
+        with pytest.raises(ModuleNotFoundError):
+            annotations.discover("rats_discovery_missing", "fruits")
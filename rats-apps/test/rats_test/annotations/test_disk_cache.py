@@ -0,0 +1,124 @@
+import importlib
+import os
+import sys
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+from rats import annotations
+
+_SOURCE = """
+from rats import apps
+
+
+class ExampleContainer(apps.Container):
+    @apps.service(apps.ServiceId[str]("example"))
+    def _example(self) -> str:
+        return "example"
+"""
+
+
+_IDS_SOURCE = """
+from rats import apps
+
+
+class ExampleIds:
+    EXAMPLE = apps.ServiceId[str]("{name}")
+"""
+
+_IDS_CONSUMER_SOURCES = [
+    """
+from rats import apps
+from rats_disk_cache_ids import ExampleIds
+
+
+class ExampleContainer(apps.Container):
+    @apps.service(ExampleIds.EXAMPLE)
+    def _example(self) -> str:
+        return "example"
+""",
+    """
+from rats import apps
+import rats_disk_cache_ids
+
+
+class ExampleContainer(apps.Container):
+    @apps.service(rats_disk_cache_ids.ExampleIds.EXAMPLE)
+    def _example(self) -> str:
+        return "example"
+""",
+]
+
+
+def _import(name: str) -> ModuleType:
+    sys.modules.pop(name, None)
+    importlib.invalidate_caches()
+    return importlib.import_module(name)
+
+
+def _provider_names(module: ModuleType) -> list[str]:
+    tates = annotations.get_class_annotations(module.ExampleContainer)
+    return [x.name for x in tates.annotations]
+
+
+def _service_names(module: ModuleType) -> list[str]:
+    tates = annotations.get_class_annotations(module.ExampleContainer)
+    return [group.name for x in tates.annotations for group in x.groups]
+
+
+def _write_source(path: Path, source: str, mtime_ns: int | None = None) -> None:
+    path.write_text(source)
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class TestDiskCache:
+    @pytest.fixture(autouse=True)
+    def _module_dir(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        self._module_path = tmp_path / "rats_disk_cache_example.py"
+        self._cache_dir = tmp_path / "cache"
+        monkeypatch.setattr(sys, "path", [str(tmp_path), *sys.path])
+        # python would otherwise reuse the bytecode of the edited source, like we do
+        monkeypatch.setattr(sys, "dont_write_bytecode", True)
+        monkeypatch.setenv("RATS_ANNOTATIONS_CACHE_DIR", str(self._cache_dir))
+
+    def test_annotations_are_loaded_from_disk(self) -> None:
+        _write_source(self._module_path, _SOURCE)
+        mtime_ns = self._module_path.stat().st_mtime_ns
+        assert _provider_names(_import("rats_disk_cache_example")) == ["_example"]
+        annotations.flush_disk_cache()
+        assert len(list(self._cache_dir.glob("rats_disk_cache_example.*"))) == 1
+
+        # same size and modification time, so the stale annotations are loaded from the cache
+        _write_source(self._module_path, _SOURCE.replace("_example", "_exampl_"), mtime_ns)
+        assert _provider_names(_import("rats_disk_cache_example")) == ["_example"]
+
+        _write_source(self._module_path, _SOURCE.replace("_example", "_exampl_"), mtime_ns + 1)
+        assert _provider_names(_import("rats_disk_cache_example")) == ["_exampl_"]
+
+    def test_disabled_by_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("RATS_ANNOTATIONS_CACHE_DIR")
+        _write_source(self._module_path, _SOURCE)
+        assert _provider_names(_import("rats_disk_cache_example")) == ["_example"]
+        annotations.flush_disk_cache()
+
+        assert not self._cache_dir.exists()
+
+    @pytest.mark.parametrize("source", _IDS_CONSUMER_SOURCES)
+    def test_imported_modules_invalidate_the_cache(self, source: str) -> None:
+        ids_path = self._module_path.with_name("rats_disk_cache_ids.py")
+        _write_source(ids_path, _IDS_SOURCE.format(name="old-name"))
+        _write_source(self._module_path, source)
+        sys.modules.pop("rats_disk_cache_ids", None)
+        assert _service_names(_import("rats_disk_cache_example")) == ["old-name"]
+        annotations.flush_disk_cache()
+
+        mtime_ns = ids_path.stat().st_mtime_ns
+        _write_source(ids_path, _IDS_SOURCE.format(name="new-name"), mtime_ns + 1)
+        sys.modules.pop("rats_disk_cache_ids", None)
+        module = _import("rats_disk_cache_example")
+
+        assert _service_names(module) == ["new-name"]
+        ids = sys.modules["rats_disk_cache_ids"]
+        assert module.ExampleContainer().has(ids.ExampleIds.EXAMPLE)
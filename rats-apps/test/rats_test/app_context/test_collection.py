@@ -31,3 +31,17 @@ class TestCollection:
         loaded = app_context.loads(json_string)
         ctx = loaded.decoded_values(ExampleConfig, TestServices.CONTEXT_1)
         assert ctx[0] == self._context
+
+    def test_loaded_ids_are_not_interned(self) -> None:
+        unknown = apps.ServiceId[ExampleConfig]("test-collection-unknown")
+        collection = app_context.Collection[ExampleConfig].make(
+            app_context.Context[ExampleConfig].make(TestServices.CONTEXT_1, self._context),
+            app_context.Context[ExampleConfig].make(unknown, self._context),
+        )
+
+        loaded = app_context.loads(app_context.dumps(collection))
+
+        # known ids are reused, while unknown ids are left out of the process-wide registry
+        assert loaded.items[0].service_id is TestServices.CONTEXT_1
+        fresh = apps.ServiceId[ExampleConfig](unknown.name)
+        assert apps.intern_service_id(fresh, register=False) is fresh
@@ -0,0 +1,43 @@
+from dataclasses import dataclass
+
+from rats import app_context, apps
+
+
+@dataclass(frozen=True)
+class ExampleConfig:
+    name: str
+
+
+@apps.autoscope
+class _Services:
+    CONFIG = apps.ServiceId[ExampleConfig]("config")
+    OTHER_CONFIG = apps.ServiceId[ExampleConfig]("other-config")
+
+
+class TestContainers:
+    _collection: app_context.Collection[ExampleConfig]
+
+    def setup_method(self) -> None:
+        self._collection = app_context.Collection[ExampleConfig].make(
+            app_context.Context[ExampleConfig].make(
+                _Services.CONFIG,
+                ExampleConfig("a"),
+                ExampleConfig("b"),
+            ),
+            app_context.Context[ExampleConfig].make(_Services.OTHER_CONFIG, ExampleConfig("c")),
+        )
+
+    def test_service_container(self) -> None:
+        container = app_context.ServiceContainer(ExampleConfig, "example", self._collection)
+
+        assert container.get(_Services.OTHER_CONFIG) == ExampleConfig("c")
+        assert container.get(_Services.OTHER_CONFIG) is container.get(_Services.OTHER_CONFIG)
+
+    def test_group_container(self) -> None:
+        container = app_context.GroupContainer(ExampleConfig, self._collection)
+
+        assert list(container.get_group(_Services.CONFIG)) == [
+            ExampleConfig("a"),
+            ExampleConfig("b"),
+        ]
+        assert list(container.get_group(_Services.OTHER_CONFIG)) == [ExampleConfig("c")]
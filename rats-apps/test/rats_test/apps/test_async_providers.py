@@ -0,0 +1,193 @@
+import asyncio
+import threading
+from collections.abc import AsyncIterator, Iterator
+
+import pytest
+
+from rats import apps
+
+
+@apps.autoscope
+class _Ids:
+    CLIENT = apps.ServiceId[str]("client")
+    SETTINGS = apps.ServiceId[str]("settings")
+    DUPLICATE = apps.ServiceId[str]("duplicate")
+    SHARDS = apps.ServiceId[str]("shards")
+    EXE = apps.ServiceId[apps.AsyncExecutable]("exe")
+    EXES = apps.ServiceId[apps.Executable]("exes")
+    SLOW = apps.ServiceId[object]("slow")
+
+
+class _AsyncExe(apps.AsyncExecutable):
+    _calls: list[str]
+
+    def __init__(self, calls: list[str]) -> None:
+        self._calls = calls
+
+    async def execute(self) -> None:
+        await asyncio.sleep(0)
+        self._calls.append("async-exe")
+
+
+class _AsyncContainer(apps.Container):
+    calls: list[str]
+    _started: int
+    _all_started: asyncio.Event | None
+
+    def __init__(self) -> None:
+        self.calls = []
+        self._started = 0
+        self._all_started = None
+
+    async def _wait_for_others(self, parties: int) -> None:
+        # resolves only when the async group providers are being awaited concurrently
+        if self._all_started is None:
+            self._all_started = asyncio.Event()
+        self._started += 1
+        if self._started == parties:
+            self._all_started.set()
+        await asyncio.wait_for(self._all_started.wait(), timeout=5)
+
+    @apps.async_service(_Ids.CLIENT)
+    async def _client(self) -> str:
+        settings = await self.aget(_Ids.SETTINGS)
+        await asyncio.sleep(0.01)
+        self.calls.append("client")
+        return f"client[{settings}]"
+
+    @apps.service(_Ids.SETTINGS)
+    def _settings(self) -> str:
+        self.calls.append("settings")
+        return "settings"
+
+    @apps.service(_Ids.DUPLICATE)
+    def _duplicate_1(self) -> str:
+        return "duplicate"
+
+    @apps.async_service(_Ids.DUPLICATE)
+    async def _duplicate_2(self) -> str:
+        return "duplicate"
+
+    @apps.group(_Ids.SHARDS)
+    def _shards_1(self) -> Iterator[str]:
+        yield "shard-1"
+
+    @apps.async_group(_Ids.SHARDS)
+    async def _shards_2(self) -> AsyncIterator[str]:
+        await self._wait_for_others(2)
+        yield "shard-2"
+
+    @apps.async_group(_Ids.SHARDS)
+    async def _shards_3(self) -> AsyncIterator[str]:
+        await self._wait_for_others(2)
+        yield "shard-3"
+        yield "shard-4"
+
+    @apps.async_service(_Ids.EXE)
+    async def _exe(self) -> apps.AsyncExecutable:
+        return _AsyncExe(self.calls)
+
+    @apps.group(_Ids.EXES)
+    def _exes(self) -> Iterator[apps.Executable]:
+        yield apps.App(lambda: self.calls.append("exe-1"))
+        yield apps.App(lambda: self.calls.append("exe-2"))
+
+
+class _SlowContainer(apps.Container):
+    calls: int
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    @apps.async_service(_Ids.SLOW)
+    async def _slow(self) -> object:
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        return object()
+
+
+def _aget_from_threads(
+    container: apps.Container, service_id: apps.ServiceId[object]
+) -> list[object]:
+    barrier = threading.Barrier(4)
+    results: list[object] = []
+
+    def _run() -> None:
+        barrier.wait(timeout=5)
+        results.append(asyncio.run(container.aget(service_id)))
+
+    threads = [threading.Thread(target=_run) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return results
+
+
+class TestAsyncProviders:
+    _container: _AsyncContainer
+
+    def setup_method(self) -> None:
+        self._container = _AsyncContainer()
+
+    def test_aget(self) -> None:
+        async def _main() -> tuple[str, str, str]:
+            return (
+                await self._container.aget(_Ids.CLIENT),
+                await self._container.aget(_Ids.CLIENT),
+                await self._container.aget(_Ids.SETTINGS),
+            )
+
+        assert asyncio.run(_main()) == ("client[settings]", "client[settings]", "settings")
+        assert self._container.calls == ["settings", "client"]
+        assert self._container.get(_Ids.SETTINGS) == "settings"
+
+    def test_concurrent_aget_awaits_the_provider_once(self) -> None:
+        async def _main() -> list[str]:
+            return await asyncio.gather(*[self._container.aget(_Ids.CLIENT) for _ in range(10)])
+
+        assert set(asyncio.run(_main())) == {"client[settings]"}
+        assert self._container.calls.count("client") == 1
+
+    def test_aget_errors(self) -> None:
+        with pytest.raises(apps.DuplicateServiceError):
+            asyncio.run(self._container.aget(_Ids.DUPLICATE))
+
+        with pytest.raises(apps.ServiceNotFoundError):
+            asyncio.run(self._container.aget(apps.ServiceId[str]("missing")))
+
+    def test_sync_lookups_of_async_services(self) -> None:
+        assert self._container.has(_Ids.CLIENT)
+        assert self._container.has(_Ids.DUPLICATE)
+        assert not self._container.has(apps.ServiceId[str]("missing"))
+
+        with pytest.raises(apps.AsyncServiceError, match="aget"):
+            self._container.get(_Ids.CLIENT)
+
+        with pytest.raises(apps.ServiceNotFoundError):
+            self._container.get_lazy(_Ids.CLIENT)
+
+        assert self._container.get(_Ids.DUPLICATE) == "duplicate"
+
+    def test_aget_group(self) -> None:
+        async def _main() -> list[str]:
+            return [x async for x in self._container.aget_group(_Ids.SHARDS)]
+
+        assert asyncio.run(_main()) == ["shard-1", "shard-2", "shard-3", "shard-4"]
+        assert list(self._container.get_group(_Ids.SHARDS)) == ["shard-1"]
+
+    def test_async_runtime(self) -> None:
+        runtime = apps.AsyncStandardRuntime(self._container)
+        asyncio.run(runtime.execute(_Ids.EXE))
+        asyncio.run(runtime.execute_group(_Ids.EXES))
+
+        assert self._container.calls == ["async-exe", "exe-1", "exe-2"]
+
+    def test_aget_from_several_event_loops(self) -> None:
+        container = _SlowContainer()
+        results = _aget_from_threads(container, _Ids.SLOW)
+
+        assert len(results) == 4
+        assert all(result is results[0] for result in results)
+        assert asyncio.run(container.aget(_Ids.SLOW)) is results[0]
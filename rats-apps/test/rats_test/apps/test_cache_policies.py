@@ -0,0 +1,234 @@
+import gc
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from rats import apps
+
+
+class _Blob:
+    data: bytes
+
+    def __init__(self, size: int) -> None:
+        self.data = b"x" * size
+
+
+@apps.autoscope
+class _Ids:
+    SMALL = apps.ServiceId[_Blob]("small")
+    LARGE = apps.ServiceId[_Blob]("large")
+    OTHER = apps.ServiceId[_Blob]("other")
+    NAME = apps.ServiceId[str]("name")
+    BLOBS = apps.ServiceId[_Blob]("blobs")
+
+
+class _BlobContainer(apps.Container):
+    created: list[str]
+
+    def __init__(self) -> None:
+        self.created = []
+
+    @apps.service(_Ids.SMALL)
+    def _small(self) -> _Blob:
+        self.created.append("small")
+        return _Blob(1_000)
+
+    @apps.service(_Ids.LARGE)
+    def _large(self) -> _Blob:
+        self.created.append("large")
+        return _Blob(1_000_000)
+
+    @apps.service(_Ids.NAME)
+    def _name(self) -> str:
+        self.created.append("name")
+        return "name"
+
+    @apps.group(_Ids.BLOBS)
+    def _blobs(self) -> Iterator[_Blob]:
+        self.created.append("blobs")
+        yield _Blob(10)
+
+
+class _OtherContainer(apps.Container):
+    created: list[str]
+
+    def __init__(self) -> None:
+        self.created = []
+
+    @apps.service(_Ids.OTHER)
+    def _other(self) -> _Blob:
+        self.created.append("other")
+        return _Blob(1_000)
+
+
+class _App(apps.Container):
+    blobs: _BlobContainer
+    others: _OtherContainer
+
+    def __init__(self) -> None:
+        self.blobs = _BlobContainer()
+        self.others = _OtherContainer()
+
+    @apps.container()
+    def _plugins(self) -> apps.Container:
+        return apps.CompositeContainer(self.blobs, self.others)
+
+
+_PLUGIN_SOURCE = """
+from rats import apps
+
+
+class Plugin(apps.Container):
+    created: list[str]
+
+    def __init__(self, app: apps.Container) -> None:
+        self.created = []
+
+    @apps.service(apps.ServiceId[object]("cached.first"))
+    def _first(self) -> object:
+        self.created.append("first")
+        return object()
+
+    @apps.service(apps.ServiceId[object]("cached.second"))
+    def _second(self) -> object:
+        self.created.append("second")
+        return object()
+"""
+
+
+def _install(site: Path) -> None:
+    (site / "cached_plugin.py").write_text(_PLUGIN_SOURCE)
+    dist_info = site / "cached_plugin-1.0.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text(
+        "Metadata-Version: 2.1\nName: cached-plugin\nVersion: 1.0\n"
+    )
+    (dist_info / "entry_points.txt").write_text(
+        "[example.plugins]\ncached = cached_plugin:Plugin\n"
+    )
+
+
+class TestCachePolicies:
+    def test_lru_max_entries_applies_to_the_tree(self) -> None:
+        app = apps.set_cache_policy(_App(), apps.LruCachePolicy(max_entries=2))
+
+        small = app.get(_Ids.SMALL)
+        app.get(_Ids.OTHER)
+        assert app.get(_Ids.SMALL) is small
+        # the least recently used service, in a different container, is evicted
+        app.get(_Ids.LARGE)
+        app.get(_Ids.OTHER)
+
+        assert app.blobs.created == ["small", "large"]
+        assert app.others.created == ["other", "other"]
+
+    def test_lru_max_bytes(self) -> None:
+        app = apps.set_cache_policy(_App(), apps.LruCachePolicy(max_bytes=100_000))
+
+        small = app.get(_Ids.SMALL)
+        assert app.get(_Ids.SMALL) is small
+        # larger than the whole budget, so it is never cached
+        assert app.get(_Ids.LARGE) is not app.get(_Ids.LARGE)
+        assert app.get(_Ids.SMALL) is small
+
+    def test_lru_needs_a_limit(self) -> None:
+        with pytest.raises(ValueError):
+            apps.LruCachePolicy()
+
+    def test_weak_references(self) -> None:
+        app = apps.set_cache_policy(_App(), apps.WeakCachePolicy())
+
+        small = app.get(_Ids.SMALL)
+        assert app.get(_Ids.SMALL) is small
+        del small
+        gc.collect()
+        app.get(_Ids.SMALL)
+        # services without weak reference support are kept
+        app.get(_Ids.NAME)
+        app.get(_Ids.NAME)
+        list(app.get_group(_Ids.BLOBS))
+        list(app.get_group(_Ids.BLOBS))
+
+        assert app.blobs.created == ["small", "small", "name", "blobs"]
+
+    def test_existing_entries_are_kept(self) -> None:
+        app = _App()
+        small = app.get(_Ids.SMALL)
+        apps.set_cache_policy(app, apps.LruCachePolicy(max_entries=10))
+
+        assert app.get(_Ids.SMALL) is small
+        assert app.blobs.created == ["small"]
+
+    def test_cache_report(self) -> None:
+        app = _App()
+        assert apps.cache_report(app) == ()
+
+        app.get(_Ids.SMALL)
+        app.get(_Ids.LARGE)
+        list(app.get_group(_Ids.BLOBS))
+        reports = apps.cache_report(app)
+
+        assert [report.container for report in reports] == [app.blobs]
+        services = {s.service_id: s for s in reports[0].services}
+        assert set(services) == {_Ids.SMALL, _Ids.LARGE, _Ids.BLOBS}
+        assert services[_Ids.LARGE].provider == "_large"
+        assert services[_Ids.LARGE].approximate_bytes > 1_000_000
+        assert services[_Ids.SMALL].approximate_bytes < 10_000
+        assert reports[0].approximate_bytes == sum(s.approximate_bytes for s in services.values())
+
+    def test_approximate_size_skips_containers(self) -> None:
+        app = _App()
+        blob = _Blob(1_000)
+        blob.app = app  # type: ignore[reportAttributeAccessIssue]
+
+        assert apps.approximate_size(blob) < apps.approximate_size(_Blob(2_000))
+
+
+class TestEntryPointPlugins:
+    _plugins: apps.PythonEntryPointContainer
+
+    @pytest.fixture(autouse=True)
+    def _environment(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+        site = tmp_path / "site-packages"
+        site.mkdir()
+        _install(site)
+        monkeypatch.setattr(sys, "path", [str(site), *sys.path])
+        monkeypatch.setenv("RATS_ENTRY_POINTS_CACHE_DIR", str(tmp_path / "cache"))
+        self._plugins = apps.PythonEntryPointContainer(apps.EMPTY_CONTAINER, "example.plugins")
+        yield
+        sys.modules.pop("cached_plugin", None)
+
+    def test_plugins_loaded_later_use_the_policy(self) -> None:
+        app = apps.set_cache_policy(self._plugins, apps.LruCachePolicy(max_entries=1))
+        first = apps.ServiceId[object]("cached.first")
+        second = apps.ServiceId[object]("cached.second")
+
+        assert app.get(first) is app.get(first)
+        app.get(second)
+        app.get(first)
+
+        plugin = app.__rats_apps_created_subcontainers__()[0]
+        assert plugin.created == ["first", "second", "first"]  # type: ignore[reportAttributeAccessIssue]
+
+    def test_plugins_loaded_earlier_use_the_policy(self) -> None:
+        first = apps.ServiceId[object]("cached.first")
+        second = apps.ServiceId[object]("cached.second")
+        self._plugins.get(first)
+        app = apps.set_cache_policy(self._plugins, apps.LruCachePolicy(max_entries=1))
+
+        app.get(second)
+        app.get(first)
+
+        plugin = app.__rats_apps_created_subcontainers__()[0]
+        assert plugin.created == ["first", "second", "first"]  # type: ignore[reportAttributeAccessIssue]
+
+    def test_cache_report(self) -> None:
+        assert apps.cache_report(self._plugins) == ()
+
+        self._plugins.get(apps.ServiceId[object]("cached.first"))
+        reports = apps.cache_report(self._plugins)
+
+        assert [type(report.container).__name__ for report in reports] == ["Plugin"]
+        assert [s.provider for s in reports[0].services] == ["_first"]
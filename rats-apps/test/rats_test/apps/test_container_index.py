@@ -0,0 +1,112 @@
+from collections.abc import Iterator
+
+import pytest
+
+from rats import apps
+
+from .example import (
+    DummyContainerServiceIds,
+    ExampleApp,
+    ExampleFallbackPlugin1,
+    ExampleGroupsPlugin2,
+    ExampleIds,
+)
+
+_VALUE = apps.ServiceId[str]("value")
+_VALUES = apps.ServiceId[str]("values")
+
+
+class _Leaf(apps.Container):
+    _name: str
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+
+    @apps.group(_VALUES)
+    def _values(self) -> Iterator[str]:
+        yield self._name
+
+
+class _Branch(apps.Container):
+    _name: str
+    _depth: int
+    _width: int
+
+    def __init__(self, name: str, depth: int, width: int) -> None:
+        self._name = name
+        self._depth = depth
+        self._width = width
+
+    @apps.container()
+    def _children(self) -> apps.Container:
+        if self._depth == 0:
+            return apps.CompositeContainer(*[
+                _Leaf(f"{self._name}.{i}") for i in range(self._width)
+            ])
+
+        return apps.CompositeContainer(*[
+            _Branch(f"{self._name}.{i}", self._depth - 1, self._width) for i in range(self._width)
+        ])
+
+
+class _Root(apps.Container):
+    _tree: apps.Container
+
+    def __init__(self, tree: apps.Container) -> None:
+        self._tree = tree
+
+    @apps.service(_VALUE)
+    def _value(self) -> str:
+        return "root"
+
+    @apps.container()
+    def _plugins(self) -> apps.Container:
+        return apps.CompositeContainer(
+            self._tree,
+            apps.StaticContainer(apps.static_group(_VALUES, lambda: iter(["static"]))),
+        )
+
+
+class TestContainerIndex:
+    def test_compile_returns_same_instance(self) -> None:
+        app = ExampleApp()
+        assert apps.compile_container(app) is app
+
+    def test_services_match_uncompiled_container(self) -> None:
+        app = apps.compile_container(ExampleApp(ExampleFallbackPlugin1, ExampleGroupsPlugin2))
+        reference = ExampleApp(ExampleFallbackPlugin1, ExampleGroupsPlugin2)
+
+        assert app.get(ExampleIds.STORAGE).settings == reference.get(ExampleIds.STORAGE).settings
+        assert (
+            app.get(ExampleIds.OTHER_STORAGE).settings
+            == reference.get(ExampleIds.OTHER_STORAGE).settings
+        )
+        assert len(list(app.get_group(ExampleIds.GROUPS.STORAGE))) == len(
+            list(reference.get_group(ExampleIds.GROUPS.STORAGE))
+        )
+
+    def test_services_are_cached(self) -> None:
+        app = apps.compile_container(ExampleApp())
+
+        assert app.get(DummyContainerServiceIds.C1S1A) is app.get(DummyContainerServiceIds.C1S1B)
+        assert app.get(DummyContainerServiceIds.C2S1A) is app.get(DummyContainerServiceIds.C2S1B)
+
+    def test_errors(self) -> None:
+        app = apps.compile_container(ExampleApp())
+
+        with pytest.raises(apps.DuplicateServiceError):
+            app.get(ExampleIds.DUPLICATE_SERVICE)
+
+        with pytest.raises(apps.ServiceNotFoundError):
+            app.get(apps.ServiceId[str]("missing"))
+
+    @pytest.mark.parametrize(("depth", "width"), [(0, 1), (1, 3), (3, 2), (2, 5)])
+    def test_group_order_is_preserved(self, depth: int, width: int) -> None:
+        app = apps.compile_container(_Root(_Branch("root", depth, width)))
+        reference = _Root(_Branch("root", depth, width))
+
+        values = list(app.get_group(_VALUES))
+        assert values == list(reference.get_group(_VALUES))
+        assert len(values) == width ** (depth + 1) + 1
+        assert values[-1] == "static"
+        assert app.get(_VALUE) == "root"
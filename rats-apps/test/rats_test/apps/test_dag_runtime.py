@@ -0,0 +1,216 @@
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from rats import apps
+
+
+@apps.autoscope
+class _Ids:
+    DOWNLOAD = apps.ServiceId[apps.Executable]("download")
+    TOKENIZE = apps.ServiceId[apps.Executable]("tokenize")
+    FEATURES = apps.ServiceId[apps.Executable]("features")
+    TRAIN = apps.ServiceId[apps.Executable]("train")
+    REPORT = apps.ServiceId[apps.Executable]("report")
+    CYCLE_A = apps.ServiceId[apps.Executable]("cycle-a")
+    CYCLE_B = apps.ServiceId[apps.Executable]("cycle-b")
+    MISSING = apps.ServiceId[apps.Executable]("missing")
+    BROKEN = apps.ServiceId[apps.Executable]("broken")
+    SCOPED = apps.ServiceId[object]("scoped")
+    SCOPED_USER = apps.ServiceId[apps.Executable]("scoped-user")
+
+
+class _Pipeline(apps.Container):
+    executed: list[str]
+    failing: set[str]
+    scoped: list[object]
+    barrier: threading.Barrier
+    _lock: threading.Lock
+
+    def __init__(self) -> None:
+        self.executed = []
+        self.failing = set()
+        self.scoped = []
+        self.barrier = threading.Barrier(2, timeout=5)
+        self._lock = threading.Lock()
+
+    @apps.service(_Ids.DOWNLOAD)
+    def _download(self) -> apps.Executable:
+        return apps.App(lambda: self._run("download"))
+
+    @apps.service(_Ids.TOKENIZE)
+    @apps.depends_on(_Ids.DOWNLOAD)
+    def _tokenize(self) -> apps.Executable:
+        return apps.App(lambda: self._run("tokenize", wait=True))
+
+    @apps.service(_Ids.FEATURES)
+    @apps.depends_on(_Ids.DOWNLOAD)
+    def _features(self) -> apps.Executable:
+        return apps.App(lambda: self._run("features", wait=True))
+
+    @apps.service(_Ids.TRAIN)
+    @apps.depends_on(_Ids.TOKENIZE, _Ids.FEATURES)
+    def _train(self) -> apps.Executable:
+        return apps.App(lambda: self._run("train"))
+
+    @apps.service(_Ids.REPORT)
+    def _report(self) -> apps.Executable:
+        return apps.App(lambda: self._run("report"))
+
+    @apps.service(_Ids.CYCLE_A)
+    @apps.depends_on(_Ids.CYCLE_B)
+    def _cycle_a(self) -> apps.Executable:
+        return apps.App(lambda: self._run("cycle-a"))
+
+    @apps.service(_Ids.CYCLE_B)
+    @apps.depends_on(_Ids.CYCLE_A)
+    def _cycle_b(self) -> apps.Executable:
+        return apps.App(lambda: self._run("cycle-b"))
+
+    @apps.service(_Ids.BROKEN)
+    @apps.depends_on(_Ids.MISSING)
+    def _broken(self) -> apps.Executable:
+        return apps.App(lambda: self._run("broken"))
+
+    @apps.service(_Ids.SCOPED, lifetime=apps.ServiceLifetimes.SCOPED)
+    def _scoped_service(self) -> object:
+        return object()
+
+    @apps.service(_Ids.SCOPED_USER)
+    @apps.depends_on(_Ids.REPORT)
+    def _scoped_user(self) -> apps.Executable:
+        return apps.App(self._use_scoped)
+
+    def _use_scoped(self) -> None:
+        self.scoped.append(self.get(_Ids.SCOPED))
+
+    def _run(self, name: str, wait: bool = False) -> None:
+        if name in self.failing:
+            raise ValueError(name)
+        if wait:
+            # only completes when both branches run at the same time
+            self.barrier.wait()
+        with self._lock:
+            self.executed.append(name)
+
+
+_PLUGIN_SOURCE = """
+from rats import apps
+
+FIRST = apps.ServiceId[apps.Executable]("dag-plugin.first")
+SECOND = apps.ServiceId[apps.Executable]("dag-plugin.second")
+
+
+class Plugin(apps.Container):
+    def __init__(self, app: apps.Container) -> None:
+        self._app = app
+
+    @apps.service(FIRST)
+    def _first(self) -> apps.Executable:
+        return apps.App(lambda: None)
+
+    @apps.service(SECOND)
+    @apps.depends_on(FIRST)
+    def _second(self) -> apps.Executable:
+        return apps.App(lambda: None)
+"""
+
+
+def _install(site: Path) -> None:
+    (site / "dag_plugin.py").write_text(_PLUGIN_SOURCE)
+    dist_info = site / "dag_plugin-1.0.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text("Metadata-Version: 2.1\nName: dag-plugin\nVersion: 1.0\n")
+    (dist_info / "entry_points.txt").write_text("[example.plugins]\ndag = dag_plugin:Plugin\n")
+
+
+class TestDagRuntime:
+    _app: _Pipeline
+
+    def setup_method(self) -> None:
+        self._app = _Pipeline()
+
+    def test_plan(self) -> None:
+        runtime = apps.DagRuntime(self._app)
+
+        assert runtime.plan(_Ids.TRAIN, _Ids.REPORT) == (
+            (_Ids.REPORT, _Ids.DOWNLOAD),
+            (_Ids.FEATURES, _Ids.TOKENIZE),
+            (_Ids.TRAIN,),
+        )
+
+    def test_dependencies_run_first_and_in_parallel(self) -> None:
+        apps.DagRuntime(self._app, max_concurrency=2).execute(_Ids.TRAIN)
+
+        assert self._app.executed[0] == "download"
+        assert sorted(self._app.executed[1:3]) == ["features", "tokenize"]
+        assert self._app.executed[3] == "train"
+
+    def test_failures_skip_dependents(self) -> None:
+        self._app.failing = {"download"}
+
+        with pytest.raises(Exception) as exc_info:
+            apps.DagRuntime(self._app, max_concurrency=2).execute(_Ids.TRAIN, _Ids.REPORT)
+
+        errors: tuple[BaseException, ...] = getattr(exc_info.value, "exceptions", ())
+        assert [str(error) for error in errors] == ["download"]
+        assert self._app.executed == ["report"]
+
+    def test_dry_run(self, capsys: pytest.CaptureFixture[str]) -> None:
+        apps.DagRuntime(self._app, dry_run=True).execute(_Ids.TRAIN)
+
+        assert self._app.executed == []
+        assert capsys.readouterr().out.splitlines() == [
+            f"stage 0: {_Ids.DOWNLOAD.name}",
+            f"stage 1: {_Ids.FEATURES.name}, {_Ids.TOKENIZE.name}",
+            f"stage 2: {_Ids.TRAIN.name}",
+        ]
+
+    def test_cycles(self) -> None:
+        with pytest.raises(ValueError, match="cycle"):
+            apps.DagRuntime(self._app).execute(_Ids.CYCLE_A)
+
+        assert self._app.executed == []
+
+    def test_missing_executables(self) -> None:
+        runtime = apps.DagRuntime(self._app)
+
+        with pytest.raises(apps.ServiceNotFoundError, match="missing"):
+            runtime.plan(_Ids.MISSING)
+
+        with pytest.raises(apps.ServiceNotFoundError, match="missing"):
+            runtime.execute(_Ids.BROKEN)
+
+        assert self._app.executed == []
+
+    def test_executables_see_the_active_scope(self) -> None:
+        with apps.ServiceScope():
+            apps.DagRuntime(self._app).execute(_Ids.SCOPED_USER)
+            scoped = self._app.get(_Ids.SCOPED)
+
+        assert self._app.executed == ["report"]
+        assert self._app.scoped == [scoped]
+
+    def test_dependencies_through_delegating_containers(self) -> None:
+        app = apps.CompositeContainer(apps.StaticContainer(), apps.CompositeContainer(self._app))
+
+        assert apps.DagRuntime(app).plan(_Ids.TOKENIZE) == ((_Ids.DOWNLOAD,), (_Ids.TOKENIZE,))
+
+    def test_dependencies_of_entry_point_plugins(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        _install(tmp_path)
+        monkeypatch.setattr(sys, "path", [str(tmp_path), *sys.path])
+        monkeypatch.setenv("RATS_ENTRY_POINTS_CACHE_DIR", str(tmp_path / "cache"))
+        first = apps.ServiceId[apps.Executable]("dag-plugin.first")
+        second = apps.ServiceId[apps.Executable]("dag-plugin.second")
+        app = apps.PythonEntryPointContainer(apps.EMPTY_CONTAINER, "example.plugins")
+
+        plan = apps.DagRuntime(app).plan(second)
+        sys.modules.pop("dag_plugin", None)
+
+        assert plan == ((first,), (second,))
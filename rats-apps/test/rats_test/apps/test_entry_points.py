@@ -0,0 +1,56 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+from rats import apps
+
+
+def _install(site: Path, name: str, entries: str) -> None:
+    dist_info = site / f"{name}-1.0.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text(f"Metadata-Version: 2.1\nName: {name}\nVersion: 1.0\n")
+    (dist_info / "entry_points.txt").write_text(entries)
+
+
+class TestEntryPoints:
+    _site: Path
+    _cache_dir: Path
+
+    @pytest.fixture(autouse=True)
+    def _environment(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        self._site = tmp_path / "site-packages"
+        self._site.mkdir()
+        self._cache_dir = tmp_path / "cache"
+        monkeypatch.setattr(sys, "path", [str(self._site), *sys.path])
+        monkeypatch.setenv("RATS_ENTRY_POINTS_CACHE_DIR", str(self._cache_dir))
+        monkeypatch.delenv("RATS_ENTRY_POINTS_CACHE", raising=False)
+
+    def test_entry_points_are_indexed(self) -> None:
+        _install(self._site, "example_plugin", "[example.plugins]\nfirst = example.first:plugin\n")
+
+        entries = apps.get_entry_points("example.plugins")
+
+        assert [(e.name, e.value, e.group) for e in entries] == [
+            ("first", "example.first:plugin", "example.plugins"),
+        ]
+        assert len(list(self._cache_dir.glob("entry-points-*.json"))) == 1
+        assert apps.get_entry_points("example.missing") == ()
+
+    def test_index_is_rebuilt_when_packages_change(self) -> None:
+        _install(self._site, "example_plugin", "[example.plugins]\nfirst = example.first:plugin\n")
+        assert len(apps.get_entry_points("example.plugins")) == 1
+
+        _install(self._site, "other_plugin", "[example.plugins]\nsecond = example.second:plugin\n")
+
+        assert sorted(e.name for e in apps.get_entry_points("example.plugins")) == [
+            "first",
+            "second",
+        ]
+
+    def test_index_can_be_disabled(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("RATS_ENTRY_POINTS_CACHE", "0")
+        _install(self._site, "example_plugin", "[example.plugins]\nfirst = example.first:plugin\n")
+
+        assert [e.name for e in apps.get_entry_points("example.plugins")] == ["first"]
+        assert not self._cache_dir.exists()
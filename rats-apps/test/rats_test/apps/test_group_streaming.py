@@ -0,0 +1,67 @@
+from collections.abc import Iterator
+
+import pytest
+
+from rats import apps
+
+
+@apps.autoscope
+class _Ids:
+    SHARDS = apps.ServiceId[int]("shards")
+    CACHED_SHARDS = apps.ServiceId[int]("cached-shards")
+
+
+class _ShardsContainer(apps.Container):
+    yielded: int
+
+    def __init__(self) -> None:
+        self.yielded = 0
+
+    @apps.group(_Ids.SHARDS, lifetime=apps.ServiceLifetimes.TRANSIENT)
+    def _shards(self) -> Iterator[int]:
+        for i in range(1_000_000):
+            self.yielded += 1
+            yield i
+
+    @apps.group(_Ids.CACHED_SHARDS)
+    def _cached_shards(self) -> Iterator[int]:
+        for i in range(5):
+            self.yielded += 1
+            yield i
+
+
+class TestGroupStreaming:
+    _container: _ShardsContainer
+
+    def setup_method(self) -> None:
+        self._container = _ShardsContainer()
+
+    def test_transient_groups_are_streamed(self) -> None:
+        shards = self._container.get_group(_Ids.SHARDS)
+
+        assert next(shards) == 0
+        assert next(shards) == 1
+        assert self._container.yielded == 2
+
+    def test_get_group_batches(self) -> None:
+        batches = self._container.get_group_batches(_Ids.SHARDS, 1000)
+
+        assert next(batches) == tuple(range(1000))
+        assert next(batches) == tuple(range(1000, 2000))
+        assert self._container.yielded == 2000
+
+    def test_get_group_batches_of_cached_groups(self) -> None:
+        assert list(self._container.get_group_batches(_Ids.CACHED_SHARDS, 2)) == [
+            (0, 1),
+            (2, 3),
+            (4,),
+        ]
+        assert list(self._container.get_group(_Ids.CACHED_SHARDS)) == [0, 1, 2, 3, 4]
+        assert self._container.yielded == 5
+
+    def test_get_group_batches_of_missing_groups(self) -> None:
+        assert list(self._container.get_group_batches(apps.ServiceId[int]("missing"), 2)) == []
+
+    def test_invalid_batch_size(self) -> None:
+        with pytest.raises(ValueError):
+            next(self._container.get_group_batches(_Ids.SHARDS, 0))
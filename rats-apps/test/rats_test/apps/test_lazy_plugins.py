@@ -0,0 +1,92 @@
+import pytest
+
+from rats import apps
+
+
+@apps.autoscope
+class _Ids:
+    FIRST = apps.ServiceId[str]("first")
+    SECOND = apps.ServiceId[str]("second")
+
+
+_created: list[str] = []
+
+
+class _FirstPlugin(apps.Container):
+    _app: apps.Container
+
+    def __init__(self, app: apps.Container) -> None:
+        self._app = app
+        _created.append("first")
+
+    @apps.service(_Ids.FIRST)
+    def _first(self) -> str:
+        return "first"
+
+
+class _SecondPlugin(apps.Container):
+    _app: apps.Container
+
+    def __init__(self, app: apps.Container) -> None:
+        self._app = app
+        _created.append("second")
+
+    @apps.service(_Ids.SECOND)
+    def _second(self) -> str:
+        return f"second after {self._app.get(_Ids.FIRST)}"
+
+
+class _EagerPlugin(apps.Container):
+    def __init__(self, app: apps.Container) -> None:
+        app.get(_Ids.FIRST)
+
+
+class TestLazyPlugins:
+    _app: apps.AppBundle
+
+    def setup_method(self) -> None:
+        _created.clear()
+        self._app = apps.AppBundle(
+            app_plugin=apps.EMPTY_APP_PLUGIN,
+            container_plugin=apps.CompositePlugin(_FirstPlugin, _SecondPlugin),
+        )
+
+    def test_plugins_are_created_when_lookups_reach_them(self) -> None:
+        assert _created == []
+        assert apps.plugin_timings(self._app) == ()
+        assert apps.cache_report(self._app) == ()
+        assert _created == []
+
+        providers = self._app.get_namespaced_providers(
+            apps.ProviderNamespaces.SERVICES, _Ids.FIRST
+        )
+        first = next(providers)
+        assert _created == ["first"]
+        assert first() == "first"
+
+        assert self._app.get(_Ids.SECOND) == "second after first"
+        assert _created == ["first", "second"]
+
+    def test_plugin_timings(self) -> None:
+        self._app.get(_Ids.SECOND)
+
+        plugins = [timing.plugin for timing in apps.plugin_timings(self._app)]
+        assert plugins == [
+            f"{apps.EMPTY_APP_PLUGIN.__module__}:{apps.EMPTY_APP_PLUGIN.__qualname__}",
+            f"{apps.CompositePlugin.__module__}:{apps.CompositePlugin.__qualname__}",
+            f"{__name__}:_FirstPlugin",
+            f"{__name__}:_SecondPlugin",
+        ]
+        assert all(timing.seconds >= 0 for timing in apps.plugin_timings(self._app))
+
+    def test_compiled_bundles(self) -> None:
+        app = apps.compile_container(self._app)
+
+        assert app.get(_Ids.SECOND) == "second after first"
+        assert _created == ["first", "second"]
+
+    def test_plugins_can_not_use_the_app_while_being_created(self) -> None:
+        app = apps.AppBundle(app_plugin=apps.EMPTY_APP_PLUGIN, container_plugin=_EagerPlugin)
+
+        with pytest.raises(RuntimeError, match="while being created"):
+            app.get(_Ids.FIRST)
@@ -0,0 +1,90 @@
+import pytest
+
+from rats import apps
+
+
+class _Client:
+    name: str
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def fetch(self) -> str:
+        return f"fetched by {self.name}"
+
+
+@apps.autoscope
+class _Ids:
+    CLIENT = apps.ServiceId[_Client]("client")
+    NAMES = apps.ServiceId[list[str]]("names")
+    DUPLICATE = apps.ServiceId[str]("duplicate")
+
+
+class _LazyContainer(apps.Container):
+    calls: list[str]
+
+    def __init__(self) -> None:
+        self.calls = []
+
+    @apps.service(_Ids.CLIENT)
+    def _client(self) -> _Client:
+        self.calls.append("client")
+        return _Client("client")
+
+    @apps.service(_Ids.NAMES)
+    def _names(self) -> list[str]:
+        self.calls.append("names")
+        return ["a", "b"]
+
+    @apps.service(_Ids.DUPLICATE)
+    def _duplicate_1(self) -> str:
+        return "duplicate"
+
+    @apps.service(_Ids.DUPLICATE)
+    def _duplicate_2(self) -> str:
+        return "duplicate"
+
+
+class TestLazyServices:
+    _container: _LazyContainer
+
+    def setup_method(self) -> None:
+        self._container = _LazyContainer()
+
+    def test_construction_is_deferred(self) -> None:
+        client = self._container.get_lazy(_Ids.CLIENT)
+        assert not apps.is_realized(client)
+        assert "not realized" in repr(client)
+        assert self._container.calls == []
+
+        assert client.fetch() == "fetched by client"
+        assert apps.is_realized(client)
+        assert client.name == "client"
+        assert self._container.calls == ["client"]
+        # the proxy shares the cache of the container
+        assert self._container.get(_Ids.CLIENT).name == "client"
+        assert self._container.calls == ["client"]
+
+    def test_proxies_are_transparent(self) -> None:
+        names = self._container.get_lazy(_Ids.NAMES)
+
+        assert isinstance(names, list)
+        assert list(names) == ["a", "b"]
+        assert len(names) == 2
+        assert names[0] == "a"
+        assert "b" in names
+        assert names == ["a", "b"]
+
+        client = self._container.get_lazy(_Ids.CLIENT)
+        client.name = "renamed"
+        assert self._container.get(_Ids.CLIENT).name == "renamed"
+
+    def test_services_are_always_realized(self) -> None:
+        assert apps.is_realized(self._container.get(_Ids.CLIENT))
+
+    def test_lookup_errors_are_raised_right_away(self) -> None:
+        with pytest.raises(apps.ServiceNotFoundError):
+            self._container.get_lazy(apps.ServiceId[str]("missing"))
+
+        with pytest.raises(apps.DuplicateServiceError):
+            self._container.get_lazy(_Ids.DUPLICATE)
@@ -0,0 +1,122 @@
+from collections.abc import Iterator
+
+import pytest
+
+from rats import apps
+
+
+class _Resource:
+    closed: bool
+
+    def __init__(self) -> None:
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _ContextResource:
+    exited: bool
+
+    def __init__(self) -> None:
+        self.exited = False
+
+    def __enter__(self) -> "_ContextResource":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.exited = True
+
+
+@apps.autoscope
+class _Ids:
+    SINGLETON = apps.ServiceId[_Resource]("singleton")
+    TRANSIENT = apps.ServiceId[_Resource]("transient")
+    SCOPED = apps.ServiceId[_Resource]("scoped")
+    SCOPED_CONTEXT = apps.ServiceId[_ContextResource]("scoped-context")
+    SCOPED_GROUP = apps.ServiceId[_Resource]("scoped-group")
+    TRANSIENT_GROUP = apps.ServiceId[_Resource]("transient-group")
+
+
+class _LifetimesContainer(apps.Container):
+    @apps.service(_Ids.SINGLETON)
+    def _singleton(self) -> _Resource:
+        return _Resource()
+
+    @apps.service(_Ids.TRANSIENT, lifetime=apps.ServiceLifetimes.TRANSIENT)
+    def _transient(self) -> _Resource:
+        return _Resource()
+
+    @apps.service(_Ids.SCOPED, lifetime=apps.ServiceLifetimes.SCOPED)
+    def _scoped(self) -> _Resource:
+        return _Resource()
+
+    @apps.service(_Ids.SCOPED_CONTEXT, lifetime=apps.ServiceLifetimes.SCOPED)
+    def _scoped_context(self) -> _ContextResource:
+        return _ContextResource()
+
+    @apps.group(_Ids.SCOPED_GROUP, lifetime=apps.ServiceLifetimes.SCOPED)
+    def _scoped_group(self) -> Iterator[_Resource]:
+        yield _Resource()
+        yield _Resource()
+
+    @apps.group(_Ids.TRANSIENT_GROUP, lifetime=apps.ServiceLifetimes.TRANSIENT)
+    def _transient_group(self) -> Iterator[_Resource]:
+        yield _Resource()
+
+
+class TestLifetimes:
+    _container: _LifetimesContainer
+
+    def setup_method(self) -> None:
+        self._container = _LifetimesContainer()
+
+    def test_singleton(self) -> None:
+        with apps.ServiceScope():
+            singleton = self._container.get(_Ids.SINGLETON)
+
+        assert singleton is self._container.get(_Ids.SINGLETON)
+        assert not singleton.closed
+
+    def test_transient(self) -> None:
+        assert self._container.get(_Ids.TRANSIENT) is not self._container.get(_Ids.TRANSIENT)
+        assert list(self._container.get_group(_Ids.TRANSIENT_GROUP)) != list(
+            self._container.get_group(_Ids.TRANSIENT_GROUP)
+        )
+
+    def test_scoped(self) -> None:
+        with apps.ServiceScope():
+            first = self._container.get(_Ids.SCOPED)
+            assert first is self._container.get(_Ids.SCOPED)
+            context = self._container.get(_Ids.SCOPED_CONTEXT)
+            group = list(self._container.get_group(_Ids.SCOPED_GROUP))
+            assert group == list(self._container.get_group(_Ids.SCOPED_GROUP))
+
+            with apps.ServiceScope():
+                nested = self._container.get(_Ids.SCOPED)
+
+            assert nested is not first
+            assert nested.closed
+            assert not first.closed
+
+        with apps.ServiceScope():
+            second = self._container.get(_Ids.SCOPED)
+
+        assert first is not second
+        assert first.closed
+        assert context.exited
+        assert all(r.closed for r in group)
+
+    def test_scoped_outside_of_scope(self) -> None:
+        with pytest.raises(apps.ScopeNotFoundError):
+            self._container.get(_Ids.SCOPED)
+
+        # metadata lookups do not need a scope
+        assert self._container.has(_Ids.SCOPED)
+
+    def test_unknown_lifetime(self) -> None:
+        with pytest.raises(ValueError, match="transiant"):
+            apps.service(_Ids.SCOPED, lifetime="transiant")
+
+        with pytest.raises(ValueError, match="transiant"):
+            apps.group(_Ids.SCOPED_GROUP, lifetime="transiant")
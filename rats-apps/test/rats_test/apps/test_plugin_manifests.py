@@ -0,0 +1,102 @@
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from rats import apps
+
+_PLUGIN_SOURCE = """
+from rats import apps
+
+SERVICE = apps.ServiceId[str]("{name}.service")
+
+
+class Plugin(apps.Container):
+    def __init__(self, app: apps.Container) -> None:
+        self._app = app
+
+    @apps.service(SERVICE)
+    def _service(self) -> str:
+        return "{name}"
+"""
+
+
+def _install(site: Path, name: str, manifest: str | None) -> None:
+    (site / f"{name}_plugin.py").write_text(_PLUGIN_SOURCE.format(name=name))
+    entries = f"[example.plugins]\n{name} = {name}_plugin:Plugin\n"
+    if manifest is not None:
+        (site / f"{name}_manifest.py").write_text(f"from rats import apps\n\n{manifest}\n")
+        entries += f"[example.plugins.manifests]\n{name} = {name}_manifest:MANIFEST\n"
+
+    dist_info = site / f"{name}_plugin-1.0.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text(
+        f"Metadata-Version: 2.1\nName: {name}-plugin\nVersion: 1.0\n"
+    )
+    (dist_info / "entry_points.txt").write_text(entries)
+
+
+class TestPluginManifests:
+    _site: Path
+
+    @pytest.fixture(autouse=True)
+    def _environment(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+        self._site = tmp_path / "site-packages"
+        self._site.mkdir()
+        monkeypatch.setattr(sys, "path", [str(self._site), *sys.path])
+        monkeypatch.setenv("RATS_ENTRY_POINTS_CACHE_DIR", str(tmp_path / "cache"))
+        yield
+        for name in [name for name in sys.modules if name.startswith(("light_", "heavy_"))]:
+            del sys.modules[name]
+
+    def test_plugins_are_imported_when_they_provide_the_service(self) -> None:
+        _install(
+            self._site,
+            "light",
+            'MANIFEST = apps.PluginManifest(service_ids=[apps.ServiceId[str]("light.service")])',
+        )
+        _install(
+            self._site,
+            "heavy",
+            'MANIFEST = apps.PluginManifest(service_ids=[apps.ServiceId[str]("heavy.service")])',
+        )
+        plugins = apps.PythonEntryPointContainer(apps.EMPTY_CONTAINER, "example.plugins")
+
+        assert plugins.get(apps.ServiceId[str]("light.service")) == "light"
+        assert "light_plugin" in sys.modules
+        assert "heavy_plugin" not in sys.modules
+
+        assert plugins.get(apps.ServiceId[str]("heavy.service")) == "heavy"
+        assert "heavy_plugin" in sys.modules
+
+    def test_plugins_are_skipped_by_namespace(self) -> None:
+        _install(self._site, "heavy", 'MANIFEST = apps.PluginManifest(namespaces=["other"])')
+        plugins = apps.PythonEntryPointContainer(apps.EMPTY_CONTAINER, "example.plugins")
+
+        assert not plugins.has(apps.ServiceId[str]("heavy.service"))
+        assert "heavy_plugin" not in sys.modules
+
+    def test_plugins_without_manifests_are_always_imported(self) -> None:
+        _install(self._site, "light", None)
+        _install(self._site, "heavy", None)
+        plugins = apps.PythonEntryPointContainer(apps.EMPTY_CONTAINER, "example.plugins")
+
+        assert plugins.get(apps.ServiceId[str]("light.service")) == "light"
+        assert "light_plugin" in sys.modules
+        assert "heavy_plugin" in sys.modules
+
+    def test_disabled_plugins_are_never_imported(self) -> None:
+        _install(self._site, "light", None)
+        _install(self._site, "heavy", None)
+        plugins = apps.PythonEntryPointContainer(apps.EMPTY_CONTAINER, "example.plugins", "light")
+
+        assert not plugins.has(apps.ServiceId[str]("heavy.service"))
+        assert "heavy_plugin" not in sys.modules
+
+    def test_manifests_must_be_plugin_manifests(self) -> None:
+        _install(self._site, "light", "MANIFEST = ['light.service']")
+        plugins = apps.PythonEntryPointContainer(apps.EMPTY_CONTAINER, "example.plugins")
+
+        with pytest.raises(TypeError):
+            plugins.has(apps.ServiceId[str]("light.service"))
@@ -0,0 +1,235 @@
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from rats import apps
+
+
+@apps.autoscope
+class _Ids:
+    CPU_BOUND = apps.ServiceId[apps.Executable]("cpu-bound")
+    MEMORY_BOUND = apps.ServiceId[apps.Executable]("memory-bound")
+    FAILING = apps.ServiceId[apps.Executable]("failing")
+    SINGLE = apps.ServiceId[apps.Executable]("single")
+    MEETING = apps.ServiceId[apps.Executable]("meeting")
+    SCOPED = apps.ServiceId[object]("scoped")
+    SCOPED_USER = apps.ServiceId[apps.Executable]("scoped-user")
+
+
+class _ExampleContainer(apps.Container):
+    running: int
+    max_running: int
+    executed: int
+    scoped: list[object]
+    _lock: threading.Lock
+
+    def __init__(self) -> None:
+        self.running = 0
+        self.max_running = 0
+        self.executed = 0
+        self.scoped = []
+        self._lock = threading.Lock()
+
+    @apps.group(_Ids.CPU_BOUND)
+    @apps.resources(cpus=1)
+    def _cpu_bound(self) -> Iterator[apps.Executable]:
+        for _ in range(6):
+            yield apps.App(self._run)
+
+    @apps.group(_Ids.MEMORY_BOUND)
+    @apps.resources(cpus=0.5, memory_mb=4000)
+    def _memory_bound(self) -> Iterator[apps.Executable]:
+        for _ in range(6):
+            yield apps.App(self._run)
+
+    @apps.group(_Ids.FAILING)
+    def _failing(self) -> Iterator[apps.Executable]:
+        yield apps.App(self._fail)
+        for _ in range(4):
+            yield apps.App(self._run)
+
+    @apps.group(_Ids.MEETING)
+    def _meeting(self) -> Iterator[apps.Executable]:
+        # only completes when every executable is running at the same time
+        barrier = threading.Barrier(40, timeout=5)
+        for _ in range(40):
+            yield apps.App(lambda: self._meet(barrier))
+
+    @apps.service(_Ids.SINGLE)
+    @apps.resources(cpus=64, memory_mb=10**9)
+    def _single(self) -> apps.Executable:
+        return apps.App(self._run)
+
+    @apps.service(_Ids.SCOPED, lifetime=apps.ServiceLifetimes.SCOPED)
+    def _scoped_service(self) -> object:
+        return object()
+
+    @apps.service(_Ids.SCOPED_USER)
+    def _scoped_user(self) -> apps.Executable:
+        return apps.App(self._use_scoped)
+
+    def _use_scoped(self) -> None:
+        self.scoped.append(self.get(_Ids.SCOPED))
+
+    def _run(self) -> None:
+        with self._lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(0.05)
+        with self._lock:
+            self.running -= 1
+            self.executed += 1
+
+    def _meet(self, barrier: threading.Barrier) -> None:
+        barrier.wait()
+
+    def _fail(self) -> None:
+        raise ValueError("failed")
+
+
+_PLUGIN_SOURCE = """
+import threading
+import time
+from collections.abc import Iterator
+
+from rats import apps
+
+JOBS = apps.ServiceId[apps.Executable]("resource-plugin.jobs")
+LOCK = threading.Lock()
+RUNNING = [0]
+MAX_RUNNING = [0]
+
+
+def _run() -> None:
+    with LOCK:
+        RUNNING[0] += 1
+        MAX_RUNNING[0] = max(MAX_RUNNING[0], RUNNING[0])
+    time.sleep(0.05)
+    with LOCK:
+        RUNNING[0] -= 1
+
+
+class Plugin(apps.Container):
+    def __init__(self, app: apps.Container) -> None:
+        self._app = app
+
+    @apps.group(JOBS)
+    @apps.resources(cpus=2)
+    def _jobs(self) -> Iterator[apps.Executable]:
+        for _ in range(3):
+            yield apps.App(_run)
+"""
+
+
+def _install(site: Path) -> None:
+    (site / "resource_plugin.py").write_text(_PLUGIN_SOURCE)
+    dist_info = site / "resource_plugin-1.0.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text(
+        "Metadata-Version: 2.1\nName: resource-plugin\nVersion: 1.0\n"
+    )
+    (dist_info / "entry_points.txt").write_text(
+        "[example.plugins]\nresources = resource_plugin:Plugin\n"
+    )
+
+
+class TestResourceRuntime:
+    _app: _ExampleContainer
+
+    def setup_method(self) -> None:
+        self._app = _ExampleContainer()
+
+    def test_cpu_capacity(self) -> None:
+        capacity = apps.MachineCapacity(cpus=2, memory_mb=None)
+        apps.ResourceRuntime(self._app, capacity).execute_group(_Ids.CPU_BOUND)
+
+        assert self._app.executed == 6
+        assert self._app.max_running == 2
+
+    def test_memory_capacity(self) -> None:
+        capacity = apps.MachineCapacity(cpus=8, memory_mb=10_000 + (apps.get_rss_mb() or 0))
+        apps.ResourceRuntime(self._app, capacity).execute_group(_Ids.MEMORY_BOUND)
+
+        assert self._app.executed == 6
+        assert self._app.max_running == 2
+
+    def test_oversized_executables_run_alone(self) -> None:
+        capacity = apps.MachineCapacity(cpus=2, memory_mb=1000)
+        apps.ResourceRuntime(self._app, capacity).execute(_Ids.SINGLE, _Ids.SINGLE)
+
+        assert self._app.executed == 2
+        assert self._app.max_running == 1
+
+    def test_failures_stop_admission(self) -> None:
+        runtime = apps.ResourceRuntime(self._app, apps.MachineCapacity(cpus=1, memory_mb=None))
+
+        with pytest.raises(Exception) as exc_info:
+            runtime.execute_group(_Ids.FAILING)
+
+        errors: tuple[BaseException, ...] = getattr(exc_info.value, "exceptions", ())
+        assert [str(error) for error in errors] == ["failed"]
+        assert self._app.executed == 0
+
+    def test_large_capacity(self) -> None:
+        capacity = apps.MachineCapacity(cpus=64, memory_mb=None)
+        apps.ResourceRuntime(self._app, capacity).execute_group(_Ids.MEETING)
+
+    def test_executables_see_the_active_scope(self) -> None:
+        capacity = apps.MachineCapacity(cpus=1, memory_mb=None)
+        with apps.ServiceScope():
+            apps.ResourceRuntime(self._app, capacity).execute(_Ids.SCOPED_USER)
+            scoped = self._app.get(_Ids.SCOPED)
+
+        assert self._app.scoped == [scoped]
+
+    @pytest.mark.parametrize(("cpus", "memory_mb"), [(0, 0), (-1, 0), (1, -1)])
+    def test_invalid_hints(self, cpus: float, memory_mb: int) -> None:
+        with pytest.raises(ValueError):
+            apps.resources(cpus=cpus, memory_mb=memory_mb)
+
+    def test_hints_of_entry_point_plugins(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        _install(tmp_path)
+        monkeypatch.setattr(sys, "path", [str(tmp_path), *sys.path])
+        monkeypatch.setenv("RATS_ENTRY_POINTS_CACHE_DIR", str(tmp_path / "cache"))
+        app = apps.PythonEntryPointContainer(apps.EMPTY_CONTAINER, "example.plugins")
+        capacity = apps.MachineCapacity(cpus=2, memory_mb=None)
+
+        apps.ResourceRuntime(app, capacity).execute_group(
+            apps.ServiceId[apps.Executable]("resource-plugin.jobs")
+        )
+        plugin = sys.modules.pop("resource_plugin")
+
+        assert plugin.MAX_RUNNING == [1]
+
+
+class TestDetectCapacity:
+    def test_cgroup_v2(self, tmp_path: Path) -> None:
+        (tmp_path / "cpu.max").write_text("25000 100000\n")
+        (tmp_path / "memory.max").write_text(f"{512 * 2**20}\n")
+
+        assert apps.detect_capacity(str(tmp_path)) == apps.MachineCapacity(0.25, 512)
+
+    def test_cgroup_v1(self, tmp_path: Path) -> None:
+        (tmp_path / "cpu").mkdir()
+        (tmp_path / "cpu" / "cpu.cfs_quota_us").write_text("50000\n")
+        (tmp_path / "cpu" / "cpu.cfs_period_us").write_text("100000\n")
+        (tmp_path / "memory").mkdir()
+        (tmp_path / "memory" / "memory.limit_in_bytes").write_text(f"{256 * 2**20}\n")
+
+        assert apps.detect_capacity(str(tmp_path)) == apps.MachineCapacity(0.5, 256)
+
+    def test_unlimited_cgroups(self, tmp_path: Path) -> None:
+        (tmp_path / "cpu.max").write_text("max 100000\n")
+        (tmp_path / "memory.max").write_text("max\n")
+
+        capacity = apps.detect_capacity(str(tmp_path))
+        assert capacity.cpus >= 1
+        assert capacity.memory_mb is None or capacity.memory_mb > 0
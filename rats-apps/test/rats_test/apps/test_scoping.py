@@ -36,3 +36,19 @@ class TestScoping:
 
     def test_non_scoped_functions(self) -> None:
         assert ExampleServices.custom("foo") == "prefix[foo]"
+
+    def test_scoped_ids_are_interned(self) -> None:
+        assert ExampleServices.bar("bar") is ExampleServices.bar("bar")
+        assert ExampleServices.bar("bar") is not ExampleServices.bar("baz")
+        assert apps.intern_service_id(apps.ServiceId[Any](ExampleServices.FOO.name)) is (
+            ExampleServices.FOO
+        )
+
+    def test_service_id_origins(self) -> None:
+        assert apps.get_service_id_origin(ExampleServices.FOO) == apps.ServiceIdOrigin(
+            __name__, "ExampleServices", "FOO"
+        )
+        assert apps.get_service_id_origin(ExampleServices.bar("qux").name) == (
+            apps.ServiceIdOrigin(__name__, "ExampleServices", "bar")
+        )
+        assert apps.get_service_id_origin(apps.ServiceId[Any]("foo")) is None
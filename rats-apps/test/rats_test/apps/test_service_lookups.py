@@ -0,0 +1,213 @@
+import itertools
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+from rats import apps
+
+
+@apps.autoscope
+class _Ids:
+    CLIENT = apps.ServiceId[str]("client")
+    DUPLICATE = apps.ServiceId[str]("duplicate")
+    FALLBACK = apps.ServiceId[str]("fallback")
+    CLIENTS = apps.ServiceId[str]("clients")
+    EMPTY = apps.ServiceId[str]("empty")
+    STATIC = apps.ServiceId[str]("static")
+
+
+class _CountingContainer(apps.Container):
+    calls: list[str]
+
+    def __init__(self) -> None:
+        self.calls = []
+
+    @apps.service(_Ids.CLIENT)
+    def _client(self) -> str:
+        self.calls.append("client")
+        return "client"
+
+    @apps.service(_Ids.DUPLICATE)
+    def _duplicate_1(self) -> str:
+        self.calls.append("duplicate-1")
+        return "duplicate-1"
+
+    @apps.service(_Ids.DUPLICATE)
+    def _duplicate_2(self) -> str:
+        self.calls.append("duplicate-2")
+        return "duplicate-2"
+
+    @apps.fallback_service(_Ids.FALLBACK)
+    def _fallback(self) -> str:
+        self.calls.append("fallback")
+        return "fallback"
+
+    @apps.group(_Ids.CLIENTS)
+    def _clients(self) -> Iterator[str]:
+        self.calls.append("clients")
+        yield "client-1"
+
+    @apps.group(_Ids.EMPTY)
+    def _empty(self) -> Iterator[str]:
+        self.calls.append("empty")
+        yield from ()
+
+    @apps.container()
+    def _static(self) -> apps.Container:
+        def _provider() -> str:
+            self.calls.append("static")
+            return "static"
+
+        return apps.StaticContainer(apps.static_service(_Ids.STATIC, _provider))
+
+
+class _TraversalCountingContainer(apps.Container):
+    lookups: list[tuple[str, apps.ServiceId[Any]]]
+
+    def __init__(self) -> None:
+        self.lookups = []
+
+    def get_namespaced_providers(
+        self,
+        namespace: str,
+        group_id: apps.ServiceId[apps.T_ServiceType],
+    ) -> Iterator[apps.Provider[apps.T_ServiceType]]:
+        self.lookups.append((namespace, group_id))
+        return iter(())
+
+
+class _ProbingApp(apps.Container):
+    leaf: _TraversalCountingContainer
+
+    def __init__(self) -> None:
+        self.leaf = _TraversalCountingContainer()
+
+    @apps.container()
+    def _plugins(self) -> apps.Container:
+        return apps.CompositeContainer(_CountingContainer(), self.leaf)
+
+
+class _CountingValuesContainer(apps.Container):
+    _counter: Iterator[int]
+
+    def __init__(self) -> None:
+        self._counter = itertools.count()
+
+    def get_namespaced_group(
+        self,
+        namespace: str,
+        group_id: apps.ServiceId[apps.T_ServiceType],
+    ) -> Iterator[apps.T_ServiceType]:
+        if namespace == apps.ProviderNamespaces.SERVICES and group_id == _Ids.CLIENT:
+            yield next(self._counter)  # type: ignore[reportReturnType]
+
+
+class _ExtendingContainer(apps.Container):
+    @apps.service(_Ids.CLIENT)
+    def _client(self) -> str:
+        return "client"
+
+    def get_namespaced_group(
+        self,
+        namespace: str,
+        group_id: apps.ServiceId[apps.T_ServiceType],
+    ) -> Iterator[apps.T_ServiceType]:
+        yield from super().get_namespaced_group(namespace, group_id)
+        if namespace == apps.ProviderNamespaces.SERVICES and group_id == _Ids.STATIC:
+            yield "extended"  # type: ignore[reportReturnType]
+
+
+class _ValuesApp(apps.Container):
+    @apps.container()
+    def _values(self) -> apps.Container:
+        return _CountingValuesContainer()
+
+
+class TestServiceLookups:
+    _container: _CountingContainer
+
+    def setup_method(self) -> None:
+        self._container = _CountingContainer()
+
+    def test_has_does_not_create_services(self) -> None:
+        assert self._container.has(_Ids.CLIENT)
+        assert self._container.has(_Ids.FALLBACK)
+        assert self._container.has(_Ids.STATIC)
+        assert not self._container.has(apps.ServiceId[str]("missing"))
+        assert self._container.calls == []
+
+    def test_has_group_does_not_create_services(self) -> None:
+        assert self._container.has_group(_Ids.CLIENTS)
+        assert not self._container.has_group(_Ids.CLIENT)
+        assert self._container.has_namespace(apps.ProviderNamespaces.SERVICES, _Ids.CLIENT)
+        assert self._container.calls == []
+
+    def test_has_group_counts_providers_without_members(self) -> None:
+        assert self._container.has_group(_Ids.EMPTY)
+        assert self._container.calls == []
+
+        assert list(self._container.get_group(_Ids.EMPTY)) == []
+        assert self._container.calls == ["empty"]
+
+    def test_duplicates_are_detected_without_creating_services(self) -> None:
+        with pytest.raises(apps.DuplicateServiceError):
+            self._container.get(_Ids.DUPLICATE)
+
+        with pytest.raises(apps.DuplicateServiceError):
+            self._container.has(_Ids.DUPLICATE)
+
+        assert self._container.calls == []
+
+    def test_providers_share_the_service_cache(self) -> None:
+        providers = list(
+            self._container.get_namespaced_providers(apps.ProviderNamespaces.SERVICES, _Ids.CLIENT)
+        )
+        assert len(providers) == 1
+        assert self._container.calls == []
+
+        assert providers[0]() == self._container.get(_Ids.CLIENT)
+        assert self._container.calls == ["client"]
+
+    def test_only_returned_services_are_created(self) -> None:
+        assert self._container.get(_Ids.STATIC) == "static"
+        assert list(self._container.get_group(_Ids.CLIENTS)) == ["client-1"]
+        assert self._container.calls == ["static", "clients"]
+
+    def test_lookups_are_remembered(self) -> None:
+        app = _ProbingApp()
+        missing = apps.ServiceId[str]("missing")
+        for _ in range(10):
+            assert not app.has(missing)
+            assert app.has(_Ids.FALLBACK)
+            assert not app.has_group(missing)
+            assert list(app.get_group(_Ids.CLIENTS)) == ["client-1"]
+            assert app.get(_Ids.FALLBACK) == "fallback"
+
+        with pytest.raises(apps.ServiceNotFoundError):
+            app.get(missing)
+
+        assert sorted(app.leaf.lookups) == sorted([
+            (apps.ProviderNamespaces.SERVICES, missing),
+            (apps.ProviderNamespaces.FALLBACK_SERVICES, missing),
+            (apps.ProviderNamespaces.ASYNC_SERVICES, missing),
+            (apps.ProviderNamespaces.SERVICES, _Ids.FALLBACK),
+            (apps.ProviderNamespaces.FALLBACK_SERVICES, _Ids.FALLBACK),
+            (apps.ProviderNamespaces.GROUPS, missing),
+            (apps.ProviderNamespaces.FALLBACK_GROUPS, missing),
+            (apps.ProviderNamespaces.GROUPS, _Ids.CLIENTS),
+        ])
+
+    def test_values_of_custom_groups_are_not_remembered(self) -> None:
+        app = _ValuesApp()
+        assert [app.get(_Ids.CLIENT) for _ in range(3)] == [0, 1, 2]
+
+        compiled = apps.compile_container(_ValuesApp())
+        assert [compiled.get(_Ids.CLIENT) for _ in range(3)] == [0, 1, 2]
+
+    def test_custom_groups_extending_the_default(self) -> None:
+        container = _ExtendingContainer()
+
+        assert container.get(_Ids.CLIENT) == "client"
+        assert container.get(_Ids.STATIC) == "extended"
+        assert not container.has(_Ids.FALLBACK)
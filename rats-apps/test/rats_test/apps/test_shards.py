@@ -0,0 +1,106 @@
+from collections.abc import Iterator
+from functools import partial
+
+import pytest
+
+from rats import apps
+
+
+class _Jobs(apps.Container):
+    JOBS = apps.ServiceId[apps.Executable]("jobs")
+    SMALL_GROUPS = tuple(apps.ServiceId[apps.Executable](f"small-{i}") for i in range(4))
+
+    ran: list[int]
+
+    def __init__(self) -> None:
+        self.ran = []
+
+    @apps.group(JOBS)
+    def _jobs(self) -> Iterator[apps.Executable]:
+        for i in range(10):
+            yield apps.App(partial(self.ran.append, i))
+
+    @apps.group(SMALL_GROUPS[0])
+    def _small_0(self) -> Iterator[apps.Executable]:
+        yield apps.App(partial(self.ran.append, 0))
+
+    @apps.group(SMALL_GROUPS[1])
+    def _small_1(self) -> Iterator[apps.Executable]:
+        yield apps.App(partial(self.ran.append, 1))
+
+    @apps.group(SMALL_GROUPS[2])
+    def _small_2(self) -> Iterator[apps.Executable]:
+        yield apps.App(partial(self.ran.append, 2))
+
+    @apps.group(SMALL_GROUPS[3])
+    def _small_3(self) -> Iterator[apps.Executable]:
+        yield apps.App(partial(self.ran.append, 3))
+
+
+class TestShard:
+    def test_parse(self) -> None:
+        assert apps.Shard.parse("1/4") == apps.Shard(1, 4)
+        assert str(apps.Shard.parse("0/1")) == "0/1"
+        assert apps.Shard.parse("0/1") == apps.FULL_SHARD
+
+    @pytest.mark.parametrize("spec", ["", "1", "4/4", "-1/4", "1/0", "a/4", "1/b", "1/2/3"])
+    def test_parse_invalid(self, spec: str) -> None:
+        with pytest.raises(ValueError):
+            apps.Shard.parse(spec)
+
+    def test_from_env(self) -> None:
+        assert apps.Shard.from_env({"RATS_SHARD": "2/3"}) == apps.Shard(2, 3)
+        assert apps.Shard.from_env({"RANK": "1", "WORLD_SIZE": "8"}) == apps.Shard(1, 8)
+        assert apps.Shard.from_env({"RATS_SHARD": "0/2", "RANK": "1", "WORLD_SIZE": "8"}) == (
+            apps.Shard(0, 2)
+        )
+        assert apps.Shard.from_env({"RANK": "1"}) is None
+        assert apps.Shard.from_env({}) is None
+
+    def test_select(self) -> None:
+        shard = apps.Shard(1, 4)
+
+        assert list(shard.select(range(10))) == [1, 5, 9]
+        assert [shard.contains(i) for i in range(4)] == [False, True, False, False]
+        assert list(apps.FULL_SHARD.select(range(3))) == [0, 1, 2]
+
+    def test_shards_cover_the_group(self) -> None:
+        selected = [list(apps.Shard(i, 3).select(range(10))) for i in range(3)]
+
+        assert sorted(item for items in selected for item in items) == list(range(10))
+
+
+class TestShardedRuntime:
+    def test_runs_only_the_shard(self) -> None:
+        app = _Jobs()
+        apps.StandardRuntime(app, apps.Shard(0, 3)).execute_group(_Jobs.JOBS)
+
+        assert app.ran == [0, 3, 6, 9]
+
+    def test_runs_everything_by_default(self) -> None:
+        app = _Jobs()
+        apps.StandardRuntime(app).execute_group(_Jobs.JOBS)
+
+        assert app.ran == list(range(10))
+
+    def test_groups_are_sharded_together(self) -> None:
+        ran: list[list[int]] = []
+        for i in range(4):
+            app = _Jobs()
+            apps.StandardRuntime(app, apps.Shard(i, 4)).execute_group(*_Jobs.SMALL_GROUPS)
+            ran.append(app.ran)
+
+        assert ran == [[0], [1], [2], [3]]
+
+    def test_executables_are_not_sharded(self) -> None:
+        app = _Jobs()
+        exe_id = apps.ServiceId[apps.Executable]("job")
+        container = apps.CompositeContainer(
+            app,
+            apps.StaticContainer(
+                apps.static_service(exe_id, lambda: apps.App(partial(app.ran.append, -1)))
+            ),
+        )
+        apps.StandardRuntime(container, apps.Shard(1, 2)).execute(exe_id)
+
+        assert app.ran == [-1]
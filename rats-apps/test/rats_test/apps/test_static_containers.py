@@ -0,0 +1,116 @@
+import asyncio
+import threading
+from collections.abc import AsyncIterator, Iterator
+
+from rats import apps
+
+
+class _Counter:
+    calls: int
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def service(self) -> object:
+        self.calls += 1
+        return object()
+
+    def group(self) -> Iterator[int]:
+        self.calls += 1
+        yield from range(3)
+
+    async def aservice(self) -> object:
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        return object()
+
+    async def agroup(self) -> AsyncIterator[int]:
+        self.calls += 1
+        for i in range(3):
+            yield i
+
+
+class TestStaticContainer:
+    def test_providers_are_indexed(self) -> None:
+        ids = [apps.ServiceId[int](f"service-{i}") for i in range(2000)]
+        container = apps.StaticContainer(
+            *[apps.static_service(service_id, lambda i=i: i) for i, service_id in enumerate(ids)],
+            apps.static_group(ids[0], lambda: iter([10, 11])),
+            apps.static_group(ids[0], lambda: iter([12])),
+        )
+
+        assert [container.get(service_id) for service_id in ids] == list(range(2000))
+        assert list(container.get_group(ids[0])) == [10, 11, 12]
+        assert not container.has(apps.ServiceId[int]("missing"))
+
+    def test_providers_are_called_on_every_lookup(self) -> None:
+        counter = _Counter()
+        service_id = apps.ServiceId[object]("service")
+        container = apps.StaticContainer(apps.static_service(service_id, counter.service))
+
+        assert container.get(service_id) is not container.get(service_id)
+        assert counter.calls == 2
+
+    def test_memoized_services(self) -> None:
+        counter = _Counter()
+        service_id = apps.ServiceId[object]("service")
+        group_id = apps.ServiceId[int]("group")
+        container = apps.StaticContainer(
+            apps.static_service(service_id, counter.service),
+            apps.static_group(group_id, counter.group),
+            memoize=True,
+        )
+
+        assert container.get(service_id) is container.get(service_id)
+        assert list(container.get_group(group_id)) == [0, 1, 2]
+        assert list(container.get_group(group_id)) == [0, 1, 2]
+        assert counter.calls == 2
+
+    def test_memoized_async_services(self) -> None:
+        counter = _Counter()
+        service_id = apps.ServiceId[object]("service")
+        group_id = apps.ServiceId[int]("group")
+        container = apps.StaticContainer(
+            apps.StaticProvider(
+                apps.ProviderNamespaces.ASYNC_SERVICES, service_id, counter.aservice
+            ),
+            apps.StaticProvider(apps.ProviderNamespaces.ASYNC_GROUPS, group_id, counter.agroup),
+            memoize=True,
+        )
+
+        async def _run() -> None:
+            first, second = await asyncio.gather(
+                container.aget(service_id),
+                container.aget(service_id),
+            )
+            assert first is second
+            assert [x async for x in container.aget_group(group_id)] == [0, 1, 2]
+            assert [x async for x in container.aget_group(group_id)] == [0, 1, 2]
+
+        asyncio.run(_run())
+        assert counter.calls == 2
+
+    def test_memoized_async_services_from_several_event_loops(self) -> None:
+        counter = _Counter()
+        service_id = apps.ServiceId[object]("service")
+        container = apps.StaticContainer(
+            apps.StaticProvider(
+                apps.ProviderNamespaces.ASYNC_SERVICES, service_id, counter.aservice
+            ),
+            memoize=True,
+        )
+        barrier = threading.Barrier(4)
+        results: list[object] = []
+
+        def _run() -> None:
+            barrier.wait(timeout=5)
+            results.append(asyncio.run(container.aget(service_id)))
+
+        threads = [threading.Thread(target=_run) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(results) == 4
+        assert all(result is results[0] for result in results)
@@ -0,0 +1,96 @@
+import threading
+from collections.abc import Iterator
+
+import pytest
+
+from rats import apps
+
+
+@apps.autoscope
+class _Ids:
+    WAITING = apps.ServiceId[apps.Executable]("waiting")
+    FAILING = apps.ServiceId[apps.Executable]("failing")
+    FIRST = apps.ServiceId[apps.Executable]("first")
+    SECOND = apps.ServiceId[apps.Executable]("second")
+    SCOPED = apps.ServiceId[object]("scoped")
+    SCOPED_USERS = apps.ServiceId[apps.Executable]("scoped-users")
+
+
+class _ExampleContainer(apps.Container):
+    barrier: threading.Barrier
+    executed: list[str]
+    scoped: list[object]
+
+    def __init__(self) -> None:
+        self.barrier = threading.Barrier(4, timeout=5)
+        self.executed = []
+        self.scoped = []
+
+    @apps.group(_Ids.WAITING)
+    def _waiting(self) -> Iterator[apps.Executable]:
+        for _ in range(4):
+            # only completes when the four executables run at the same time
+            yield apps.App(self._wait)
+
+    @apps.group(_Ids.FAILING)
+    def _failing(self) -> Iterator[apps.Executable]:
+        yield apps.App(self._fail)
+        for i in range(3):
+            yield apps.App(lambda i=i: self.executed.append(f"after-{i}"))
+
+    @apps.service(_Ids.FIRST)
+    def _first(self) -> apps.Executable:
+        return apps.App(self._wait)
+
+    @apps.service(_Ids.SECOND)
+    def _second(self) -> apps.Executable:
+        return apps.App(self._wait)
+
+    @apps.service(_Ids.SCOPED, lifetime=apps.ServiceLifetimes.SCOPED)
+    def _scoped_service(self) -> object:
+        return object()
+
+    @apps.group(_Ids.SCOPED_USERS)
+    def _scoped_users(self) -> Iterator[apps.Executable]:
+        for _ in range(2):
+            yield apps.App(self._use_scoped)
+
+    def _use_scoped(self) -> None:
+        self.scoped.append(self.get(_Ids.SCOPED))
+
+    def _wait(self) -> None:
+        self.barrier.wait()
+
+    def _fail(self) -> None:
+        raise ValueError("failed")
+
+
+class TestThreadPoolRuntime:
+    _app: _ExampleContainer
+
+    def setup_method(self) -> None:
+        self._app = _ExampleContainer()
+
+    def test_groups_are_executed_concurrently(self) -> None:
+        apps.ThreadPoolRuntime(self._app, max_workers=4).execute_group(_Ids.WAITING)
+
+    def test_services_are_executed_concurrently(self) -> None:
+        self._app.barrier = threading.Barrier(2, timeout=5)
+        apps.ThreadPoolRuntime(self._app, max_workers=2).execute(_Ids.FIRST, _Ids.SECOND)
+
+    def test_failures_cancel_pending_executables(self) -> None:
+        runtime = apps.ThreadPoolRuntime(self._app, max_workers=1)
+
+        with pytest.raises(Exception) as exc_info:
+            runtime.execute_group(_Ids.FAILING)
+
+        errors: tuple[BaseException, ...] = getattr(exc_info.value, "exceptions", ())
+        assert [(type(error), str(error)) for error in errors] == [(ValueError, "failed")]
+        assert self._app.executed == []
+
+    def test_executables_see_the_active_scope(self) -> None:
+        with apps.ServiceScope():
+            apps.ThreadPoolRuntime(self._app, max_workers=2).execute_group(_Ids.SCOPED_USERS)
+            scoped = self._app.get(_Ids.SCOPED)
+
+        assert self._app.scoped == [scoped, scoped]
@@ -0,0 +1,98 @@
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+from rats import apps
+
+
+@apps.autoscope
+class _Ids:
+    SLOW = apps.ServiceId[object]("slow")
+    DEPENDENT = apps.ServiceId[object]("dependent")
+    SLOW_GROUP = apps.ServiceId[object]("slow-group")
+
+
+class _SlowContainer(apps.Container):
+    _lock: threading.Lock
+    constructed: dict[str, int]
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.constructed = {}
+
+    def _record(self, name: str) -> None:
+        with self._lock:
+            self.constructed[name] = self.constructed.get(name, 0) + 1
+        # give other threads the chance to race us
+        time.sleep(0.01)
+
+    @apps.service(_Ids.SLOW)
+    def _slow(self) -> object:
+        self._record("slow")
+        return object()
+
+    @apps.service(_Ids.DEPENDENT)
+    def _dependent(self) -> object:
+        self._record("dependent")
+        return (self.get(_Ids.SLOW), object())
+
+    @apps.group(_Ids.SLOW_GROUP)
+    def _slow_group(self) -> Iterator[object]:
+        self._record("slow-group")
+        yield object()
+
+
+class _App(apps.Container):
+    @apps.container()
+    def _plugins(self) -> apps.Container:
+        return apps.CompositeContainer(_SlowContainer())
+
+
+class TestThreadSafety:
+    def test_services_are_constructed_once(self) -> None:
+        threads = 16
+        container = _SlowContainer()
+        barrier = threading.Barrier(threads)
+
+        def _get(service_id: apps.ServiceId[object]) -> object:
+            barrier.wait()
+            return container.get(service_id)
+
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            ids = [_Ids.SLOW, _Ids.DEPENDENT] * (threads // 2)
+            results = list(executor.map(_get, ids))
+
+        assert container.constructed == {"slow": 1, "dependent": 1}
+        assert all(r is results[0] for r in results[::2])
+        assert all(r is results[1] for r in results[1::2])
+
+    def test_groups_are_constructed_once(self) -> None:
+        threads = 16
+        container = _SlowContainer()
+        barrier = threading.Barrier(threads)
+
+        def _get_group(_: int) -> list[object]:
+            barrier.wait()
+            return list(container.get_group(_Ids.SLOW_GROUP))
+
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            results = list(executor.map(_get_group, range(threads)))
+
+        assert container.constructed == {"slow-group": 1}
+        assert all(r == results[0] for r in results)
+
+    def test_cold_container_trees(self) -> None:
+        for _ in range(20):
+            threads = 8
+            app = _App()
+            barrier = threading.Barrier(threads)
+
+            def _get(_: int, app: _App = app, barrier: threading.Barrier = barrier) -> object:
+                barrier.wait()
+                return app.get(_Ids.DEPENDENT)
+
+            with ThreadPoolExecutor(max_workers=threads) as executor:
+                results = list(executor.map(_get, range(threads)))
+
+            assert all(r is results[0] for r in results)
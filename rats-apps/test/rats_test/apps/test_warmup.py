@@ -0,0 +1,86 @@
+import threading
+from collections.abc import Iterator
+
+from rats import apps
+
+
+@apps.autoscope
+class _Ids:
+    CREDENTIALS = apps.ServiceId[object]("credentials")
+    CLIENT = apps.ServiceId[object]("client")
+    CONFIGS = apps.ServiceId[str]("configs")
+    SCOPED = apps.ServiceId[object]("scoped")
+
+
+class _IoBoundContainer(apps.Container):
+    _barrier: threading.Barrier
+    constructed: list[str]
+
+    def __init__(self, parties: int) -> None:
+        self._barrier = threading.Barrier(parties, timeout=5)
+        self.constructed = []
+
+    @apps.service(_Ids.CREDENTIALS)
+    def _credentials(self) -> object:
+        # only passes when all the providers are being built at the same time
+        self._barrier.wait()
+        self.constructed.append("credentials")
+        return object()
+
+    @apps.service(_Ids.CLIENT)
+    def _client(self) -> object:
+        self._barrier.wait()
+        self.constructed.append("client")
+        return object()
+
+    @apps.group(_Ids.CONFIGS)
+    def _configs(self) -> Iterator[str]:
+        self._barrier.wait()
+        self.constructed.append("configs")
+        yield "config-1"
+        yield "config-2"
+
+    @apps.service(_Ids.SCOPED, lifetime=apps.ServiceLifetimes.SCOPED)
+    def _scoped(self) -> object:
+        self.constructed.append("scoped")
+        return object()
+
+
+class TestWarmup:
+    def test_services_are_built_concurrently(self) -> None:
+        container = _IoBoundContainer(parties=3)
+        timings = apps.warmup(
+            container,
+            _Ids.CREDENTIALS,
+            _Ids.CLIENT,
+            group_ids=[_Ids.CONFIGS],
+            max_workers=3,
+        )
+
+        assert [(t.service_id, t.namespace) for t in timings] == [
+            (_Ids.CREDENTIALS, apps.ProviderNamespaces.SERVICES),
+            (_Ids.CLIENT, apps.ProviderNamespaces.SERVICES),
+            (_Ids.CONFIGS, apps.ProviderNamespaces.GROUPS),
+        ]
+        assert all(t.seconds >= 0 for t in timings)
+        assert sorted(container.constructed) == ["client", "configs", "credentials"]
+
+    def test_caches_are_filled(self) -> None:
+        container = _IoBoundContainer(parties=1)
+        apps.warmup(container, _Ids.CLIENT, group_ids=[_Ids.CONFIGS])
+
+        client = container.get(_Ids.CLIENT)
+        configs = list(container.get_group(_Ids.CONFIGS))
+
+        assert client is container.get(_Ids.CLIENT)
+        assert configs == ["config-1", "config-2"]
+        assert sorted(container.constructed) == ["client", "configs"]
+
+    def test_scoped_services_are_warmed_in_the_active_scope(self) -> None:
+        container = _IoBoundContainer(parties=1)
+        with apps.ServiceScope():
+            apps.warmup(container, _Ids.SCOPED)
+            container.get(_Ids.SCOPED)
+
+        # the instance built by the warmup is the one used by the scope
+        assert container.constructed == ["scoped"]
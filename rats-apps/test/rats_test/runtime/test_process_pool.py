@@ -0,0 +1,94 @@
+import os
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from rats import app_context, apps, runtime
+
+
+@dataclass(frozen=True)
+class _Output:
+    directory: str
+
+
+@apps.autoscope
+class _Ids:
+    OUTPUT = apps.ServiceId[_Output]("output")
+    DIRECTORY = apps.ServiceId[Path]("directory")
+    SINGLE = apps.ServiceId[apps.Executable]("single")
+    FAILING = apps.ServiceId[apps.Executable]("failing")
+    SHARDS = apps.ServiceId[apps.Executable]("shards")
+
+
+class _Application(apps.AppContainer, apps.PluginMixin):
+    @apps.service(_Ids.DIRECTORY)
+    def _directory(self) -> Path:
+        context = self._app.get(runtime.AppServices.CONTEXT)
+        directory = Path(context.decoded_values(_Output, _Ids.OUTPUT)[0].directory)
+        # records every application created, by process
+        (directory / f"created-{os.getpid()}-{id(self)}").touch()
+        return directory
+
+    @apps.service(_Ids.SINGLE)
+    def _single(self) -> apps.Executable:
+        return apps.App(lambda: self._write("single"))
+
+    @apps.service(_Ids.FAILING)
+    def _failing(self) -> apps.Executable:
+        return apps.App(self._fail)
+
+    @apps.group(_Ids.SHARDS)
+    def _shards(self) -> Iterator[apps.Executable]:
+        for i in range(8):
+            yield apps.App(lambda i=i: self._write(f"shard-{i}"))
+
+    def _write(self, name: str) -> None:
+        (self._app.get(_Ids.DIRECTORY) / f"{name}.out").write_text(str(os.getpid()))
+
+    def _fail(self) -> None:
+        raise ValueError("failed")
+
+
+class TestProcessPoolRuntime:
+    _directory: Path
+    _context: app_context.Collection[Any]
+
+    @pytest.fixture(autouse=True)
+    def _output(self, tmp_path: Path) -> None:
+        self._directory = tmp_path
+        self._context = app_context.Collection[_Output].make(
+            app_context.Context[_Output].make(_Ids.OUTPUT, _Output(str(tmp_path))),
+        )
+
+    def test_services_and_groups_are_executed_in_workers(self) -> None:
+        with runtime.ProcessPoolRuntime(_Application, self._context, max_workers=2) as pool:
+            pool.execute(_Ids.SINGLE)
+            pool.execute_group(_Ids.SHARDS)
+
+        outputs = sorted(path.stem for path in self._directory.glob("*.out"))
+        assert outputs == ["shard-0", *[f"shard-{i}" for i in range(1, 8)], "single"]
+        assert str(os.getpid()) not in {p.read_text() for p in self._directory.glob("*.out")}
+        # workers stay warm, creating their application once
+        assert len(list(self._directory.glob("created-*"))) <= 2
+
+    def test_failures_are_raised(self) -> None:
+        with (
+            runtime.ProcessPoolRuntime(_Application, self._context, max_workers=1) as pool,
+            pytest.raises(apps.ExceptionGroupCompat) as exc_info,
+        ):
+            pool.execute(_Ids.FAILING, _Ids.SINGLE)
+
+        errors = exc_info.value.exceptions
+        assert [(type(error), str(error)) for error in errors] == [(ValueError, "failed")]
+
+    def test_every_failure_is_raised(self) -> None:
+        with (
+            runtime.ProcessPoolRuntime(_Application, self._context, max_workers=2) as pool,
+            pytest.raises(apps.ExceptionGroupCompat) as exc_info,
+        ):
+            pool.execute(_Ids.FAILING, _Ids.FAILING)
+
+        assert [str(error) for error in exc_info.value.exceptions] == ["failed", "failed"]